@@ -109,35 +109,48 @@ class LiquidsoapMixer:
 
         Opens a fresh connection for each command (Liquidsoap closes idle connections).
         """
+        return (await self._send_commands([command]))[0]
+
+    async def _send_commands(self, commands: list[str]) -> list[str]:
+        """
+        Send several commands over one fresh connection; return their responses.
+
+        The commands are written in one go and the END-terminated responses
+        read back in order, so a batch costs one connect/round trip instead
+        of one per command.
+        """
         reader = None
         writer = None
         try:
-            # Open fresh connection for this command
+            # Open fresh connection for this batch
             reader, writer = await asyncio.wait_for(
                 asyncio.open_connection(self.host, self.port),
                 timeout=5.0,
             )
 
-            # Send command
-            writer.write(f"{command}\n".encode())
+            # Send commands
+            writer.write("".join(f"{command}\n" for command in commands).encode())
             await writer.drain()
 
-            # Read response until "END"
-            response_lines = []
-            while True:
-                line = await asyncio.wait_for(reader.readline(), timeout=5.0)
-                if not line:
-                    break
-                decoded = line.decode().strip()
-                if decoded == "END":
-                    break
-                response_lines.append(decoded)
+            # Read each response until "END"
+            responses = []
+            for _ in commands:
+                response_lines = []
+                while True:
+                    line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+                    if not line:
+                        break
+                    decoded = line.decode().strip()
+                    if decoded == "END":
+                        break
+                    response_lines.append(decoded)
+                responses.append("\n".join(response_lines))
 
             # Send quit for clean disconnect (prevents RST race condition)
             writer.write(b"quit\n")
             await writer.drain()
 
-            return "\n".join(response_lines)
+            return responses
 
         except (asyncio.TimeoutError, ConnectionRefusedError, OSError) as e:
             logger.error(f"Liquidsoap command failed: {e}")
@@ -442,20 +455,35 @@ class LiquidsoapMixer:
             "duck_in_curve": 0.7,
             "duck_out_curve": 0.3,
         }
+        variables = list(result)
         async with self._lock:
             try:
-                for var in ["music_vol", "tts_vol", "earcon_vol", "duck_amount", "crossfade_duration",
-                            "duck_in_duration", "duck_out_duration", "duck_in_curve", "duck_out_curve"]:
-                    response = await self._send_command(f"var.get {var}")
-                    # Response format: "0.7" or similar
-                    try:
-                        result[var] = float(response.strip())
-                    except ValueError:
-                        logger.warning(f"Could not parse {var} value: {response}")
+                responses = await self._send_commands([f"var.get {var}" for var in variables])
             except RuntimeError as e:
                 logger.error(f"Failed to get volumes: {e}")
+                return result
+        for var, response in zip(variables, responses):
+            # Response format: "0.7" or similar
+            try:
+                result[var] = float(response.strip())
+            except ValueError:
+                logger.warning(f"Could not parse {var} value: {response}")
         return result
 
+    async def get_state(self) -> dict:
+        """
+        Get volumes and toggle states for the audio controls in one call.
+
+        Returns:
+            Dict of get_volumes() values plus music_muted, tts_muted, random_mode
+        """
+        return {
+            **await self.get_volumes(),
+            "music_muted": self._music_muted,
+            "tts_muted": self._tts_muted,
+            "random_mode": self._random_mode,
+        }
+
     async def toggle_music_mute(self) -> tuple[bool, float]:
         """
         Toggle music mute state.
@@ -22,6 +22,7 @@ import asyncio
 import hashlib
 import json
 import logging
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Coroutine, Protocol, runtime_checkable
@@ -307,6 +308,9 @@ class PlaylistPlanner:
 
         # In-memory state
         self._library: list[dict] = []
+        # Lookup indexes over _library, rebuilt by _set_library()
+        self._library_by_path: dict[str, dict] = {}
+        self._library_by_basename: dict[str, dict] = {}
         self._upcoming: list[dict] = []
         self._history: list[dict] = []
 
@@ -352,6 +356,21 @@ class PlaylistPlanner:
         """All known tracks in the music library."""
         return list(self._library)
 
+    def _set_library(self, tracks: list[dict]) -> None:
+        """Replace the library and rebuild its path/basename indexes."""
+        self._library = tracks
+        self._library_by_path = {t["file_path"]: t for t in tracks}
+        # First track wins on a basename clash, as the old linear scans did
+        self._library_by_basename = {}
+        for t in tracks:
+            self._library_by_basename.setdefault(os.path.basename(t["file_path"]), t)
+
+    def find_track(self, file_path: str) -> dict | None:
+        """Library track for a full path or a bare/container filename."""
+        return self._library_by_path.get(file_path) or self._library_by_basename.get(
+            os.path.basename(file_path)
+        )
+
     # =====================================================================
     # FEEDER REGISTRATION
     # =====================================================================
@@ -453,7 +472,7 @@ class PlaylistPlanner:
         await self._db.commit()
 
         # Load library from DB cache first (fast startup)
-        self._library = await self._load_library_from_db()
+        self._set_library(await self._load_library_from_db())
 
         # Load any persisted queue
         self._upcoming = await self._load_queue_from_db()
@@ -629,11 +648,7 @@ class PlaylistPlanner:
             return
 
         # Find full path from library
-        file_path = filename
-        for track in self._library:
-            if Path(track["file_path"]).name == Path(filename).name:
-                file_path = track["file_path"]
-                break
+        file_path = self.resolve_file_path(filename)
 
         now = datetime.now(timezone.utc).isoformat()
         await self._db.execute(
@@ -652,10 +667,8 @@ class PlaylistPlanner:
 
     def resolve_file_path(self, filename: str) -> str:
         """Resolve a Liquidsoap container filename to a full library file_path."""
-        for track in self._library:
-            if Path(track["file_path"]).name == Path(filename).name:
-                return track["file_path"]
-        return filename
+        track = self._library_by_basename.get(os.path.basename(filename))
+        return track["file_path"] if track else filename
 
     # =====================================================================
     # TRACK STARS
@@ -799,14 +812,11 @@ class PlaylistPlanner:
             True if inserted successfully
         """
         # Find track in library
-        track = None
-        for t in self._library:
-            if t["file_path"] == file_path:
-                track = dict(t)
-                break
+        track = self._library_by_path.get(file_path)
         if track is None:
             logger.warning(f"insert_track: file not in library: {file_path}")
             return False
+        track = dict(track)
 
         async with self._lock:
             if position is None or position >= len(self._upcoming):
@@ -1052,7 +1062,7 @@ class PlaylistPlanner:
                 )
             await self._db.commit()
 
-        self._library = scanned
+        self._set_library(scanned)
         await self._emit("library_scanned", len(scanned))
 
     async def _load_library_from_db(self) -> list[dict]:
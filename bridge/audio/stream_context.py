@@ -27,6 +27,52 @@ logger = logging.getLogger(__name__)
 EventCallback = Callable[..., Coroutine[Any, Any, None]]
 
 
+class VersionedDict(dict):
+    """A dict that bumps .version on every mutation, for cheap change checks.
+
+    Only changes made through the mapping are counted; mutating a stored
+    value in place does not bump the version.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.version += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self.version += 1
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> "VersionedDict":
+        self.version += 1
+        return super().__ior__(other)
+
+    def clear(self) -> None:
+        self.version += 1
+        super().clear()
+
+    def pop(self, *args: Any) -> Any:
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> tuple:
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self.version += 1
+        super().update(*args, **kwargs)
+
+
 class StreamContext:
     """
     Monitors Liquidsoap stream state and emits events.
@@ -36,6 +82,25 @@ class StreamContext:
     they are cleared on each track change. Feeder context persists across tracks.
     """
 
+    # Read by every dashboard/plugin poll; slots keep attribute access off
+    # the instance dict
+    __slots__ = (
+        "mixer",
+        "poll_interval",
+        "track_ending_threshold",
+        "current_track",
+        "remaining_seconds",
+        "elapsed_seconds",
+        "enrichments",
+        "feeder_context",
+        "_planner",
+        "_event_store",
+        "_listeners",
+        "_last_filename",
+        "_track_ending_fired",
+        "_poll_task",
+    )
+
     def __init__(
         self,
         mixer: LiquidsoapMixer,
@@ -50,10 +115,10 @@ class StreamContext:
         self.current_track: dict = {}
         self.remaining_seconds: float = 0.0
         self.elapsed_seconds: float = 0.0
-        self.enrichments: dict[str, Any] = {}
+        self.enrichments: VersionedDict = VersionedDict()
 
         # Feeder context: data from ContextFeeder plugins, NOT cleared on track change
-        self.feeder_context: dict[str, Any] = {}
+        self.feeder_context: VersionedDict = VersionedDict()
 
         # Playlist planner reference (set after construction)
         self._planner: "PlaylistPlanner | None" = None
@@ -86,6 +151,13 @@ class StreamContext:
             return self._planner.upcoming
         return []
 
+    @property
+    def crossfade_duration(self) -> float:
+        """Crossfade length the planner schedules with (5s before it is set)."""
+        if self._planner:
+            return self._planner.crossfade_duration
+        return 5.0
+
     @property
     def next_track_info(self) -> dict | None:
         """Info about the next track to play, if known."""
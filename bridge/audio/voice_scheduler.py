@@ -25,6 +25,7 @@ from pathlib import Path
 from bridge.audio.mixer import LiquidsoapMixer
 from bridge.audio.stream_context import StreamContext
 from bridge.booth import booth
+from bridge.textutil import clip
 
 logger = logging.getLogger(__name__)
 
@@ -114,7 +115,7 @@ class VoiceScheduler:
         """
         trigger = segment.trigger
         source = segment.source_plugin or "unknown"
-        preview = segment.text[:40] + "..." if len(segment.text) > 40 else segment.text
+        preview = clip(segment.text, 40)
 
         # Priority interruption: urgent segments flush the voice queue
         if trigger == "asap" and segment.priority < 0:
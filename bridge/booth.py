@@ -13,12 +13,22 @@ Events:
 - 🤖 CLAUDE: Claude Code interactions
 """
 
+import asyncio
 import logging
+import logging.handlers
 import sys
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
+from bridge.textutil import clip
+
+# Records buffered for the log file before a forced write
+_FILE_BUFFER_CAPACITY = 200
+
+# Seconds between periodic flushes of the file buffer
+_FLUSH_INTERVAL = 2.0
+
 
 class Event(Enum):
     """Event types for the booth log."""
@@ -109,6 +119,7 @@ class BoothLog:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
         self._configured = False
+        self._file_buffer: logging.handlers.MemoryHandler | None = None
 
     def configure(self, log_file: Path | None = None, console: bool = True) -> None:
         """Configure booth log outputs."""
@@ -126,12 +137,33 @@ class BoothLog:
             log_file.parent.mkdir(parents=True, exist_ok=True)
             file_handler = logging.FileHandler(log_file)
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            # Buffer file writes; run_flusher() and flush() push them out
+            # in batches instead of one write per event
+            self._file_buffer = logging.handlers.MemoryHandler(
+                _FILE_BUFFER_CAPACITY,
+                flushLevel=logging.CRITICAL,
+                target=file_handler,
+            )
+            self.logger.addHandler(self._file_buffer)
 
         # Don't propagate to root logger (avoid duplicate output)
         self.logger.propagate = False
         self._configured = True
 
+    def flush(self) -> None:
+        """Write any buffered events to the log file."""
+        if self._file_buffer:
+            self._file_buffer.flush()
+
+    async def run_flusher(self, interval: float = _FLUSH_INTERVAL) -> None:
+        """Flush the file buffer every interval seconds until cancelled."""
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                self.flush()
+        finally:
+            self.flush()
+
     def _log(self, event: Event, message: str) -> None:
         """Log an event."""
         if not self._configured:
@@ -149,13 +181,13 @@ class BoothLog:
 
     def reply(self, message: str) -> None:
         """Log outgoing Telegram reply."""
-        self._log(Event.TELEGRAM_OUT, message[:80] + "..." if len(message) > 80 else message)
+        self._log(Event.TELEGRAM_OUT, clip(message, 80))
 
     # === TTS events ===
 
     def tts_request(self, text: str, speaker: str = "default") -> None:
         """Log TTS generation request."""
-        preview = text[:50] + "..." if len(text) > 50 else text
+        preview = clip(text, 50)
         self._log(Event.TTS_REQUEST, f'"{preview}" (voice: {speaker})')
 
     def tts_generated(self, path: str, duration_sec: float | None = None) -> None:
@@ -186,7 +218,7 @@ class BoothLog:
 
     def whisper_done(self, text: str) -> None:
         """Log whisper transcription result."""
-        preview = text[:60] + "..." if len(text) > 60 else text
+        preview = clip(text, 60)
         self._log(Event.WHISPER_DONE, f'"{preview}"')
 
     def whisper_error(self, error: str) -> None:
@@ -241,12 +273,12 @@ class BoothLog:
 
     def llm_request(self, message: str) -> None:
         """Log LLM chat request."""
-        preview = message[:60] + "..." if len(message) > 60 else message
+        preview = clip(message, 60)
         self._log(Event.LLM_REQUEST, f'"{preview}"')
 
     def llm_response(self, response: str) -> None:
         """Log LLM response."""
-        preview = response[:60] + "..." if len(response) > 60 else response
+        preview = clip(response, 60)
         self._log(Event.LLM_RESPONSE, f'"{preview}"')
 
     def llm_error(self, error: str) -> None:
@@ -262,12 +294,12 @@ class BoothLog:
 
     def claude_question(self, question: str) -> None:
         """Log question from Claude Code."""
-        preview = question[:60] + "..." if len(question) > 60 else question
+        preview = clip(question, 60)
         self._log(Event.CLAUDE_QUESTION, preview)
 
     def claude_answer(self, answer: str) -> None:
         """Log answer sent to Claude Code."""
-        preview = answer[:60] + "..." if len(answer) > 60 else answer
+        preview = clip(answer, 60)
         self._log(Event.CLAUDE_ANSWER, preview)
 
     def claude_notify(self, message: str) -> None:
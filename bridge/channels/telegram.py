@@ -37,6 +37,10 @@ from bridge.booth import booth
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on each service health check in /status; the checks run
+# concurrently, so this caps the whole status reply too
+_HEALTH_CHECK_TIMEOUT = 3.0
+
 
 class TelegramChannel:
     """Telegram bot for RadioDan control interface."""
@@ -44,7 +48,7 @@ class TelegramChannel:
     def __init__(
         self,
         token: str,
-        allowed_users: list[int],
+        allowed_users: frozenset[int],
         stream_url_getter: Callable[[], str],
         tts_service: "TTSService | None" = None,
         mixer: "LiquidsoapMixer | None" = None,
@@ -55,7 +59,7 @@ class TelegramChannel:
         icecast_url: str | None = None,
     ):
         self.token = token
-        self.allowed_users = set(allowed_users)
+        self.allowed_users = frozenset(allowed_users)
         self.get_stream_url = stream_url_getter
         self.tts_service = tts_service
         self.mixer = mixer
@@ -109,7 +113,7 @@ class TelegramChannel:
             async with aiohttp.ClientSession() as session:
                 async with session.get(
                     f"{self.icecast_url}/status-json.xsl",
-                    timeout=aiohttp.ClientTimeout(total=5),
+                    timeout=aiohttp.ClientTimeout(total=_HEALTH_CHECK_TIMEOUT),
                 ) as resp:
                     if resp.status != 200:
                         return "down", ""
@@ -131,8 +135,8 @@ class TelegramChannel:
         if service is None:
             return f"⚪ {label}: N/A"
         try:
-            ok = await service.health_check()
-        except Exception:
+            ok = await asyncio.wait_for(service.health_check(), timeout=_HEALTH_CHECK_TIMEOUT)
+        except Exception:  # includes timeout
             ok = False
         icon = "🟢" if ok else "🔴"
         return f"{icon} {label}"
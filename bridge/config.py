@@ -56,13 +56,19 @@ class OllamaConfig:
     endpoint: str = "http://localhost:11434/v1/chat/completions"
     model: str = "gpt-oss:20b"
     system_prompt: str = "You are {station_name}, a friendly AI assistant. Keep responses concise (1-2 sentences) since they'll be spoken aloud."
+    cache_ttl: int = 0  # Seconds to reuse identical-prompt replies (0 = off)
 
 
 @dataclass
 class TelegramConfig:
     enabled: bool = True
     token: str = ""
-    allowed_users: list[int] = field(default_factory=list)
+    allowed_users: frozenset[int] = field(default_factory=frozenset)
+
+
+@dataclass
+class DatabaseConfig:
+    readers: int = 2  # Read-only connections per store, alongside the writer
 
 
 @dataclass
@@ -83,9 +89,11 @@ class AIConfig:
 class Config:
     """Main configuration container."""
     station_name: str = "Radio Dan"
+    local_ip: str = ""  # LAN address for the stream URL; empty = detect
     audio: AudioConfig = field(default_factory=AudioConfig)
     telegram: TelegramConfig = field(default_factory=TelegramConfig)
     ai: AIConfig = field(default_factory=AIConfig)
+    database: DatabaseConfig = field(default_factory=DatabaseConfig)
     plugins: dict = field(default_factory=dict)
 
     @classmethod
@@ -110,6 +118,9 @@ class Config:
             yaml_path = config_dir / "radiodan.yaml"
             load_dotenv(config_dir.parent / ".env")
 
+        # Read the environment once, after .env has been merged into it
+        env = os.environ
+
         # Load yaml config
         yaml_config = {}
         if yaml_path.exists():
@@ -147,7 +158,7 @@ class Config:
 
         # Env vars override yaml for deployment-specific endpoints
         tts = TTSConfig(
-            endpoint=os.getenv("TTS_ENDPOINT", tts_cfg.get("endpoint", "http://localhost:42001/tts/custom-voice")),
+            endpoint=env.get("TTS_ENDPOINT", tts_cfg.get("endpoint", "http://localhost:42001/tts/custom-voice")),
             speaker=tts_cfg.get("speaker", "Aiden"),
             language=tts_cfg.get("language", "English"),
             instruct=tts_cfg.get("instruct", "Speak calmly and clearly"),
@@ -156,42 +167,56 @@ class Config:
 
         stt_cfg = audio_cfg.get("stt", {})
         stt = STTConfig(
-            endpoint=os.getenv("STT_ENDPOINT", stt_cfg.get("endpoint", "http://localhost:5000/v1/audio/transcriptions")),
+            endpoint=env.get("STT_ENDPOINT", stt_cfg.get("endpoint", "http://localhost:5000/v1/audio/transcriptions")),
         )
 
         # Ollama/AI config — interpolate station_name into system_prompt
         ollama_cfg = yaml_config.get("ollama", {})
         default_prompt = f"You are {station_name}, a friendly AI assistant. Keep responses concise (1-2 sentences) since they'll be spoken aloud."
         ollama = OllamaConfig(
-            endpoint=os.getenv("OLLAMA_ENDPOINT", ollama_cfg.get("endpoint", "http://localhost:11434/v1/chat/completions")),
-            model=os.getenv("OLLAMA_MODEL", ollama_cfg.get("model", "gpt-oss:20b")),
+            endpoint=env.get("OLLAMA_ENDPOINT", ollama_cfg.get("endpoint", "http://localhost:11434/v1/chat/completions")),
+            model=env.get("OLLAMA_MODEL", ollama_cfg.get("model", "gpt-oss:20b")),
             system_prompt=ollama_cfg.get("system_prompt", default_prompt),
+            cache_ttl=int(ollama_cfg.get("cache_ttl", 0)),
         )
 
         # Telegram config from environment
-        token = os.getenv("TELEGRAM_BOT_TOKEN", "")
-        user_id_str = os.getenv("TELEGRAM_USER_ID", "")
-        allowed_users = []
+        token = env.get("TELEGRAM_BOT_TOKEN", "")
+        user_id_str = env.get("TELEGRAM_USER_ID", "")
+        allowed_users: frozenset[int] = frozenset()
         if user_id_str:
             try:
-                allowed_users = [int(uid.strip()) for uid in user_id_str.split(",")]
+                allowed_users = frozenset(int(uid) for uid in user_id_str.split(",") if uid.strip())
             except ValueError:
                 pass
 
+        telegram_cfg = (yaml_config.get("channels") or {}).get("telegram") or {}
         telegram = TelegramConfig(
-            enabled=yaml_config.get("channels", {}).get("telegram", {}).get("enabled", True),
+            enabled=telegram_cfg.get("enabled", True),
             token=token,
             allowed_users=allowed_users,
         )
 
+        # SQLite reader pool size (ConfigStore and EventStore each open one)
+        database = DatabaseConfig()
+        try:
+            database.readers = max(0, int(env.get("RADIODAN_DB_READERS", database.readers)))
+        except ValueError:
+            pass
+
         # Plugin configs
         plugins = yaml_config.get("plugins", {})
 
+        # Fixed LAN address, for hosts where the UDP probe picks the wrong one
+        local_ip = env.get("RADIODAN_LOCAL_IP", "")
+
         return cls(
             station_name=station_name,
+            local_ip=local_ip,
             audio=AudioConfig(icecast=icecast, liquidsoap=liquidsoap, tts=tts, stt=stt, playlist=playlist),
             telegram=telegram,
             ai=AIConfig(ollama=ollama),
+            database=database,
             plugins=plugins,
         )
 
@@ -10,13 +10,16 @@ Tables:
 - plugin_instances: Named plugin instances with independent configs
 """
 
-import json
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 import aiosqlite
 
+from bridge import jsonutil
+
 logger = logging.getLogger(__name__)
 
 SCHEMA_SQL = """
@@ -39,6 +42,36 @@ CREATE TABLE IF NOT EXISTS plugin_instances (
 );
 """
 
+# Fixed SQL text lets SQLite's per-connection statement cache reuse the
+# compiled statement instead of re-parsing on every call.
+_GET_SQL = "SELECT value FROM config WHERE section = ? AND key = ?"
+_SET_SQL = "INSERT OR REPLACE INTO config (section, key, value) VALUES (?, ?, ?)"
+_GET_SECTION_SQL = "SELECT key, value FROM config WHERE section = ?"
+_GET_ALL_SQL = "SELECT section, key, value FROM config"
+_DELETE_SQL = "DELETE FROM config WHERE section = ? AND key = ?"
+_LIST_INSTANCES_SQL = "SELECT * FROM plugin_instances ORDER BY sort_order, plugin_type, id"
+_LIST_INSTANCES_BY_TYPE_SQL = "SELECT * FROM plugin_instances WHERE plugin_type = ? ORDER BY sort_order, id"
+_GET_INSTANCE_SQL = "SELECT * FROM plugin_instances WHERE id = ?"
+_CREATE_INSTANCE_SQL = (
+    "INSERT INTO plugin_instances (id, plugin_type, display_name, enabled, config, sort_order) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_DELETE_INSTANCE_SQL = "DELETE FROM plugin_instances WHERE id = ?"
+_TOGGLE_INSTANCE_SQL = (
+    "UPDATE plugin_instances SET enabled = 1 - enabled, updated_at = datetime('now') "
+    "WHERE id = ? RETURNING enabled"
+)
+
+# Marker for (section, key) pairs not yet in the read cache
+_MISSING = object()
+
+# Default number of read-only connections opened alongside the writer
+# for file databases (Config.database.readers / RADIODAN_DB_READERS)
+_READER_COUNT = 2
+
+# Columns update_instance() may change, in the order they appear in the SET clause
+_UPDATABLE_FIELDS = ("display_name", "enabled", "sort_order", "config")
+
 
 class ConfigStore:
     """
@@ -59,9 +92,28 @@ class ConfigStore:
         await store.close()
     """
 
-    def __init__(self) -> None:
+    def __init__(self, readers: int = _READER_COUNT) -> None:
+        # Writer connection; reads go through the reader pool when available
         self._db: aiosqlite.Connection | None = None
         self._db_path: Path | None = None
+        # Read-only connections to open for a file database
+        self._reader_count = readers
+        # Idle read-only connections (empty for in-memory databases)
+        self._readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._reader_conns: list[aiosqlite.Connection] = []
+        # UPDATE statements keyed by the tuple of fields being set
+        self._update_sql_cache: dict[tuple[str, ...], str] = {}
+        # Read-through caches for general config, holding the stored JSON
+        # text (None for a key known to be absent) so every read decodes a
+        # fresh object. All writes go through this object, which keeps them
+        # coherent.
+        self._cache: dict[tuple[str, str], str | None] = {}
+        self._section_cache: dict[str, dict[str, str]] = {}
+        # Write generations per key and per section. Reads run on reader
+        # connections concurrently with writes, so a read only fills the
+        # cache if no write to its key/section committed while it ran.
+        self._key_gen: dict[tuple[str, str], int] = {}
+        self._section_gen: dict[str, int] = {}
 
     async def open(self, db_path: Path) -> None:
         """Open the SQLite database and ensure schema exists."""
@@ -69,58 +121,149 @@ class ConfigStore:
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self._db = await aiosqlite.connect(str(db_path))
         self._db.row_factory = aiosqlite.Row
+        in_memory = str(db_path) == ":memory:"
+        if not in_memory:
+            # WAL lets the reader connections run alongside the writer
+            await self._db.execute("PRAGMA journal_mode=WAL")
+            await self._db.execute("PRAGMA synchronous=NORMAL")
+            await self._db.execute("PRAGMA busy_timeout=5000")
         await self._db.executescript(SCHEMA_SQL)
         await self._db.commit()
+
+        # Each :memory: connection is a separate database, so in-memory
+        # stores read through the writer instead
+        if not in_memory:
+            for _ in range(self._reader_count):
+                reader = await aiosqlite.connect(str(db_path))
+                reader.row_factory = aiosqlite.Row
+                await reader.execute("PRAGMA query_only=1")
+                self._reader_conns.append(reader)
+                self._readers.put_nowait(reader)
         logger.info(f"Config store opened: {db_path}")
 
     async def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connections."""
         if self._db:
+            for reader in self._reader_conns:
+                await reader.close()
+            self._reader_conns.clear()
+            self._readers = asyncio.Queue()
             await self._db.close()
             self._db = None
             logger.info("Config store closed")
 
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection, falling back to the writer."""
+        if not self._reader_conns:
+            yield self._db
+            return
+        reader = await self._readers.get()
+        try:
+            yield reader
+        finally:
+            self._readers.put_nowait(reader)
+
     # =========================================================================
     # GENERAL CONFIG
     # =========================================================================
 
     async def get(self, section: str, key: str, default: Any = None) -> Any:
         """Get a config value. Returns default if not found."""
-        async with self._db.execute(
-            "SELECT value FROM config WHERE section = ? AND key = ?",
-            (section, key),
-        ) as cursor:
-            row = await cursor.fetchone()
-            if row is None:
-                return default
-            return json.loads(row["value"])
+        text = self._cache.get((section, key), _MISSING)
+        if text is _MISSING:
+            gen = self._key_gen.get((section, key), 0)
+            async with self._reader() as db, db.execute(_GET_SQL, (section, key)) as cursor:
+                row = await cursor.fetchone()
+            text = None if row is None else row["value"]
+            if self._key_gen.get((section, key), 0) == gen:
+                self._cache[(section, key)] = text
+        return default if text is None else jsonutil.loads(text)
 
     async def set(self, section: str, key: str, value: Any) -> None:
         """Set a config value (JSON-encoded)."""
-        await self._db.execute(
-            "INSERT OR REPLACE INTO config (section, key, value) VALUES (?, ?, ?)",
-            (section, key, json.dumps(value)),
-        )
+        text = jsonutil.dumps(value)
+        await self._db.execute(_SET_SQL, (section, key, text))
         await self._db.commit()
+        self._written(section, key, text)
 
     async def get_section(self, section: str) -> dict:
         """Get all key-value pairs in a section."""
-        result = {}
-        async with self._db.execute(
-            "SELECT key, value FROM config WHERE section = ?",
-            (section,),
-        ) as cursor:
+        texts = self._section_cache.get(section)
+        if texts is None:
+            gen = self._section_gen.get(section, 0)
+            async with self._reader() as db, db.execute(_GET_SECTION_SQL, (section,)) as cursor:
+                texts = {row["key"]: row["value"] async for row in cursor}
+            if self._section_gen.get(section, 0) == gen:
+                self._section_cache[section] = texts
+        return {key: jsonutil.loads(text) for key, text in texts.items()}
+
+    async def set_many(self, values: list[tuple[str, str, Any]]) -> None:
+        """Set several (section, key, value) entries in one transaction."""
+        await self.apply(values, [])
+
+    async def delete_many(self, keys: list[tuple[str, str]]) -> None:
+        """Delete several (section, key) entries in one transaction."""
+        await self.apply([], keys)
+
+    async def apply(
+        self,
+        to_set: list[tuple[str, str, Any]],
+        to_delete: list[tuple[str, str]],
+    ) -> None:
+        """Set and delete entries together, committed as one transaction.
+
+        If any statement fails the transaction is rolled back, so the
+        change is applied completely or not at all.
+        """
+        if not to_set and not to_delete:
+            return
+        rows = [(section, key, jsonutil.dumps(value)) for section, key, value in to_set]
+        try:
+            if rows:
+                await self._db.executemany(_SET_SQL, rows)
+            if to_delete:
+                await self._db.executemany(_DELETE_SQL, to_delete)
+            await self._db.commit()
+        except Exception:
+            await self._db.rollback()
+            raise
+        for section, key, text in rows:
+            self._written(section, key, text)
+        for section, key in to_delete:
+            self._written(section, key, None)
+
+    async def get_all(self) -> dict[str, dict]:
+        """Get every stored value as {section: {key: value}} in one query."""
+        gens = dict(self._section_gen)
+        texts: dict[str, dict[str, str]] = {}
+        async with self._reader() as db, db.execute(_GET_ALL_SQL) as cursor:
             async for row in cursor:
-                result[row["key"]] = json.loads(row["value"])
-        return result
+                texts.setdefault(row["section"], {})[row["key"]] = row["value"]
+        for section, values in texts.items():
+            if self._section_gen.get(section, 0) == gens.get(section, 0):
+                self._section_cache[section] = values
+        return {
+            section: {key: jsonutil.loads(text) for key, text in values.items()}
+            for section, values in texts.items()
+        }
 
     async def delete(self, section: str, key: str) -> None:
         """Delete a config value."""
-        await self._db.execute(
-            "DELETE FROM config WHERE section = ? AND key = ?",
-            (section, key),
-        )
+        await self._db.execute(_DELETE_SQL, (section, key))
         await self._db.commit()
+        self._written(section, key, None)
+
+    def _written(self, section: str, key: str, text: str | None) -> None:
+        """Record a committed write: bump generations, update the caches.
+
+        Called right after the commit, so a read that started earlier sees
+        the new generation and discards what it read.
+        """
+        self._key_gen[(section, key)] = self._key_gen.get((section, key), 0) + 1
+        self._section_gen[section] = self._section_gen.get(section, 0) + 1
+        self._cache[(section, key)] = text
+        self._section_cache.pop(section, None)
 
     # =========================================================================
     # PLUGIN INSTANCES
@@ -129,28 +272,25 @@ class ConfigStore:
     async def list_instances(self, plugin_type: str | None = None) -> list[dict]:
         """List plugin instances, optionally filtered by type."""
         if plugin_type:
-            sql = "SELECT * FROM plugin_instances WHERE plugin_type = ? ORDER BY sort_order, id"
+            sql = _LIST_INSTANCES_BY_TYPE_SQL
             params = (plugin_type,)
         else:
-            sql = "SELECT * FROM plugin_instances ORDER BY sort_order, plugin_type, id"
+            sql = _LIST_INSTANCES_SQL
             params = ()
 
         results = []
-        async with self._db.execute(sql, params) as cursor:
+        async with self._reader() as db, db.execute(sql, params) as cursor:
             async for row in cursor:
                 results.append(self._row_to_instance(row))
         return results
 
     async def get_instance(self, instance_id: str) -> dict | None:
         """Get a single plugin instance by ID."""
-        async with self._db.execute(
-            "SELECT * FROM plugin_instances WHERE id = ?",
-            (instance_id,),
-        ) as cursor:
+        async with self._reader() as db, db.execute(_GET_INSTANCE_SQL, (instance_id,)) as cursor:
             row = await cursor.fetchone()
-            if row is None:
-                return None
-            return self._row_to_instance(row)
+        if row is None:
+            return None
+        return self._row_to_instance(row)
 
     async def create_instance(
         self,
@@ -164,9 +304,8 @@ class ConfigStore:
         """Create a new plugin instance."""
         config = config or {}
         await self._db.execute(
-            """INSERT INTO plugin_instances (id, plugin_type, display_name, enabled, config, sort_order)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (instance_id, plugin_type, display_name, int(enabled), json.dumps(config), sort_order),
+            _CREATE_INSTANCE_SQL,
+            (instance_id, plugin_type, display_name, int(enabled), jsonutil.dumps(config), sort_order),
         )
         await self._db.commit()
         logger.info(f"Created plugin instance: {instance_id} ({plugin_type})")
@@ -178,59 +317,53 @@ class ConfigStore:
 
         Supported kwargs: display_name, enabled, config, sort_order
         """
-        sets = []
-        params = []
-
-        for field in ("display_name", "enabled", "sort_order"):
-            if field in kwargs:
-                sets.append(f"{field} = ?")
-                val = kwargs[field]
-                if field == "enabled":
-                    val = int(val)
-                params.append(val)
-
-        if "config" in kwargs:
-            sets.append("config = ?")
-            params.append(json.dumps(kwargs["config"]))
-
-        if not sets:
+        fields = tuple(f for f in _UPDATABLE_FIELDS if f in kwargs)
+        if not fields:
             return await self.get_instance(instance_id)
 
-        sets.append("updated_at = datetime('now')")
+        params = []
+        for field in fields:
+            val = kwargs[field]
+            if field == "enabled":
+                val = int(val)
+            elif field == "config":
+                val = jsonutil.dumps(val)
+            params.append(val)
         params.append(instance_id)
 
-        await self._db.execute(
-            f"UPDATE plugin_instances SET {', '.join(sets)} WHERE id = ?",
-            params,
-        )
+        await self._db.execute(self._update_sql(fields), params)
         await self._db.commit()
         logger.info(f"Updated plugin instance: {instance_id}")
         return await self.get_instance(instance_id)
 
     async def delete_instance(self, instance_id: str) -> None:
         """Delete a plugin instance."""
-        await self._db.execute(
-            "DELETE FROM plugin_instances WHERE id = ?",
-            (instance_id,),
-        )
+        await self._db.execute(_DELETE_INSTANCE_SQL, (instance_id,))
         await self._db.commit()
         logger.info(f"Deleted plugin instance: {instance_id}")
 
     async def toggle_instance(self, instance_id: str) -> bool:
         """Toggle an instance's enabled state. Returns the new state."""
-        instance = await self.get_instance(instance_id)
-        if instance is None:
+        # Flip the bit in SQL so the read-modify-write is a single atomic statement
+        async with self._db.execute(_TOGGLE_INSTANCE_SQL, (instance_id,)) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
             raise ValueError(f"Instance not found: {instance_id}")
 
-        new_state = not instance["enabled"]
-        await self._db.execute(
-            "UPDATE plugin_instances SET enabled = ?, updated_at = datetime('now') WHERE id = ?",
-            (int(new_state), instance_id),
-        )
         await self._db.commit()
+        new_state = bool(row["enabled"])
         logger.info(f"Toggled instance {instance_id}: {'enabled' if new_state else 'disabled'}")
         return new_state
 
+    def _update_sql(self, fields: tuple[str, ...]) -> str:
+        """Return the UPDATE statement for a set of fields, built once per shape."""
+        sql = self._update_sql_cache.get(fields)
+        if sql is None:
+            sets = ", ".join(f"{field} = ?" for field in fields)
+            sql = f"UPDATE plugin_instances SET {sets}, updated_at = datetime('now') WHERE id = ?"
+            self._update_sql_cache[fields] = sql
+        return sql
+
     def _row_to_instance(self, row: aiosqlite.Row) -> dict:
         """Convert a database row to an instance dict."""
         return {
@@ -238,7 +371,7 @@ class ConfigStore:
             "plugin_type": row["plugin_type"],
             "display_name": row["display_name"],
             "enabled": bool(row["enabled"]),
-            "config": json.loads(row["config"]),
+            "config": jsonutil.loads(row["config"]),
             "sort_order": row["sort_order"],
             "created_at": row["created_at"],
             "updated_at": row["updated_at"],
@@ -2,18 +2,25 @@
 RadioDan Event Store
 
 Persists timeline events to SQLite and publishes them to SSE subscribers
-via async queues. Each event represents an activity (track play, TTS
+through a shared message ring. Each event represents an activity (track play, TTS
 generation, LLM request, voice segment) displayed on the DAW-like timeline.
 """
 
 import asyncio
-import json
 import logging
 import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import AsyncIterator
 
 import aiosqlite
 
+from bridge import jsonutil
+
 logger = logging.getLogger(__name__)
 
 EVENT_STORE_SCHEMA = """
@@ -32,24 +39,210 @@ CREATE TABLE IF NOT EXISTS event_detail (
     event_id    INTEGER NOT NULL REFERENCES event_log(id),
     key         TEXT NOT NULL,
     value       TEXT,
+    value_type  TEXT NOT NULL DEFAULT 'j',
     PRIMARY KEY (event_id, key)
 );
 
-CREATE INDEX IF NOT EXISTS idx_event_log_started ON event_log(started_at);
+-- get_window's overlap test reads both ends from the index, so only rows
+-- inside the window are fetched; this supersedes the started_at index
+DROP INDEX IF EXISTS idx_event_log_started;
+CREATE INDEX IF NOT EXISTS idx_event_log_window ON event_log(started_at, ended_at);
 CREATE INDEX IF NOT EXISTS idx_event_log_lane ON event_log(lane);
 CREATE INDEX IF NOT EXISTS idx_event_log_status ON event_log(status);
 """
 
+# Hot-path statements kept as constants so SQLite's statement cache
+# (keyed by SQL text) can reuse the compiled form across calls.
+_INSERT_EVENT_SQL = (
+    "INSERT INTO event_log (event_type, lane, title, started_at, ended_at, status, created_at) "
+    "VALUES (?, ?, ?, ?, NULL, ?, ?)"
+)
+_INSERT_DETAIL_SQL = (
+    "INSERT INTO event_detail (event_id, key, value, value_type) VALUES (?, ?, ?, ?)"
+)
+_UPSERT_DETAIL_SQL = (
+    "INSERT OR REPLACE INTO event_detail (event_id, key, value, value_type) VALUES (?, ?, ?, ?)"
+)
+_END_EVENT_SQL = "UPDATE event_log SET ended_at = ?, status = ? WHERE id = ?"
+# Events and their details in one statement: one row per detail (or one
+# NULL-detail row for an event without any)
+_WINDOW_SQL = (
+    "SELECT e.id, e.event_type, e.lane, e.title, e.started_at, e.ended_at, e.status, "
+    "e.created_at, d.key, d.value, d.value_type "
+    "FROM event_log e LEFT JOIN event_detail d ON d.event_id = e.id "
+    "WHERE e.started_at <= ? AND (e.ended_at IS NULL OR e.ended_at >= ?)"
+)
+_LAST_MUSIC_DETAIL_SQL = (
+    "SELECT d.value, d.value_type FROM event_detail d "
+    "JOIN event_log e ON d.event_id = e.id "
+    "WHERE e.lane = 'music' AND d.key = ? "
+    "ORDER BY e.id DESC LIMIT 1"
+)
+_LAST_MUSIC_ID_SQL = "SELECT id FROM event_log WHERE lane = 'music' ORDER BY id DESC LIMIT 1"
+
+# Published messages retained for subscribers that fall behind; older
+# messages are dropped (same backlog the former per-subscriber queues had)
+_RING_SIZE = 256
+
+# Default number of read-only connections opened alongside the writer
+# (Config.database.readers / RADIODAN_DB_READERS). With WAL, window queries
+# run on these without queueing behind in-flight writes.
+_READER_COUNT = 2
+
+# Per-connection tuning for file databases, applied to the writer and every
+# reader: sorts and temp tables stay in memory, hot pages stay cached and
+# reads go through mmap. Sized for a small host, since each connection
+# holds its own page cache.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA mmap_size=67108864",
+)
+
+# Fields update_event() may change
+_UPDATABLE_FIELDS = frozenset({"title", "status", "ended_at", "started_at"})
+
+
+@lru_cache(maxsize=16)
+def _window_sql(lane_count: int) -> str:
+    """get_window's full statement for a given number of lane filters."""
+    query = _WINDOW_SQL
+    if lane_count:
+        query += f" AND e.lane IN ({','.join('?' * lane_count)})"
+    return query + " ORDER BY e.started_at"
+
+
+def _encode_detail(value) -> tuple[str, str]:
+    """Encode a detail value as (text, value_type).
+
+    Scalars are stored as plain text tagged with their type; only
+    containers (and None) pay for a JSON round-trip.
+    """
+    if isinstance(value, str):
+        return value, "s"
+    if isinstance(value, bool):
+        return ("1" if value else "0"), "b"
+    if isinstance(value, int):
+        return str(value), "i"
+    if isinstance(value, float):
+        return repr(value), "f"
+    return jsonutil.dumps(value), "j"
+
+
+def _decode_detail(text: str | None, value_type: str):
+    """Reverse _encode_detail(). Undecodable JSON is returned as raw text."""
+    if value_type == "s":
+        return text
+    if value_type == "i":
+        return int(text)
+    if value_type == "f":
+        return float(text)
+    if value_type == "b":
+        return text == "1"
+    try:
+        return jsonutil.loads(text)
+    except (jsonutil.JSONDecodeError, TypeError):
+        return text
+
+
+class EventSubscription:
+    """A subscriber's read cursor into the EventStore message ring.
+
+    All subscribers share one ring of encoded payloads and one wakeup
+    event, so publishing is O(1) regardless of subscriber count and a
+    burst of messages costs each subscriber a single wakeup.
+    Exposes the asyncio.Queue read methods (get, get_nowait, empty, ...).
+    """
+
+    def __init__(self, store: "EventStore"):
+        self._store = store
+        self._cursor = store._published
+        self._closed = False
+
+    def close(self) -> None:
+        """Stop receiving messages."""
+        self._closed = True
+
+    def _pending_start(self) -> int:
+        """Sequence number of the next readable message (skips dropped ones)."""
+        oldest = self._store._published - len(self._store._ring)
+        return max(self._cursor, oldest)
+
+    def qsize(self) -> int:
+        """Number of messages waiting to be read."""
+        if self._closed:
+            return 0
+        return self._store._published - self._pending_start()
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def full(self) -> bool:
+        return self.qsize() >= _RING_SIZE
+
+    def get_nowait(self) -> bytes:
+        """Return the next payload or raise asyncio.QueueEmpty."""
+        if self.empty():
+            raise asyncio.QueueEmpty
+        store = self._store
+        start = self._pending_start()
+        self._cursor = start + 1
+        return store._ring[start - (store._published - len(store._ring))]
+
+    def drain(self) -> list[bytes]:
+        """Return all pending payloads (possibly none) without waiting."""
+        if self.empty():
+            return []
+        store = self._store
+        start = self._pending_start()
+        self._cursor = store._published
+        return list(islice(store._ring, start - (store._published - len(store._ring)), None))
+
+    async def get(self) -> bytes:
+        """Wait for and return the next payload."""
+        while self.empty():
+            await self._store._wakeup.wait()
+        return self.get_nowait()
+
+    async def get_batch(self) -> list[bytes]:
+        """Wait until at least one payload is pending, then return them all."""
+        while self.empty():
+            await self._store._wakeup.wait()
+        return self.drain()
+
+    def __aiter__(self) -> "EventSubscription":
+        return self
+
+    async def __anext__(self) -> list[bytes]:
+        return await self.get_batch()
+
 
 class EventStore:
     """SQLite-backed event store with pub/sub for live SSE streaming."""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, readers: int = _READER_COUNT):
+        # Writer connection; all writes go through it under self._lock
         self._db: aiosqlite.Connection | None = None
         self._db_path = db_path
-        self._subscribers: list[asyncio.Queue] = []
+        # Read-only connections to open for a file database
+        self._reader_count = readers
+        # Idle read-only connections (empty for in-memory databases)
+        self._readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._reader_conns: list[aiosqlite.Connection] = []
+        # Weak so a subscription abandoned without unsubscribe() is dropped automatically
+        self._subscribers: weakref.WeakSet[EventSubscription] = weakref.WeakSet()
+        # Shared fanout: encoded payloads, total published count, and a
+        # wakeup event that is set (and replaced) on every publish
+        self._ring: deque[bytes] = deque(maxlen=_RING_SIZE)
+        self._published = 0
+        self._wakeup = asyncio.Event()
         self._lock = asyncio.Lock()
         self._last_music_z_stagger: int = 0
+        # Most recent music event, kept current by start_event()
+        self._last_music_filename: str | None = None
+        self._last_music_event_id: int | None = None
+        # UPDATE statements keyed by the sorted tuple of fields being set
+        self._update_sql_cache: dict[tuple[str, ...], str] = {}
 
     async def open(self) -> None:
         """Open database and create tables.
@@ -60,9 +253,31 @@ class EventStore:
         """
         self._db = await aiosqlite.connect(self._db_path)
         self._db.row_factory = aiosqlite.Row
+        in_memory = str(self._db_path) == ":memory:"
+        if not in_memory:
+            # WAL lets the reader connections run alongside the writer
+            await self._db.execute("PRAGMA journal_mode=WAL")
+            await self._db.execute("PRAGMA synchronous=NORMAL")
+            # ConfigStore and the playlist planner write to the same file
+            await self._db.execute("PRAGMA busy_timeout=5000")
+            for pragma in _CONNECTION_PRAGMAS:
+                await self._db.execute(pragma)
         await self._db.executescript(EVENT_STORE_SCHEMA)
+        await self._migrate_detail_value_type()
         await self._db.commit()
 
+        # Each :memory: connection is a separate database, so in-memory
+        # stores read through the writer instead
+        if not in_memory:
+            for _ in range(self._reader_count):
+                reader = await aiosqlite.connect(self._db_path)
+                reader.row_factory = aiosqlite.Row
+                await reader.execute("PRAGMA query_only=1")
+                for pragma in _CONNECTION_PRAGMAS:
+                    await reader.execute(pragma)
+                self._reader_conns.append(reader)
+                self._readers.put_nowait(reader)
+
         # Close orphaned active events from previous process — set ended_at to
         # started_at so they collapse to zero-width on the timeline rather
         # than stretching all the way to "now" and overlapping current events
@@ -84,29 +299,63 @@ class EventStore:
             )
 
         # Recover last music z_stagger from DB for stable alternation
-        async with self._db.execute(
-            "SELECT d.value FROM event_detail d "
-            "JOIN event_log e ON d.event_id = e.id "
-            "WHERE e.lane = 'music' AND d.key = 'z_stagger' "
-            "ORDER BY e.id DESC LIMIT 1"
-        ) as cur:
+        async with self._db.execute(_LAST_MUSIC_DETAIL_SQL, ("z_stagger",)) as cur:
             row = await cur.fetchone()
             if row:
                 try:
-                    self._last_music_z_stagger = int(json.loads(row["value"]))
-                except (ValueError, TypeError, json.JSONDecodeError):
+                    self._last_music_z_stagger = int(_decode_detail(row["value"], row["value_type"]))
+                except (ValueError, TypeError):
                     pass
         logger.info(f"Last music z_stagger: {self._last_music_z_stagger}")
 
+        # Seed the last-music cache; start_event() keeps it current afterwards
+        async with self._db.execute(_LAST_MUSIC_DETAIL_SQL, ("filename",)) as cur:
+            row = await cur.fetchone()
+            if row:
+                self._last_music_filename = _decode_detail(row["value"], row["value_type"])
+        async with self._db.execute(_LAST_MUSIC_ID_SQL) as cur:
+            row = await cur.fetchone()
+            if row:
+                self._last_music_event_id = row["id"]
+
         logger.info("Event store opened")
 
+    async def _migrate_detail_value_type(self) -> None:
+        """Add event_detail.value_type to databases created before it existed.
+
+        Pre-existing rows were all JSON-encoded, which the 'j' default covers.
+        """
+        async with self._db.execute("PRAGMA table_info(event_detail)") as cur:
+            columns = {row["name"] async for row in cur}
+        if "value_type" not in columns:
+            await self._db.execute(
+                "ALTER TABLE event_detail ADD COLUMN value_type TEXT NOT NULL DEFAULT 'j'"
+            )
+            logger.info("Added value_type column to event_detail")
+
     async def close(self) -> None:
-        """Close database connection."""
+        """Close database connections."""
         if self._db:
+            for reader in self._reader_conns:
+                await reader.close()
+            self._reader_conns.clear()
+            self._readers = asyncio.Queue()
             await self._db.close()
             self._db = None
             logger.info("Event store closed")
 
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection, falling back to the writer."""
+        if not self._reader_conns:
+            yield self._db
+            return
+        reader = await self._readers.get()
+        try:
+            yield reader
+        finally:
+            self._readers.put_nowait(reader)
+
     async def start_event(
         self,
         event_type: str,
@@ -128,24 +377,27 @@ class EventStore:
 
         async with self._lock:
             cursor = await self._db.execute(
-                "INSERT INTO event_log (event_type, lane, title, started_at, ended_at, status, created_at) "
-                "VALUES (?, ?, ?, ?, NULL, ?, ?)",
+                _INSERT_EVENT_SQL,
                 (event_type, lane, title, ts, status, now),
             )
             event_id = cursor.lastrowid
 
             if details:
-                for key, value in details.items():
-                    await self._db.execute(
-                        "INSERT INTO event_detail (event_id, key, value) VALUES (?, ?, ?)",
-                        (event_id, key, json.dumps(value)),
-                    )
+                await self._db.executemany(
+                    _INSERT_DETAIL_SQL,
+                    [(event_id, key, *_encode_detail(value)) for key, value in details.items()],
+                )
 
             await self._db.commit()
 
-        # Track z_stagger for stable music lane alternation
-        if lane == "music" and details and "z_stagger" in details:
-            self._last_music_z_stagger = int(details["z_stagger"])
+        if lane == "music":
+            self._last_music_event_id = event_id
+            if details:
+                if "filename" in details:
+                    self._last_music_filename = details["filename"]
+                # Track z_stagger for stable music lane alternation
+                if "z_stagger" in details:
+                    self._last_music_z_stagger = int(details["z_stagger"])
 
         event = {
             "id": event_id,
@@ -170,30 +422,13 @@ class EventStore:
         """Return the filename from the most recent music event, or None."""
         if not self._db:
             return None
-        async with self._db.execute(
-            "SELECT d.value FROM event_detail d "
-            "JOIN event_log e ON d.event_id = e.id "
-            "WHERE e.lane = 'music' AND d.key = 'filename' "
-            "ORDER BY e.id DESC LIMIT 1"
-        ) as cur:
-            row = await cur.fetchone()
-            if row:
-                try:
-                    return json.loads(row["value"])
-                except (json.JSONDecodeError, TypeError):
-                    return None
-        return None
+        return self._last_music_filename
 
     async def get_last_music_event_id(self) -> int | None:
         """Return the id of the most recent music event, or None."""
         if not self._db:
             return None
-        async with self._db.execute(
-            "SELECT id FROM event_log "
-            "WHERE lane = 'music' ORDER BY id DESC LIMIT 1"
-        ) as cur:
-            row = await cur.fetchone()
-            return row["id"] if row else None
+        return self._last_music_event_id
 
     async def end_event(
         self,
@@ -207,16 +442,12 @@ class EventStore:
 
         now = time.time()
         async with self._lock:
-            await self._db.execute(
-                "UPDATE event_log SET ended_at = ?, status = ? WHERE id = ?",
-                (now, status, event_id),
-            )
+            await self._db.execute(_END_EVENT_SQL, (now, status, event_id))
             if extra_details:
-                for key, value in extra_details.items():
-                    await self._db.execute(
-                        "INSERT OR REPLACE INTO event_detail (event_id, key, value) VALUES (?, ?, ?)",
-                        (event_id, key, json.dumps(value)),
-                    )
+                await self._db.executemany(
+                    _UPSERT_DETAIL_SQL,
+                    [(event_id, key, *_encode_detail(value)) for key, value in extra_details.items()],
+                )
             await self._db.commit()
 
         self._publish({
@@ -229,18 +460,20 @@ class EventStore:
         if not self._db or event_id < 0:
             return
 
-        allowed = {"title", "status", "ended_at", "started_at"}
-        updates = {k: v for k, v in kwargs.items() if k in allowed}
+        updates = {k: v for k, v in kwargs.items() if k in _UPDATABLE_FIELDS}
         if not updates:
             return
 
+        fields = tuple(sorted(updates))
+        sql = self._update_sql_cache.get(fields)
+        if sql is None:
+            set_clause = ", ".join(f"{k} = ?" for k in fields)
+            sql = f"UPDATE event_log SET {set_clause} WHERE id = ?"
+            self._update_sql_cache[fields] = sql
+
         async with self._lock:
-            set_clause = ", ".join(f"{k} = ?" for k in updates)
-            values = list(updates.values()) + [event_id]
-            await self._db.execute(
-                f"UPDATE event_log SET {set_clause} WHERE id = ?",
-                values,
-            )
+            values = [updates[k] for k in fields] + [event_id]
+            await self._db.execute(sql, values)
             await self._db.commit()
 
         self._publish({
@@ -263,79 +496,64 @@ class EventStore:
         if not self._db:
             return []
 
-        # Build query for events overlapping the time window
-        query = (
-            "SELECT id, event_type, lane, title, started_at, ended_at, status, created_at "
-            "FROM event_log "
-            "WHERE started_at <= ? AND (ended_at IS NULL OR ended_at >= ?)"
-        )
-        params: list = [end_ts, start_ts]
-
-        if lanes:
-            placeholders = ",".join("?" for _ in lanes)
-            query += f" AND lane IN ({placeholders})"
-            params.extend(lanes)
-
-        query += " ORDER BY started_at"
-
-        events = []
-        async with self._db.execute(query, params) as cursor:
-            async for row in cursor:
-                event = {
-                    "id": row["id"],
-                    "event_type": row["event_type"],
-                    "lane": row["lane"],
-                    "title": row["title"],
-                    "started_at": row["started_at"],
-                    "ended_at": row["ended_at"],
-                    "status": row["status"],
-                    "created_at": row["created_at"],
+        query = _window_sql(len(lanes) if lanes else 0)
+        params = (end_ts, start_ts, *(lanes or ()))
+
+        async with self._reader() as db:
+            async with db.execute(query, params) as cursor:
+                # Plain tuples: the loop below unpacks every column anyway
+                cursor.row_factory = None
+                rows = await cursor.fetchall()
+
+        # Keyed by id in first-seen order, which is started_at order
+        events: dict[int, dict] = {}
+        get = events.get
+        for (event_id, event_type, lane, title, started_at, ended_at, status,
+             created_at, key, value, value_type) in rows:
+            event = get(event_id)
+            if event is None:
+                event = events[event_id] = {
+                    "id": event_id,
+                    "event_type": event_type,
+                    "lane": lane,
+                    "title": title,
+                    "started_at": started_at,
+                    "ended_at": ended_at,
+                    "status": status,
+                    "created_at": created_at,
                     "details": {},
                 }
-                events.append(event)
-
-        # Batch-load details for all events
-        if events:
-            event_ids = [e["id"] for e in events]
-            placeholders = ",".join("?" for _ in event_ids)
-            detail_map: dict[int, dict] = {eid: {} for eid in event_ids}
-            async with self._db.execute(
-                f"SELECT event_id, key, value FROM event_detail WHERE event_id IN ({placeholders})",
-                event_ids,
-            ) as cursor:
-                async for row in cursor:
-                    try:
-                        detail_map[row["event_id"]][row["key"]] = json.loads(row["value"])
-                    except (json.JSONDecodeError, KeyError):
-                        detail_map[row["event_id"]][row["key"]] = row["value"]
-
-            for event in events:
-                event["details"] = detail_map.get(event["id"], {})
-
-        return events
-
-    def subscribe(self) -> asyncio.Queue:
-        """Return a queue that receives all published event messages."""
-        queue: asyncio.Queue = asyncio.Queue(maxsize=256)
-        self._subscribers.append(queue)
-        return queue
-
-    def unsubscribe(self, queue: asyncio.Queue) -> None:
-        """Remove a subscriber queue."""
-        try:
-            self._subscribers.remove(queue)
-        except ValueError:
-            pass
+            if key is not None:
+                event["details"][key] = _decode_detail(value, value_type)
+
+        return list(events.values())
+
+    def subscribe(self) -> EventSubscription:
+        """Return a subscription that receives all published event messages.
+
+        Each item is the message already JSON-encoded as bytes, ready to be
+        written after an SSE ``data: `` prefix.
+        """
+        subscription = EventSubscription(self)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Remove a subscription."""
+        subscription.close()
+        self._subscribers.discard(subscription)
 
     def _publish(self, message: dict) -> None:
-        """Push a message to all subscriber queues (non-blocking)."""
-        for queue in self._subscribers:
-            try:
-                queue.put_nowait(message)
-            except asyncio.QueueFull:
-                # Drop oldest message to prevent backpressure blocking
-                try:
-                    queue.get_nowait()
-                    queue.put_nowait(message)
-                except (asyncio.QueueEmpty, asyncio.QueueFull):
-                    pass
+        """Append a message to the shared ring and wake all subscribers.
+
+        The message is serialized once; subscribers that fall more than
+        _RING_SIZE messages behind lose the oldest ones. With nobody
+        subscribed it is dropped unencoded, since a new subscription only
+        sees messages published after it.
+        """
+        if not self._subscribers:
+            return
+        self._ring.append(jsonutil.dumps_bytes(message))
+        self._published += 1
+        wakeup, self._wakeup = self._wakeup, asyncio.Event()
+        wakeup.set()
@@ -0,0 +1,44 @@
+"""
+RadioDan JSON helpers
+
+Uses orjson when it is installed (several times faster, emits bytes
+natively) and falls back to the stdlib json module otherwise.
+
+    dumps(obj)        -> str
+    dumps_bytes(obj)  -> bytes (e.g. for SSE frames)
+    loads(str|bytes)  -> object
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError  # orjson.JSONDecodeError subclasses this
+
+
+if orjson is not None:
+
+    def dumps(obj) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize obj to JSON bytes."""
+        return orjson.dumps(obj)
+
+    loads = orjson.loads
+
+else:
+
+    def dumps(obj) -> str:
+        """Serialize obj to a JSON string."""
+        return json.dumps(obj)
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize obj to JSON bytes."""
+        return json.dumps(obj).encode()
+
+    loads = json.loads
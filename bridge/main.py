@@ -14,6 +14,7 @@ import socket
 import sys
 import time
 from pathlib import Path
+from typing import Awaitable, Callable
 
 from bridge.config import Config, get_stream_url
 from bridge.config_store import ConfigStore
@@ -21,12 +22,16 @@ from bridge.event_store import EventStore
 from bridge.channels.telegram import TelegramChannel
 from bridge.services.tts_service import TTSService
 from bridge.services.stt_service import STTService
+from bridge.services.llm_cache import LLMCache
 from bridge.services.llm_service import LLMService
+from bridge.services import instrumentation
+from bridge.services.http import close_shared_session, get_shared_session, is_ipv4_loopback
 from bridge.audio.mixer import LiquidsoapMixer
 from bridge.audio.stream_context import StreamContext
 from bridge.audio.voice_scheduler import VoiceScheduler
 from bridge.audio.playlist_planner import PlaylistPlanner
 from bridge.plugins import load_plugin_instances
+from bridge.plugins.base import SharedPluginServices
 from bridge.web.server import WebServer
 from bridge.booth import booth
 
@@ -38,16 +43,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger("radiodan")
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Memoized result of get_local_ip() for the process lifetime
+_cached_ip: str | None = None
+
+
 def get_local_ip() -> str:
-    """Get the local IP address for LAN access."""
+    """Get the local IP address for LAN access.
+
+    This blocks on the socket, so call it from a worker thread inside the
+    event loop. Config.local_ip (RADIODAN_LOCAL_IP) takes precedence.
+    """
+    global _cached_ip
+    if _cached_ip is not None:
+        return _cached_ip
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))
         ip = s.getsockname()[0]
         s.close()
-        return ip
     except Exception:
-        return "localhost"
+        ip = "localhost"
+    _cached_ip = ip
+    return ip
 
 
 async def main() -> None:
@@ -62,11 +81,12 @@ async def main() -> None:
         station_dir = Path(station_dir_env)
     else:
         # Legacy fallback: use config/ directory
-        station_dir = Path(__file__).parent.parent / "config"
+        station_dir = PROJECT_ROOT / "config"
 
     # Configure booth log (DJ event log)
-    booth_log_file = Path(__file__).parent.parent / "logs" / "booth.log"
-    booth.configure(log_file=booth_log_file, console=True)
+    booth_log_file = PROJECT_ROOT / "logs" / "booth.log"
+    await asyncio.to_thread(booth.configure, log_file=booth_log_file, console=True)
+    booth_flusher = asyncio.create_task(booth.run_flusher())
 
     # Load configuration (reads RADIODAN_STATION_DIR internally)
     config = Config.load()
@@ -75,17 +95,17 @@ async def main() -> None:
     booth.start(station_name)
 
     # Open SQLite config store (DB lives in station dir)
-    config_store = ConfigStore()
+    config_store = ConfigStore(readers=config.database.readers)
     db_path = station_dir / "radiodan.db"
     await config_store.open(db_path)
     logger.info(f"Config store opened: {db_path}")
 
     # Open event store (timeline persistence, shares same DB)
-    event_store = EventStore(db_path)
+    event_store = EventStore(db_path, readers=config.database.readers)
     await event_store.open()
 
     # Determine stream URL
-    local_ip = get_local_ip()
+    local_ip = config.local_ip or await asyncio.to_thread(get_local_ip)
     stream_url = get_stream_url(config, local_ip)
     logger.info(f"Stream URL: {stream_url}")
 
@@ -98,11 +118,20 @@ async def main() -> None:
     if not config.telegram.allowed_users:
         logger.warning("No TELEGRAM_USER_ID configured - bot will accept all users!")
     else:
-        logger.info(f"Allowed Telegram users: {config.telegram.allowed_users}")
+        logger.info(f"Allowed Telegram users: {sorted(config.telegram.allowed_users)}")
+
+    # One HTTP session (connection pool + DNS cache) for TTS, STT and LLM
+    http_session = get_shared_session(
+        ipv4_only=is_ipv4_loopback(
+            config.audio.tts.endpoint,
+            config.audio.stt.endpoint,
+            config.ai.ollama.endpoint,
+        ),
+    )
 
     # Initialize TTS service
-    tts_cache_dir = Path(__file__).parent.parent / "tmp" / "tts_cache"
-    tts_cache_dir.mkdir(parents=True, exist_ok=True)
+    tts_cache_dir = PROJECT_ROOT / "tmp" / "tts_cache"
+    await asyncio.to_thread(tts_cache_dir.mkdir, parents=True, exist_ok=True)
 
     tts_service = TTSService(
         endpoint=config.audio.tts.endpoint,
@@ -110,11 +139,12 @@ async def main() -> None:
         speaker=config.audio.tts.speaker,
         language=config.audio.tts.language,
         instruct=config.audio.tts.instruct,
+        session=http_session,
     )
     logger.info(f"TTS service configured (endpoint: {config.audio.tts.endpoint})")
 
     # Initialize STT (Speech-to-Text) service
-    stt_service = STTService(endpoint=config.audio.stt.endpoint)
+    stt_service = STTService(endpoint=config.audio.stt.endpoint, session=http_session)
     logger.info(f"STT service configured (endpoint: {config.audio.stt.endpoint})")
 
     # Initialize LLM service
@@ -122,24 +152,25 @@ async def main() -> None:
         endpoint=config.ai.ollama.endpoint,
         model=config.ai.ollama.model,
         system_prompt=config.ai.ollama.system_prompt,
+        session=http_session,
+        cache=LLMCache(ttl=config.ai.ollama.cache_ttl) if config.ai.ollama.cache_ttl > 0 else None,
     )
     logger.info(f"LLM service configured (endpoint: {config.ai.ollama.endpoint}, model: {config.ai.ollama.model})")
 
     # Initialize Liquidsoap mixer
-    project_root = Path(__file__).parent.parent
     mixer = LiquidsoapMixer(
         host=config.audio.liquidsoap.telnet_host,
         port=config.audio.liquidsoap.telnet_port,
         path_mappings={
-            project_root / "music": "/music",
-            project_root / "tmp": "/tmp",
+            PROJECT_ROOT / "music": "/music",
+            PROJECT_ROOT / "tmp": "/tmp",
         },
         config_store=config_store,
     )
     logger.info(f"Mixer configured (Liquidsoap: {config.audio.liquidsoap.telnet_host}:{config.audio.liquidsoap.telnet_port})")
 
     # Create playlist planner (lookahead queue + library scanner)
-    music_dir = project_root / config.audio.playlist.music_dir
+    music_dir = PROJECT_ROOT / config.audio.playlist.music_dir
     playlist_planner = PlaylistPlanner(
         mixer=mixer,
         db_path=db_path,
@@ -168,21 +199,21 @@ async def main() -> None:
     playlist_planner.set_stream_context(stream_context)
 
     # Shared services for plugin contexts
-    ctx_kwargs = {
-        "tts_service": tts_service,
-        "mixer": mixer,
-        "llm_service": llm_service,
-        "stream_context": stream_context,
-        "voice_scheduler": voice_scheduler,
-        "booth": booth,
-        "playlist_planner": playlist_planner,
-    }
+    plugin_services = SharedPluginServices(
+        tts_service=tts_service,
+        mixer=mixer,
+        llm_service=llm_service,
+        stream_context=stream_context,
+        voice_scheduler=voice_scheduler,
+        booth=booth,
+        playlist_planner=playlist_planner,
+    )
 
     # Load plugin instances (SQLite + YAML fallback)
     plugins = await load_plugin_instances(
         config_store=config_store,
         plugin_configs=config.plugins,
-        ctx_kwargs=ctx_kwargs,
+        services=plugin_services,
     )
     logger.info(f"Loaded {len(plugins)} plugin instance(s)")
 
@@ -209,7 +240,7 @@ async def main() -> None:
         stream_context=stream_context,
         plugins=plugins,
         event_store=event_store,
-        ctx_kwargs=ctx_kwargs,
+        plugin_services=plugin_services,
         station_name=station_name,
         stream_url=stream_url,
     )
@@ -219,11 +250,20 @@ async def main() -> None:
 
     # Store startup metadata and control events for system routes
     web_server.app["start_time"] = time.time()
-    web_server.app["project_root"] = project_root
+    web_server.app["project_root"] = PROJECT_ROOT
+
+    main_task = asyncio.current_task()
+    running = False
 
     def handle_shutdown(sig: signal.Signals) -> None:
+        if shutdown_event.is_set():
+            logger.info(f"Received {sig.name} again, shutdown already in progress")
+            return
         logger.info(f"Received {sig.name}, initiating shutdown...")
         shutdown_event.set()
+        # A hung start() would never reach shutdown_event.wait(); interrupt it
+        if not running:
+            main_task.cancel()
 
     # Register signal handlers
     loop = asyncio.get_running_loop()
@@ -232,23 +272,35 @@ async def main() -> None:
 
     # Start services
     try:
-        await tts_service.start()
-        await stt_service.start()
-        await llm_service.start()
+        # AI services talk to independent endpoints; bring them up together
+        await asyncio.gather(
+            tts_service.start(),
+            stt_service.start(),
+            llm_service.start(),
+        )
         await mixer.start()
-        await playlist_planner.start()
+
+        # Planner and scheduler only need the mixer and the event store, not
+        # each other. The stream monitor starts after the planner: its poll
+        # enriches track metadata from the planner's queue and library.
+        await asyncio.gather(
+            playlist_planner.start(),
+            voice_scheduler.start(),
+        )
         await stream_context.start()
-        await voice_scheduler.start()
 
         # Wire feedback loop: track changes drive playlist advancement
         stream_context.on("track_changed", playlist_planner.advance)
 
-        # Start plugins
-        for plugin in plugins:
-            try:
-                await plugin.start()
-            except Exception:
-                logger.exception(f"Failed to start plugin: {plugin.instance_id}")
+        # Start plugins concurrently so their network setup overlaps
+        results = await asyncio.gather(
+            *(plugin.start() for plugin in plugins), return_exceptions=True
+        )
+        for plugin, result in zip(plugins, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Failed to start plugin: {plugin.instance_id}", exc_info=result
+                )
 
         await telegram.start()
         await web_server.start()
@@ -263,38 +315,78 @@ async def main() -> None:
         logger.info("Press Ctrl+C to stop")
 
         # Wait for shutdown signal
+        running = True
         await shutdown_event.wait()
 
+    except asyncio.CancelledError:
+        # Consume the cancellation handle_shutdown() requested, so the
+        # cleanup timeout below isn't mistaken for it
+        main_task.uncancel()
+        logger.info("Startup interrupted by shutdown signal")
     except Exception as e:
         logger.exception(f"Error running {station_name}: {e}")
     finally:
+        # Signals arriving from here on are ignored by handle_shutdown(), so
+        # nothing cancels main() while it tears down
+        shutdown_event.set()
+
+        async def _stop(label: str, stop: Callable[[], Awaitable[None]]) -> None:
+            try:
+                await stop()
+            except Exception:
+                logger.exception(f"Failed to stop {label}")
+
         async def _cleanup() -> None:
-            """Shut down all services in reverse order."""
-            await web_server.stop()
-            await telegram.stop()
-            for plugin in reversed(plugins):
-                try:
-                    await plugin.stop()
-                except Exception:
-                    logger.exception(f"Failed to stop plugin: {plugin.instance_id}")
-            await voice_scheduler.stop()
-            await stream_context.stop()
-            await playlist_planner.stop()
-            await mixer.stop()
-            await llm_service.stop()
-            await stt_service.stop()
-            await tts_service.stop()
-            await event_store.close()
-            await config_store.close()
+            """Shut down services tier by tier, in reverse dependency order.
+
+            Services within a tier don't depend on each other and stop in
+            parallel. _stop() logs failures so one bad stop() doesn't cancel
+            the rest of its tier.
+            """
+            tiers: list[list[tuple[str, Callable[[], Awaitable[None]]]]] = [
+                [
+                    ("web server", web_server.stop),
+                    ("telegram", telegram.stop),
+                    *((f"plugin: {p.instance_id}", p.stop) for p in reversed(plugins)),
+                ],
+                [
+                    ("voice scheduler", voice_scheduler.stop),
+                    ("stream context", stream_context.stop),
+                    ("playlist planner", playlist_planner.stop),
+                ],
+                [
+                    ("mixer", mixer.stop),
+                    ("LLM service", llm_service.stop),
+                    ("STT service", stt_service.stop),
+                    ("TTS service", tts_service.stop),
+                ],
+                [
+                    ("timeline writes", instrumentation.drain),
+                ],
+                [
+                    ("event store", event_store.close),
+                    ("config store", config_store.close),
+                    ("HTTP session", close_shared_session),
+                ],
+            ]
+            for tier in tiers:
+                async with asyncio.TaskGroup() as tg:
+                    for label, stop in tier:
+                        tg.create_task(_stop(label, stop))
 
         try:
-            await asyncio.wait_for(_cleanup(), timeout=8.0)
-        except asyncio.TimeoutError:
+            # On timeout the cleanup is cancelled and unwound before this
+            # returns, so no teardown is left running when main() exits
+            async with asyncio.timeout(8.0):
+                await _cleanup()
+        except TimeoutError:
             logger.warning("Cleanup timed out after 8s — exiting anyway")
         except Exception:
             logger.exception("Error during cleanup")
 
         booth.stop(station_name)
+        booth_flusher.cancel()
+        booth.flush()
         logger.info(f"{station_name} stopped.")
 
 
@@ -2,20 +2,25 @@
 RadioDan Plugin Discovery and Loading
 
 Uses a @register_plugin decorator and pkgutil-based discovery
-to find and load all plugins in this package.
+to find and load all plugins in this package. Each plugin lives in a
+module named after it, so startup imports only the plugins it runs;
+the web GUI does a full discover_plugins() scan.
 
 Supports multi-instance plugins: each plugin class is a template,
 users create named instances with independent configs via SQLite
 or YAML fallback.
 """
 
+import asyncio
+import functools
 import importlib
 import logging
 import pkgutil
 from pathlib import Path
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
 
-from bridge.plugins.base import DJPlugin, PluginContext
+from bridge.plugins.base import DJPlugin, PluginContext, SharedPluginServices
 
 if TYPE_CHECKING:
     from bridge.config_store import ConfigStore
@@ -24,6 +29,11 @@ logger = logging.getLogger(__name__)
 
 # Global plugin registry: name -> class
 _plugin_registry: dict[str, type[DJPlugin]] = {}
+# Read-only live view handed out by get_registry()
+_registry_view: Mapping[str, type[DJPlugin]] = MappingProxyType(_plugin_registry)
+
+# Set once discover_plugins() has imported every module without errors
+_discovered = False
 
 
 def register_plugin(cls: type[DJPlugin]) -> type[DJPlugin]:
@@ -33,27 +43,68 @@ def register_plugin(cls: type[DJPlugin]) -> type[DJPlugin]:
     return cls
 
 
-def get_registry() -> dict[str, type[DJPlugin]]:
-    """Return the plugin registry (after discovery)."""
-    return dict(_plugin_registry)
+def get_registry() -> Mapping[str, type[DJPlugin]]:
+    """Return a read-only view of the plugin registry (after discovery)."""
+    return _registry_view
 
 
-def discover_plugins() -> None:
-    """Import all modules in the plugins package to trigger @register_plugin."""
+@functools.cache
+def _plugin_module_names() -> tuple[str, ...]:
+    """List plugin module names in this package (without importing them)."""
     package_dir = Path(__file__).parent
-    for importer, modname, ispkg in pkgutil.iter_modules([str(package_dir)]):
-        if modname == "base":
-            continue
+    return tuple(
+        modname
+        for _, modname, _ in pkgutil.iter_modules([str(package_dir)])
+        if modname != "base"
+    )
+
+
+def discover_plugins(force: bool = False) -> None:
+    """Import all modules in the plugins package to trigger @register_plugin.
+
+    The package is only scanned once per process; later calls are no-ops
+    unless force=True. A scan with import failures is not remembered, so
+    it is retried on the next call.
+    """
+    global _discovered
+    if _discovered and not force:
+        return
+    if force:
+        _plugin_module_names.cache_clear()
+
+    failed = False
+    for modname in _plugin_module_names():
         try:
             importlib.import_module(f"bridge.plugins.{modname}")
         except Exception:
+            failed = True
             logger.exception(f"Failed to import plugin module: {modname}")
 
+    _discovered = not failed
+
+
+async def _import_plugin_types(plugin_types: set[str]) -> None:
+    """Import the modules for just these plugin types, in worker threads.
+
+    Relies on the convention that a plugin module is named after the
+    plugin it registers (presenter.py registers "presenter"). Types that
+    are already registered or have no matching module are skipped.
+    """
+    available = set(_plugin_module_names())
+    names = [t for t in plugin_types if t not in _plugin_registry and t in available]
+    results = await asyncio.gather(
+        *(asyncio.to_thread(importlib.import_module, f"bridge.plugins.{m}") for m in names),
+        return_exceptions=True,
+    )
+    for modname, result in zip(names, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to import plugin module: {modname}", exc_info=result)
+
 
 async def load_plugin_instances(
     config_store: "ConfigStore",
     plugin_configs: dict,
-    ctx_kwargs: dict,
+    services: SharedPluginServices,
 ) -> list[DJPlugin]:
     """
     Discover and instantiate plugin instances.
@@ -63,40 +114,48 @@ async def load_plugin_instances(
     2. For any plugin type in YAML that has no SQLite instances,
        auto-create a default instance from the YAML config
 
+    Only the modules of plugin types that end up enabled are imported.
+
     Args:
         config_store: SQLite config store for instance definitions
         plugin_configs: YAML plugin configs (e.g. {"presenter": {"enabled": true, ...}})
-        ctx_kwargs: Shared services to pass into PluginContext
+        services: Shared services for every instance's PluginContext
 
     Returns:
         List of instantiated plugin objects
     """
-    discover_plugins()
-
     plugins: list[DJPlugin] = []
 
-    # Track which plugin types have SQLite instances
-    types_with_instances: set[str] = set()
+    # Both lookups below come from this one query: which ids exist, and
+    # which types the YAML fallback must skip
+    db_instances = await config_store.list_instances()
+    existing_ids = {inst["id"] for inst in db_instances}
+    types_with_instances = {inst["plugin_type"] for inst in db_instances}
+
+    fallback_types = [
+        name for name in _plugin_module_names() if name not in types_with_instances
+    ]
+    await _import_plugin_types(
+        {inst["plugin_type"] for inst in db_instances if inst["enabled"]}
+        | {name for name in fallback_types if plugin_configs.get(name, {}).get("enabled", True)}
+    )
 
     # 1. Load instances from SQLite
-    db_instances = await config_store.list_instances()
     for inst in db_instances:
         plugin_type = inst["plugin_type"]
         instance_id = inst["id"]
 
-        if plugin_type not in _plugin_registry:
-            logger.warning(f"Unknown plugin type '{plugin_type}' for instance '{instance_id}', skipping")
-            continue
-
-        types_with_instances.add(plugin_type)
-
         if not inst["enabled"]:
             logger.info(f"Instance {instance_id} is disabled, skipping")
             continue
 
+        plugin_cls = _plugin_registry.get(plugin_type)
+        if plugin_cls is None:
+            logger.warning(f"Unknown plugin type '{plugin_type}' for instance '{instance_id}', skipping")
+            continue
+
         try:
-            plugin_cls = _plugin_registry[plugin_type]
-            ctx = PluginContext(config=inst["config"], **ctx_kwargs)
+            ctx = PluginContext(services=services, config=inst["config"])
             plugin = plugin_cls(ctx, instance_id=instance_id, display_name=inst["display_name"])
             plugins.append(plugin)
             logger.info(f"Loaded instance: {instance_id} ({plugin_type}) v{plugin.version}")
@@ -104,23 +163,23 @@ async def load_plugin_instances(
             logger.exception(f"Failed to instantiate: {instance_id} ({plugin_type})")
 
     # 2. YAML fallback: auto-create default instances for types not in SQLite
-    for name, plugin_cls in _plugin_registry.items():
-        if name in types_with_instances:
-            continue  # Already has SQLite instances
-
+    for name in fallback_types:
         plugin_cfg = plugin_configs.get(name, {})
 
         if not plugin_cfg.get("enabled", True):
             logger.info(f"Plugin {name} is disabled in YAML, skipping")
             continue
 
+        plugin_cls = _plugin_registry.get(name)
+        if plugin_cls is None:
+            continue  # Import failed (already logged) or module registers no plugin
+
         instance_id = f"default-{name}"
-        display_name = f"Default {name.replace('_', ' ').title()}"
+        display_name = f"Default {plugin_cls._default_display_name}"
 
         try:
             # Auto-create the instance in SQLite for future web GUI editing
-            existing = await config_store.get_instance(instance_id)
-            if not existing:
+            if instance_id not in existing_ids:
                 await config_store.create_instance(
                     instance_id=instance_id,
                     plugin_type=name,
@@ -128,9 +187,10 @@ async def load_plugin_instances(
                     config=plugin_cfg,
                     enabled=True,
                 )
+                existing_ids.add(instance_id)
                 logger.info(f"Migrated YAML config to SQLite instance: {instance_id}")
 
-            ctx = PluginContext(config=plugin_cfg, **ctx_kwargs)
+            ctx = PluginContext(services=services, config=plugin_cfg)
             plugin = plugin_cls(ctx, instance_id=instance_id, display_name=display_name)
             plugins.append(plugin)
             logger.info(f"Loaded plugin: {instance_id} ({name}) v{plugin.version} [from YAML]")
@@ -142,7 +202,7 @@ async def load_plugin_instances(
 
 def load_plugins(
     plugin_configs: dict,
-    ctx_kwargs: dict,
+    services: SharedPluginServices,
 ) -> list[DJPlugin]:
     """
     Legacy synchronous loader (backwards compatibility).
@@ -160,7 +220,7 @@ def load_plugins(
             continue
 
         try:
-            ctx = PluginContext(config=plugin_cfg, **ctx_kwargs)
+            ctx = PluginContext(services=services, config=plugin_cfg)
             plugin = plugin_cls(ctx, instance_id=f"default-{name}")
             plugins.append(plugin)
             logger.info(f"Loaded plugin: {name} v{plugin.version}")
@@ -10,7 +10,9 @@ Plugins are templates; users create named instances with independent configs.
 
 import asyncio
 import logging
+import sys
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from bridge.audio.stream_context import StreamContext
@@ -42,19 +44,58 @@ class TelegramMenuButton:
     callback_data: str  # e.g. "plugin:presenter:toggle"
 
 
-@dataclass
-class PluginContext:
-    """Everything a plugin needs to operate."""
+@dataclass(frozen=True)
+class SharedPluginServices:
+    """Service references shared by every plugin instance."""
 
     tts_service: "TTSService"
     mixer: "LiquidsoapMixer"
     llm_service: "LLMService"
     stream_context: StreamContext
     voice_scheduler: VoiceScheduler
-    config: dict = field(default_factory=dict)
     booth: Any = None  # BoothLog instance
     playlist_planner: "PlaylistPlanner | None" = None
 
+
+@dataclass
+class PluginContext:
+    """Everything a plugin needs to operate.
+
+    Only config is per-instance; the service properties (ctx.mixer,
+    ctx.stream_context, ...) read the shared services object.
+    """
+
+    services: SharedPluginServices
+    config: dict = field(default_factory=dict)
+
+    @property
+    def tts_service(self) -> "TTSService":
+        return self.services.tts_service
+
+    @property
+    def mixer(self) -> "LiquidsoapMixer":
+        return self.services.mixer
+
+    @property
+    def llm_service(self) -> "LLMService":
+        return self.services.llm_service
+
+    @property
+    def stream_context(self) -> StreamContext:
+        return self.services.stream_context
+
+    @property
+    def voice_scheduler(self) -> VoiceScheduler:
+        return self.services.voice_scheduler
+
+    @property
+    def booth(self) -> Any:
+        return self.services.booth
+
+    @property
+    def playlist_planner(self) -> "PlaylistPlanner | None":
+        return self.services.playlist_planner
+
     @property
     def ollama_service(self) -> "LLMService":
         """Legacy alias for llm_service."""
@@ -78,12 +119,22 @@ class DJPlugin:
     description: str = ""
     version: str = "0.1.0"
 
+    # Derived from name once per class in __init_subclass__
+    _default_display_name: str = "Unnamed"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._default_display_name = cls.name.replace("_", " ").title()
+
     def __init__(self, ctx: PluginContext, instance_id: str | None = None, display_name: str | None = None):
         self.ctx = ctx
         self.instance_id = instance_id or f"default-{self.name}"
-        self.display_name = display_name or self.name.replace("_", " ").title()
+        self.display_name = display_name or self._default_display_name
         self.logger = logging.getLogger(f"plugin.{self.name}.{self.instance_id}")
-        self._tasks: list[asyncio.Task] = []
+        # StreamContext clears this dict in place on track change but never
+        # rebinds it, so holding a direct reference is safe
+        self._enrichments: dict[str, Any] = ctx.stream_context.enrichments
+        self._tasks: set[asyncio.Task] = set()
         self._running = False
 
     # =========================================================================
@@ -119,9 +170,11 @@ class DJPlugin:
         """Stop the plugin, cancelling all background tasks."""
         self._running = False
         await self.on_stop()
-        for task in self._tasks:
+        # Done callbacks discard from the set, so iterate over a snapshot
+        tasks = list(self._tasks)
+        for task in tasks:
             task.cancel()
-        for task in self._tasks:
+        for task in tasks:
             try:
                 await task
             except asyncio.CancelledError:
@@ -181,12 +234,12 @@ class DJPlugin:
 
     def enrich(self, key: str, value: Any) -> None:
         """Write a value to the shared enrichment context."""
-        self.ctx.stream_context.enrichments[key] = value
+        self._enrichments[key] = value
 
     @property
     def context(self) -> dict[str, Any]:
         """Read the shared enrichment context from all plugins."""
-        return self.ctx.stream_context.enrichments
+        return self._enrichments
 
     # =========================================================================
     # BACKGROUND TASKS
@@ -195,19 +248,20 @@ class DJPlugin:
     def create_task(self, coro: Any) -> asyncio.Task:
         """Create a tracked background task that is cancelled on stop."""
         task = asyncio.create_task(coro)
-        self._tasks.append(task)
-
-        def _on_done(t: asyncio.Task) -> None:
-            if t in self._tasks:
-                self._tasks.remove(t)
-            if not t.cancelled() and t.exception():
-                self.logger.exception(
-                    "Background task failed", exc_info=t.exception()
-                )
-
-        task.add_done_callback(_on_done)
+        # Strong references on purpose: the event loop only holds tasks
+        # weakly, so an untracked pending task can be garbage collected
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(self._log_task_failure)
         return task
 
+    def _log_task_failure(self, task: asyncio.Task) -> None:
+        """Done callback: log the exception of a failed background task."""
+        if not task.cancelled() and task.exception():
+            self.logger.exception(
+                "Background task failed", exc_info=task.exception()
+            )
+
     def run_every(self, interval: float, callback: Any) -> asyncio.Task:
         """Run an async callback periodically."""
 
@@ -273,26 +327,49 @@ class ContextFeeder(DJPlugin):
                 "default": 60,
                 "help": "How often to refresh context data (0 = only on start)",
             },
+            {
+                "key": "await_initial_fetch",
+                "type": "bool",
+                "label": "Wait for Initial Fetch",
+                "default": False,
+                "help": "Hold plugin startup until the first fetch completes",
+            },
         ]
 
     async def on_start(self) -> None:
-        """Fetch initial data and start periodic refresh."""
-        await self._do_fetch()
+        """Fetch initial data and start periodic refresh.
 
+        The initial fetch runs in the background unless the instance sets
+        await_initial_fetch, so a slow source doesn't hold up startup. With
+        a refresh interval, that background fetch is run_every()'s first
+        iteration.
+        """
         interval = self.ctx.config.get("refresh_interval", 60)
+        if self.ctx.config.get("await_initial_fetch", False):
+            await self._do_fetch()
+        elif interval <= 0:
+            self.create_task(self._do_fetch())
+
         if interval > 0:
             self.run_every(interval, self._do_fetch)
 
+    @cached_property
+    def _ns_prefix(self) -> str:
+        """Key prefix for this feeder's entries in feeder_context."""
+        return (self.feeder_namespace or self.name) + "."
+
     async def _do_fetch(self) -> None:
         """Fetch context data and store in feeder_context."""
-        namespace = self.feeder_namespace or self.name
+        prefix = self._ns_prefix
 
         try:
             data = await self.fetch_context()
+            feeder_context = self.ctx.stream_context.feeder_context
             for key, value in data.items():
-                self.ctx.stream_context.feeder_context[f"{namespace}.{key}"] = value
+                # Interned so every refresh reuses the same key objects
+                feeder_context[sys.intern(prefix + key)] = value
         except Exception:
-            self.logger.exception(f"Failed to fetch context for {namespace}")
+            self.logger.exception(f"Failed to fetch context for {prefix[:-1]}")
 
     async def fetch_context(self) -> dict[str, Any]:
         """Override in subclass to provide context data.
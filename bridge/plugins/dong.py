@@ -12,14 +12,97 @@ Default: recurring hourly, saying "Dooong! The time is HH:MM"
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 
+from bridge.booth import booth
 from bridge.plugins import register_plugin
 from bridge.plugins.base import DJPlugin, TelegramCommand, TelegramMenuButton
 
 logger = logging.getLogger(__name__)
 
 
+# Longest single timer wait. The loop clock is monotonic, so re-checking the
+# wall clock at least this often corrects for NTP steps and suspends.
+_MAX_TIMER_DELAY = 3600.0
+
+
+def _next_boundary(after: float, period: int, offset: int) -> float:
+    """Return the first epoch time > after that falls offset seconds past a
+    multiple of period in local time (e.g. period=3600, offset=0 is every
+    hour on the dot)."""
+    gmtoff = time.localtime(after).tm_gmtoff
+    local = after + gmtoff
+    return ((local - offset) // period + 1) * period + offset - gmtoff
+
+
+# Field descriptors for the web UI form; built once, callers copy before
+# merging instance values
+_DONG_CONFIG_FIELDS = (
+    {
+        "key": "active_on_start",
+        "type": "bool",
+        "label": "Active on Start",
+        "default": True,
+        "help": "Start announcing immediately when the plugin loads",
+    },
+    {
+        "key": "mode",
+        "type": "select",
+        "label": "Mode",
+        "default": "recurring",
+        "options": [
+            {"value": "recurring", "label": "Recurring"},
+            {"value": "oneshot", "label": "One-shot"},
+            {"value": "between_songs", "label": "Between every song"},
+        ],
+        "help": "When to fire announcements",
+    },
+    {
+        "key": "recurring_type",
+        "type": "select",
+        "label": "Recurring Schedule",
+        "default": "hourly",
+        "options": [
+            {"value": "hourly", "label": "Hourly (on the dot)"},
+            {"value": "daily", "label": "Daily (at set time)"},
+        ],
+        "show_when": {"field": "mode", "value": "recurring"},
+        "help": "How often to fire in recurring mode",
+    },
+    {
+        "key": "daily_time",
+        "type": "text",
+        "label": "Daily Time (HH:MM)",
+        "default": "12:00",
+        "show_when": {"field": "recurring_type", "value": "daily"},
+        "help": "Time of day for daily announcements (24h format)",
+    },
+    {
+        "key": "oneshot_datetime",
+        "type": "datetime",
+        "label": "Fire At",
+        "default": "",
+        "show_when": {"field": "mode", "value": "oneshot"},
+        "help": "Exact date/time for the one-shot announcement",
+    },
+    {
+        "key": "say_text",
+        "type": "text",
+        "label": "Say Text",
+        "default": "Dooong! The time is {time}",
+        "help": "Text to speak. Use {time} for current HH:MM. Leave empty to use LLM prompt instead.",
+    },
+    {
+        "key": "prompt",
+        "type": "textarea",
+        "label": "LLM Prompt (fallback)",
+        "default": "",
+        "help": "If Say Text is empty, this prompt is sent to the LLM. Use {time} for current HH:MM.",
+    },
+)
+
+
 @register_plugin
 class DongPlugin(DJPlugin):
     """Time-based announcements — hourly chimes, scheduled alerts, per-song."""
@@ -30,73 +113,12 @@ class DongPlugin(DJPlugin):
 
     @classmethod
     def config_fields(cls) -> list[dict]:
-        return [
-            {
-                "key": "active_on_start",
-                "type": "bool",
-                "label": "Active on Start",
-                "default": True,
-                "help": "Start announcing immediately when the plugin loads",
-            },
-            {
-                "key": "mode",
-                "type": "select",
-                "label": "Mode",
-                "default": "recurring",
-                "options": [
-                    {"value": "recurring", "label": "Recurring"},
-                    {"value": "oneshot", "label": "One-shot"},
-                    {"value": "between_songs", "label": "Between every song"},
-                ],
-                "help": "When to fire announcements",
-            },
-            {
-                "key": "recurring_type",
-                "type": "select",
-                "label": "Recurring Schedule",
-                "default": "hourly",
-                "options": [
-                    {"value": "hourly", "label": "Hourly (on the dot)"},
-                    {"value": "daily", "label": "Daily (at set time)"},
-                ],
-                "show_when": {"field": "mode", "value": "recurring"},
-                "help": "How often to fire in recurring mode",
-            },
-            {
-                "key": "daily_time",
-                "type": "text",
-                "label": "Daily Time (HH:MM)",
-                "default": "12:00",
-                "show_when": {"field": "recurring_type", "value": "daily"},
-                "help": "Time of day for daily announcements (24h format)",
-            },
-            {
-                "key": "oneshot_datetime",
-                "type": "datetime",
-                "label": "Fire At",
-                "default": "",
-                "show_when": {"field": "mode", "value": "oneshot"},
-                "help": "Exact date/time for the one-shot announcement",
-            },
-            {
-                "key": "say_text",
-                "type": "text",
-                "label": "Say Text",
-                "default": "Dooong! The time is {time}",
-                "help": "Text to speak. Use {time} for current HH:MM. Leave empty to use LLM prompt instead.",
-            },
-            {
-                "key": "prompt",
-                "type": "textarea",
-                "label": "LLM Prompt (fallback)",
-                "default": "",
-                "help": "If Say Text is empty, this prompt is sent to the LLM. Use {time} for current HH:MM.",
-            },
-        ]
+        return list(_DONG_CONFIG_FIELDS)
 
     def __init__(self, ctx, instance_id=None, display_name=None) -> None:
         super().__init__(ctx, instance_id=instance_id, display_name=display_name)
         self._active = False
+        self._timer: asyncio.TimerHandle | None = None
 
     async def on_start(self) -> None:
         cfg = self.ctx.config
@@ -104,86 +126,141 @@ class DongPlugin(DJPlugin):
         self._mode = cfg.get("mode", "recurring")
         self._say_text = cfg.get("say_text", "Dooong! The time is {time}")
         self._prompt = cfg.get("prompt", "")
-
-        if not self._active:
-            self.logger.info(f"Dong '{self.instance_id}' started in standby (inactive)")
-            return
-
-        if self._mode == "recurring":
-            recurring_type = cfg.get("recurring_type", "hourly")
-            if recurring_type == "hourly":
-                self.create_task(self._clock_aligned_loop(60, target_minute=0))
-                self.logger.info(f"Dong '{self.instance_id}' started: recurring hourly")
-            elif recurring_type == "daily":
-                daily_time = cfg.get("daily_time", "12:00")
-                try:
-                    parts = daily_time.strip().split(":")
-                    hour, minute = int(parts[0]), int(parts[1])
-                except (ValueError, IndexError):
-                    hour, minute = 12, 0
-                    self.logger.warning(f"Invalid daily_time '{daily_time}', defaulting to 12:00")
-                self.create_task(self._daily_loop(hour, minute))
-                self.logger.info(f"Dong '{self.instance_id}' started: recurring daily at {hour:02d}:{minute:02d}")
+        # Templates split on {time} once; filled with time_str.join()
+        self._say_parts = self._say_text.split("{time}")
+        self._prompt_parts = self._prompt.split("{time}")
+        self._recurring_type = cfg.get("recurring_type", "hourly")
+        self._target_ts: float | None = None
+
+        if self._mode == "recurring" and self._recurring_type == "daily":
+            daily_time = cfg.get("daily_time", "12:00")
+            try:
+                parts = daily_time.strip().split(":")
+                hour, minute = int(parts[0]), int(parts[1])
+            except (ValueError, IndexError):
+                hour, minute = 12, 0
+                self.logger.warning(f"Invalid daily_time '{daily_time}', defaulting to 12:00")
+            self._daily_seconds_of_day = hour * 3600 + minute * 60
 
         elif self._mode == "oneshot":
             dt_str = cfg.get("oneshot_datetime", "")
             if dt_str:
-                self.create_task(self._oneshot_fire(dt_str))
-                self.logger.info(f"Dong '{self.instance_id}' started: one-shot at {dt_str}")
+                try:
+                    self._target_ts = datetime.fromisoformat(dt_str).timestamp()
+                except ValueError:
+                    self.logger.error(f"Invalid oneshot datetime: {dt_str}")
             else:
                 self.logger.warning(f"Dong '{self.instance_id}': oneshot mode but no datetime configured")
 
         elif self._mode == "between_songs":
             self.ctx.stream_context.on("track_changed", self._on_track_changed)
-            self.logger.info(f"Dong '{self.instance_id}' started: between every song")
+
+        if not self._active:
+            self.logger.info(f"Dong '{self.instance_id}' started in standby (inactive)")
+            return
+
+        self._arm_schedule()
+        self.logger.info(f"Dong '{self.instance_id}' started: {self._describe_schedule()}")
+
+    async def on_stop(self) -> None:
+        self._disarm_schedule()
 
     # =========================================================================
     # SCHEDULING
     # =========================================================================
 
-    async def _clock_aligned_loop(self, interval_minutes: int, target_minute: int = 0) -> None:
-        """Fire at clock-aligned intervals (e.g. every hour on the dot)."""
-        while self._running:
-            now = datetime.now()
-            next_fire = now.replace(minute=target_minute, second=0, microsecond=0)
-            if next_fire <= now:
-                next_fire += timedelta(minutes=interval_minutes)
-            delay = (next_fire - now).total_seconds()
-            self.logger.debug(f"Next hourly dong in {delay:.0f}s at {next_fire.strftime('%H:%M')}")
-            await asyncio.sleep(delay)
-            if self._active and self._running:
-                await self._fire_announcement()
-
-    async def _daily_loop(self, hour: int, minute: int) -> None:
-        """Fire once daily at the specified time."""
-        while self._running:
-            now = datetime.now()
-            next_fire = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            if next_fire <= now:
-                next_fire += timedelta(days=1)
-            delay = (next_fire - now).total_seconds()
-            self.logger.debug(f"Next daily dong in {delay:.0f}s at {next_fire.strftime('%Y-%m-%d %H:%M')}")
-            await asyncio.sleep(delay)
-            if self._active and self._running:
-                await self._fire_announcement()
-
-    async def _oneshot_fire(self, dt_str: str) -> None:
-        """Fire once at a specific datetime."""
-        try:
-            target = datetime.fromisoformat(dt_str)
-        except ValueError:
-            self.logger.error(f"Invalid oneshot datetime: {dt_str}")
-            return
+    def _arm_schedule(self) -> None:
+        """Arm the timer for the configured mode.
+
+        Called on start and when toggled back on; toggling off cancels the
+        timer, so a paused instance has nothing waking it up.
+        """
+        if self._mode == "recurring":
+            if self._recurring_type == "hourly":
+                self._schedule(_next_boundary(time.time(), 3600, 0), "hourly", period=3600)
+            elif self._recurring_type == "daily":
+                self._schedule(
+                    _next_boundary(time.time(), 86400, self._daily_seconds_of_day),
+                    "daily",
+                    period=86400,
+                    offset=self._daily_seconds_of_day,
+                )
+        elif self._mode == "oneshot" and self._target_ts is not None:
+            if self._target_ts <= time.time():
+                self.logger.warning(
+                    f"Oneshot datetime is in the past: {self.ctx.config.get('oneshot_datetime')}"
+                )
+                self._target_ts = None
+                return
+            self._schedule(self._target_ts, "one-shot")
+
+    def _disarm_schedule(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
 
-        delay = (target - datetime.now()).total_seconds()
-        if delay <= 0:
-            self.logger.warning(f"Oneshot datetime is in the past: {dt_str}")
+    def _describe_schedule(self) -> str:
+        if self._mode == "recurring":
+            if self._recurring_type == "daily":
+                hour, minute = divmod(self._daily_seconds_of_day // 60, 60)
+                return f"recurring daily at {hour:02d}:{minute:02d}"
+            return f"recurring {self._recurring_type}"
+        if self._mode == "oneshot":
+            return f"one-shot at {self.ctx.config.get('oneshot_datetime', '')}"
+        if self._mode == "between_songs":
+            return "between every song"
+        return self._mode
+
+    def _schedule(self, fire_at: float, label: str, period: int | None = None, offset: int = 0) -> None:
+        """Arm a timer for epoch time fire_at.
+
+        With a period, the timer re-arms itself for the next local-time
+        boundary of period (shifted by offset seconds) after each fire.
+        A single loop timer handle replaces a task parked in asyncio.sleep.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+        self._fire_at = fire_at
+        self._label = label
+        self._period = period
+        self._offset = offset
+        self._log_next_fire()
+        self._arm_timer()
+
+    def _arm_timer(self) -> None:
+        # The loop clock is monotonic; cap each wait so wall-clock steps and
+        # suspends are noticed when _on_timer re-reads time.time()
+        delay = min(max(self._fire_at - time.time(), 0.0), _MAX_TIMER_DELAY)
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_at(loop.time() + delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        if not self._running:
+            return
+        if time.time() < self._fire_at:
+            # Capped wait elapsed, or the wall clock moved; wait again
+            self._arm_timer()
             return
 
-        self.logger.info(f"Oneshot dong scheduled in {delay:.0f}s")
-        await asyncio.sleep(delay)
-        if self._active and self._running:
-            await self._fire_announcement()
+        self.create_task(self._fire_announcement())
+
+        if self._period is None:
+            self._target_ts = None
+            return  # one-shot
+        # Skip boundaries missed while suspended rather than firing them all
+        self._fire_at = _next_boundary(max(self._fire_at, time.time()), self._period, self._offset)
+        self._log_next_fire()
+        self._arm_timer()
+
+    def _log_next_fire(self) -> None:
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        delay = self._fire_at - time.time()
+        self.logger.debug(
+            f"Next {self._label} dong in {delay:.0f}s at "
+            f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(self._fire_at))}"
+        )
 
     async def _on_track_changed(self, track_info: dict) -> None:
         """Fire on every track change (between_songs mode)."""
@@ -196,13 +273,14 @@ class DongPlugin(DJPlugin):
 
     async def _fire_announcement(self) -> None:
         """Generate and speak the announcement."""
-        time_str = datetime.now().strftime("%H:%M")
+        now = time.localtime()
+        time_str = f"{now.tm_hour:02d}:{now.tm_min:02d}"
 
         try:
             if self._say_text:
-                text = self._say_text.replace("{time}", time_str)
+                text = time_str.join(self._say_parts)
             elif self._prompt:
-                prompt_filled = self._prompt.replace("{time}", time_str)
+                prompt_filled = time_str.join(self._prompt_parts)
                 text = await self.ctx.llm_service.chat(prompt_filled)
             else:
                 text = f"The time is {time_str}"
@@ -226,10 +304,13 @@ class DongPlugin(DJPlugin):
     async def handle_telegram_callback(self, action: str) -> str | None:
         if action in ("toggle", "command"):
             self._active = not self._active
+            if self._active:
+                self._arm_schedule()
+            else:
+                self._disarm_schedule()
             state = "ON" if self._active else "OFF"
             self.logger.info(f"Dong '{self.instance_id}' toggled: {state}")
 
-            from bridge.booth import booth
             booth.plugin_event(self.instance_id, f"Toggled {state}")
 
             return (
@@ -14,9 +14,15 @@ Style-awareness prevents double-talking (e.g., a track that got an intro
 won't also get an outro at its end).
 """
 
+import asyncio
+import bisect
+import itertools
 import logging
 import random
+import string
+from typing import Callable
 
+from bridge.booth import booth
 from bridge.plugins import register_plugin
 from bridge.plugins.base import DJPlugin, TelegramCommand, TelegramMenuButton
 
@@ -58,6 +64,155 @@ DEFAULT_STYLE_WEIGHTS = {
 
 ALL_STYLES = ["intro", "outro", "mid_song", "silent"]
 
+_formatter = string.Formatter()
+
+
+def _pick_table(weights: dict[str, int]) -> tuple[tuple[str, ...], tuple[int, ...], int]:
+    """Build (styles, cumulative weights, total) for bisect-based sampling."""
+    styles = tuple(weights)
+    cum = tuple(itertools.accumulate(weights[s] for s in styles))
+    return styles, cum, cum[-1] if cum else 0
+
+
+def _compile_prompt(template: str) -> Callable[[dict], str]:
+    """Pre-parse a str.format template into a renderer taking a context dict.
+
+    Equivalent to template.format(**ctx) for {name}, {name:spec} and
+    {name!r} fields. Anything fancier (attribute/index lookups, nested
+    specs, malformed braces) falls back to str.format at render time.
+    """
+    def fallback(ctx: dict) -> str:
+        return template.format(**ctx)
+
+    try:
+        parsed = list(_formatter.parse(template))
+    except ValueError:
+        return fallback
+
+    pieces = []
+    for literal, field, spec, conversion in parsed:
+        if field is not None and (not field.isidentifier() or "{" in spec):
+            return fallback
+        pieces.append((literal, field, spec, conversion))
+
+    def render(ctx: dict) -> str:
+        out = []
+        for literal, field, spec, conversion in pieces:
+            out.append(literal)
+            if field is not None:
+                value = ctx[field]
+                if conversion:
+                    value = _formatter.convert_field(value, conversion)
+                out.append(format(value, spec))
+        return "".join(out)
+
+    return render
+
+
+# Field descriptors for the web UI form; built once, callers copy before
+# merging instance values
+_PRESENTER_CONFIG_FIELDS = (
+    {
+        "key": "persona_name",
+        "type": "text",
+        "label": "Persona Name",
+        "default": DEFAULT_PERSONA_NAME,
+        "help": "The DJ's on-air name",
+    },
+    {
+        "key": "voice_speaker",
+        "type": "select",
+        "label": "Voice",
+        "default": "",
+        "options": [
+            {"value": "", "label": "Default (global setting)"},
+            {"value": "Aiden", "label": "Aiden"},
+            {"value": "Sohee", "label": "Sohee"},
+            {"value": "Adrian", "label": "Adrian"},
+            {"value": "Ryan", "label": "Ryan"},
+            {"value": "Serena", "label": "Serena"},
+            {"value": "Vivian", "label": "Vivian"},
+            {"value": "Eric", "label": "Eric"},
+            {"value": "Dylan", "label": "Dylan"},
+        ],
+        "help": "TTS voice for this DJ. Empty = use global TTS setting.",
+    },
+    {
+        "key": "voice_instruct",
+        "type": "textarea",
+        "label": "Voice Instruction",
+        "default": "",
+        "help": "How the voice should sound (e.g. 'Speak warmly and slowly with a slight smile'). Empty = use global TTS setting.",
+    },
+    {
+        "key": "styles",
+        "type": "style_picker",
+        "label": "DJ Styles",
+        "options": [
+            {"value": "intro", "label": "Intro", "desc": "Talk over beginning of new song", "default_weight": 3},
+            {"value": "outro", "label": "Outro", "desc": "Talk as song fades out", "default_weight": 2},
+            {"value": "mid_song", "label": "Mid-Song", "desc": "Drop in with a comment mid-song", "default_weight": 1},
+            {"value": "silent", "label": "Silent", "desc": "Skip -- create breathing room", "default_weight": 1},
+        ],
+    },
+    {
+        "key": "system_prompt",
+        "type": "textarea",
+        "label": "System Prompt",
+        "default": DEFAULT_SYSTEM_PROMPT,
+        "help": "The system prompt sent to the LLM. Use {persona_name} as a placeholder.",
+    },
+    {
+        "key": "periodic_interval",
+        "type": "number",
+        "label": "Periodic Interval (seconds, 0=off)",
+        "default": 0,
+        "help": "Seconds between periodic ambient announcements (0 to disable)",
+    },
+    {
+        "key": "outro_before_end",
+        "type": "number",
+        "label": "Outro Lead Time (seconds)",
+        "default": 30,
+        "help": "How many seconds before song end to trigger outro",
+    },
+    {
+        "key": "mid_song_min",
+        "type": "number",
+        "label": "Mid-Song Earliest (seconds)",
+        "default": 30,
+        "help": "Earliest point in a song for a mid-song comment",
+    },
+    {
+        "key": "mid_song_max",
+        "type": "number",
+        "label": "Mid-Song Latest (seconds)",
+        "default": 120,
+        "help": "Latest point in a song for a mid-song comment",
+    },
+    {
+        "key": "style_prompts.intro",
+        "type": "textarea",
+        "label": "Intro Prompt",
+        "default": DEFAULT_STYLE_PROMPTS["intro"],
+        "help": "Prompt template for intro announcements. Variables: {context}, {artist}, {title}, {year}, {genre}",
+    },
+    {
+        "key": "style_prompts.outro",
+        "type": "textarea",
+        "label": "Outro Prompt",
+        "default": DEFAULT_STYLE_PROMPTS["outro"],
+        "help": "Prompt template for outro. Variables: {title}, {artist}",
+    },
+    {
+        "key": "style_prompts.mid_song",
+        "type": "textarea",
+        "label": "Mid-Song Prompt",
+        "default": DEFAULT_STYLE_PROMPTS["mid_song"],
+        "help": "Prompt template for mid-song. Variables: {title}, {artist}",
+    },
+)
+
 
 @register_plugin
 class PresenterPlugin(DJPlugin):
@@ -69,112 +224,19 @@ class PresenterPlugin(DJPlugin):
 
     @classmethod
     def config_fields(cls) -> list[dict]:
-        return [
-            {
-                "key": "persona_name",
-                "type": "text",
-                "label": "Persona Name",
-                "default": DEFAULT_PERSONA_NAME,
-                "help": "The DJ's on-air name",
-            },
-            {
-                "key": "voice_speaker",
-                "type": "select",
-                "label": "Voice",
-                "default": "",
-                "options": [
-                    {"value": "", "label": "Default (global setting)"},
-                    {"value": "Aiden", "label": "Aiden"},
-                    {"value": "Sohee", "label": "Sohee"},
-                    {"value": "Adrian", "label": "Adrian"},
-                    {"value": "Ryan", "label": "Ryan"},
-                    {"value": "Serena", "label": "Serena"},
-                    {"value": "Vivian", "label": "Vivian"},
-                    {"value": "Eric", "label": "Eric"},
-                    {"value": "Dylan", "label": "Dylan"},
-                ],
-                "help": "TTS voice for this DJ. Empty = use global TTS setting.",
-            },
-            {
-                "key": "voice_instruct",
-                "type": "textarea",
-                "label": "Voice Instruction",
-                "default": "",
-                "help": "How the voice should sound (e.g. 'Speak warmly and slowly with a slight smile'). Empty = use global TTS setting.",
-            },
-            {
-                "key": "styles",
-                "type": "style_picker",
-                "label": "DJ Styles",
-                "options": [
-                    {"value": "intro", "label": "Intro", "desc": "Talk over beginning of new song", "default_weight": 3},
-                    {"value": "outro", "label": "Outro", "desc": "Talk as song fades out", "default_weight": 2},
-                    {"value": "mid_song", "label": "Mid-Song", "desc": "Drop in with a comment mid-song", "default_weight": 1},
-                    {"value": "silent", "label": "Silent", "desc": "Skip -- create breathing room", "default_weight": 1},
-                ],
-            },
-            {
-                "key": "system_prompt",
-                "type": "textarea",
-                "label": "System Prompt",
-                "default": DEFAULT_SYSTEM_PROMPT,
-                "help": "The system prompt sent to the LLM. Use {persona_name} as a placeholder.",
-            },
-            {
-                "key": "periodic_interval",
-                "type": "number",
-                "label": "Periodic Interval (seconds, 0=off)",
-                "default": 0,
-                "help": "Seconds between periodic ambient announcements (0 to disable)",
-            },
-            {
-                "key": "outro_before_end",
-                "type": "number",
-                "label": "Outro Lead Time (seconds)",
-                "default": 30,
-                "help": "How many seconds before song end to trigger outro",
-            },
-            {
-                "key": "mid_song_min",
-                "type": "number",
-                "label": "Mid-Song Earliest (seconds)",
-                "default": 30,
-                "help": "Earliest point in a song for a mid-song comment",
-            },
-            {
-                "key": "mid_song_max",
-                "type": "number",
-                "label": "Mid-Song Latest (seconds)",
-                "default": 120,
-                "help": "Latest point in a song for a mid-song comment",
-            },
-            {
-                "key": "style_prompts.intro",
-                "type": "textarea",
-                "label": "Intro Prompt",
-                "default": DEFAULT_STYLE_PROMPTS["intro"],
-                "help": "Prompt template for intro announcements. Variables: {context}, {artist}, {title}, {year}, {genre}",
-            },
-            {
-                "key": "style_prompts.outro",
-                "type": "textarea",
-                "label": "Outro Prompt",
-                "default": DEFAULT_STYLE_PROMPTS["outro"],
-                "help": "Prompt template for outro. Variables: {title}, {artist}",
-            },
-            {
-                "key": "style_prompts.mid_song",
-                "type": "textarea",
-                "label": "Mid-Song Prompt",
-                "default": DEFAULT_STYLE_PROMPTS["mid_song"],
-                "help": "Prompt template for mid-song. Variables: {title}, {artist}",
-            },
-        ]
+        return list(_PRESENTER_CONFIG_FIELDS)
 
     def __init__(self, ctx, instance_id=None, display_name=None) -> None:
         super().__init__(ctx, instance_id=instance_id, display_name=display_name)
         self._active = True
-        self._prev_track: dict | None = None
+        # Parsed fields (see _parse_track) of the previous track
+        self._prev_parsed: dict[str, str] | None = None
+        # Last context block, keyed by track fields + context dict versions
+        self._context_block_key: tuple | None = None
+        self._context_block = ""
+        # In-flight outro/mid-song generation for the current track
+        self._pending_outro_task: asyncio.Task | None = None
+        self._pending_mid_task: asyncio.Task | None = None
         self._prev_style: str | None = None
 
     async def on_start(self) -> None:
@@ -204,15 +266,27 @@ class PresenterPlugin(DJPlugin):
             s: configured_weights.get(s, DEFAULT_STYLE_WEIGHTS.get(s, 1))
             for s in self._styles
         }
+        # Precomputed sampling tables; after an intro, outro is excluded
+        self._pick_table_normal = _pick_table(self._style_weights)
+        no_outro = {s: w for s, w in self._style_weights.items() if s != "outro"}
+        self._pick_table_no_outro = (
+            _pick_table(no_outro) if no_outro else self._pick_table_normal
+        )
 
         # Style-specific prompt templates
         self._style_prompts = dict(DEFAULT_STYLE_PROMPTS)
         custom_prompts = cfg.get("style_prompts", {})
         self._style_prompts.update(custom_prompts)
+        self._compiled_prompts = {
+            style: _compile_prompt(template)
+            for style, template in self._style_prompts.items()
+        }
 
         # Mid-song timing range (seconds into song)
         self._mid_song_min = cfg.get("mid_song_min", 30)
         self._mid_song_max = cfg.get("mid_song_max", 120)
+        # Width of the inclusive [min, max] delay range (at least 1 second)
+        self._mid_song_span = max(self._mid_song_max - self._mid_song_min + 1, 1)
 
         # Outro timing (seconds before end)
         self._outro_before_end = cfg.get("outro_before_end", 30)
@@ -234,41 +308,58 @@ class PresenterPlugin(DJPlugin):
         Excludes "outro" if the previous track got an "intro" to avoid
         double-talking at the same transition boundary.
         """
-        exclude = set()
         if self._prev_style == "intro":
-            exclude.add("outro")
-
-        styles = [s for s in self._style_weights if s not in exclude]
-        if not styles:
-            styles = list(self._style_weights.keys())
-        weights = [self._style_weights[s] for s in styles]
-        return random.choices(styles, weights=weights, k=1)[0]
-
-    def _build_track_context(self, track_info: dict) -> dict:
-        """Build template variables from track info + enrichments."""
-        ctx = {
-            "artist": track_info.get("artist", "").strip() or "Unknown Artist",
-            "title": track_info.get("title", "").strip() or "Unknown Title",
+            styles, cum, total = self._pick_table_no_outro
+        else:
+            styles, cum, total = self._pick_table_normal
+        return styles[bisect.bisect(cum, random.random() * total)]
+
+    @staticmethod
+    def _parse_track(track_info: dict) -> dict[str, str]:
+        """Strip the metadata fields of a track once, for reuse on this change."""
+        return {
+            "artist": track_info.get("artist", "").strip(),
+            "title": track_info.get("title", "").strip(),
             "year": track_info.get("year", "").strip(),
             "genre": track_info.get("genre", "").strip(),
+        }
+
+    def _build_track_context(self, parsed: dict[str, str]) -> dict:
+        """Build template variables from parsed track info + enrichments."""
+        ctx = {
+            "artist": parsed["artist"] or "Unknown Artist",
+            "title": parsed["title"] or "Unknown Title",
+            "year": parsed["year"],
+            "genre": parsed["genre"],
             "persona_name": self._persona_name,
             "prev_artist": "",
             "prev_title": "",
         }
 
-        if self._prev_track:
-            ctx["prev_artist"] = self._prev_track.get("artist", "").strip() or "Unknown Artist"
-            ctx["prev_title"] = self._prev_track.get("title", "").strip() or "Unknown Title"
+        prev = self._prev_parsed
+        if prev:
+            ctx["prev_artist"] = prev["artist"] or "Unknown Artist"
+            ctx["prev_title"] = prev["title"] or "Unknown Title"
 
         return ctx
 
-    def _build_context_block(self, track_info: dict) -> str:
-        """Build a multi-line context block for the intro prompt."""
+    def _build_context_block(self, parsed: dict[str, str]) -> str:
+        """Build a multi-line context block for the intro prompt.
+
+        Reuses the previous block while the track and both context dicts
+        are unchanged (tracked via their VersionedDict.version).
+        """
+        context = self.context
+        feeder = self.ctx.stream_context.feeder_context
+        key = (*parsed.values(), context.version, feeder.version)
+        if key == self._context_block_key:
+            return self._context_block
+
         parts = []
-        artist = track_info.get("artist", "").strip()
-        title = track_info.get("title", "").strip()
-        year = track_info.get("year", "").strip()
-        genre = track_info.get("genre", "").strip()
+        artist = parsed["artist"]
+        title = parsed["title"]
+        year = parsed["year"]
+        genre = parsed["genre"]
 
         if artist:
             parts.append(f"Artist: {artist}")
@@ -280,21 +371,22 @@ class PresenterPlugin(DJPlugin):
             parts.append(f"Genre: {genre}")
 
         # Check for enrichments from other plugins
-        lyrics_snippet = self.context.get("lyrics", "")
+        lyrics_snippet = context.get("lyrics", "")
         if lyrics_snippet:
             parts.append(f"Lyrics snippet: {lyrics_snippet[:200]}")
 
-        geo_info = self.context.get("geo", "")
+        geo_info = context.get("geo", "")
         if geo_info:
             parts.append(f"Geographic context: {geo_info}")
 
         # Include feeder context if available
-        feeder = self.ctx.stream_context.feeder_context
-        for key, value in feeder.items():
+        for feeder_key, value in feeder.items():
             if value:
-                parts.append(f"{key}: {str(value)[:100]}")
+                parts.append(f"{feeder_key}: {str(value)[:100]}")
 
-        return "\n".join(parts)
+        self._context_block_key = key
+        self._context_block = "\n".join(parts)
+        return self._context_block
 
     # =========================================================================
     # TRACK CHANGE HANDLING
@@ -302,15 +394,20 @@ class PresenterPlugin(DJPlugin):
 
     async def _on_track_changed(self, track_info: dict) -> None:
         """Pick a style and generate an announcement when a new track starts."""
+        self._cancel_pending_announcements()
+
+        # Parse once per change; an empty track_info counts as no previous track
+        parsed = self._parse_track(track_info) if track_info else None
+
         if not self._active:
-            self._prev_track = track_info
+            self._prev_parsed = parsed
             return
 
-        artist = track_info.get("artist", "").strip()
-        title = track_info.get("title", "").strip()
+        artist = parsed["artist"] if parsed else ""
+        title = parsed["title"] if parsed else ""
 
         if not artist and not title:
-            self._prev_track = track_info
+            self._prev_parsed = parsed
             return
 
         style = self._pick_style()
@@ -321,28 +418,27 @@ class PresenterPlugin(DJPlugin):
                 self.logger.info("Silent style -- skipping announcement")
 
             elif style == "intro":
-                await self._announce_intro(track_info)
+                await self._announce_intro(parsed)
 
             elif style == "outro":
                 # Register a before_end handler for the *current* song
-                self._schedule_outro(track_info)
+                self._schedule_outro(parsed)
 
             elif style == "mid_song":
-                self._schedule_mid_song(track_info)
+                self._schedule_mid_song(parsed)
 
         except Exception:
             self.logger.exception(f"Failed to generate {style} announcement")
 
         self._prev_style = style
-        self._prev_track = track_info
+        self._prev_parsed = parsed
 
-    async def _announce_intro(self, track_info: dict) -> None:
+    async def _announce_intro(self, parsed: dict[str, str]) -> None:
         """Intro style: announce the song that just started (asap trigger)."""
-        ctx = self._build_track_context(track_info)
-        ctx["context"] = self._build_context_block(track_info)
+        ctx = self._build_track_context(parsed)
+        ctx["context"] = self._build_context_block(parsed)
 
-        prompt_template = self._style_prompts.get("intro", DEFAULT_STYLE_PROMPTS["intro"])
-        prompt = prompt_template.format(**ctx)
+        prompt = self._compiled_prompts["intro"](ctx)
 
         announcement = await self.ctx.llm_service.chat(prompt, system_prompt=self._system_prompt)
         await self.say(
@@ -355,12 +451,11 @@ class PresenterPlugin(DJPlugin):
             instruct=self._voice_instruct,
         )
 
-    def _schedule_outro(self, track_info: dict) -> None:
+    def _schedule_outro(self, parsed: dict[str, str]) -> None:
         """Outro style: schedule an announcement before the song ends."""
         async def _generate_outro():
-            ctx = self._build_track_context(track_info)
-            prompt_template = self._style_prompts.get("outro", DEFAULT_STYLE_PROMPTS["outro"])
-            prompt = prompt_template.format(**ctx)
+            ctx = self._build_track_context(parsed)
+            prompt = self._compiled_prompts["outro"](ctx)
 
             announcement = await self.ctx.llm_service.chat(prompt, system_prompt=self._system_prompt)
             await self.say(
@@ -373,16 +468,15 @@ class PresenterPlugin(DJPlugin):
                 instruct=self._voice_instruct,
             )
 
-        self.create_task(_generate_outro())
+        self._pending_outro_task = self.create_task(_generate_outro())
 
-    def _schedule_mid_song(self, track_info: dict) -> None:
+    def _schedule_mid_song(self, parsed: dict[str, str]) -> None:
         """Mid-song style: schedule a comment at a random point during playback."""
-        delay = random.randint(self._mid_song_min, self._mid_song_max)
+        delay = self._mid_song_min + int(random.random() * self._mid_song_span)
 
         async def _generate_mid_song():
-            ctx = self._build_track_context(track_info)
-            prompt_template = self._style_prompts.get("mid_song", DEFAULT_STYLE_PROMPTS["mid_song"])
-            prompt = prompt_template.format(**ctx)
+            ctx = self._build_track_context(parsed)
+            prompt = self._compiled_prompts["mid_song"](ctx)
 
             announcement = await self.ctx.llm_service.chat(prompt, system_prompt=self._system_prompt)
             await self.say(
@@ -395,7 +489,20 @@ class PresenterPlugin(DJPlugin):
                 instruct=self._voice_instruct,
             )
 
-        self.create_task(_generate_mid_song())
+        self._pending_mid_task = self.create_task(_generate_mid_song())
+
+    def _cancel_pending_announcements(self) -> None:
+        """Drop outro/mid-song generation still running for the previous track.
+
+        Saves the LLM call (and avoids a stale announcement) when a track
+        is skipped or ends before its announcement was ready. The services
+        end the dropped requests' timeline events as cancelled.
+        """
+        for task in (self._pending_outro_task, self._pending_mid_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._pending_outro_task = None
+        self._pending_mid_task = None
 
     async def _periodic_announce(self) -> None:
         """Generate a periodic ambient announcement."""
@@ -450,7 +557,6 @@ class PresenterPlugin(DJPlugin):
             state = "ON" if self._active else "OFF"
             self.logger.info(f"Presenter '{self.instance_id}' toggled: {state}")
 
-            from bridge.booth import booth
             booth.plugin_event(self.instance_id, f"Toggled {state}")
 
             styles_str = ", ".join(self._styles)
@@ -14,6 +14,9 @@ import random
 from bridge.plugins import register_plugin
 from bridge.plugins.base import DJPlugin
 
+# Random draws to try before falling back to filtering the whole library
+_MAX_TRIES = 32
+
 
 @register_plugin
 class SimplePlaylistFeeder(DJPlugin):
@@ -37,6 +40,10 @@ class SimplePlaylistFeeder(DJPlugin):
 
     async def on_start(self) -> None:
         self._no_repeat_count = self.ctx.config.get("no_repeat_count", 10)
+        # Recent-path set, rebuilt only when a new entry lands at the head
+        # of the planner's (newest-first) history
+        self._recent_head: dict | None = None
+        self._recent_set: frozenset[str] = frozenset()
         if self.ctx.playlist_planner:
             self.ctx.playlist_planner.set_feeder(self)
             self.logger.info(f"Registered as feeder (no_repeat_count={self._no_repeat_count})")
@@ -57,12 +64,24 @@ class SimplePlaylistFeeder(DJPlugin):
         if not library:
             return None
 
+        # Cold start: nothing played or queued yet, so nothing to exclude
+        if not history and not upcoming:
+            return random.choice(library)
+
         # Build exclusion set from recent history + upcoming queue
-        recent_paths = {h["file_path"] for h in history[: self._no_repeat_count]}
+        recent_paths = self._recent_paths(history)
         upcoming_paths = {t["file_path"] for t in upcoming}
         exclude = recent_paths | upcoming_paths
 
-        # Filter candidates
+        # Rejection sampling: with only a handful of exclusions almost every
+        # draw is a hit, and it stays uniform over the allowed tracks
+        n = len(library)
+        for _ in range(_MAX_TRIES):
+            track = library[random.randrange(n)]
+            if track["file_path"] not in exclude:
+                return track
+
+        # Mostly-excluded (small) library: filter candidates
         candidates = [t for t in library if t["file_path"] not in exclude]
 
         # If all tracks are excluded (small library), allow repeats from upcoming
@@ -74,3 +93,16 @@ class SimplePlaylistFeeder(DJPlugin):
             candidates = library
 
         return random.choice(candidates)
+
+    def _recent_paths(self, history: list[dict]) -> frozenset[str]:
+        """Paths of the last no_repeat_count plays.
+
+        The planner prepends a new dict for each play, so an unchanged head
+        means the set from the previous call is still valid; filling the
+        lookahead queue reuses it for every pick.
+        """
+        head = history[0] if history else None
+        if head is not self._recent_head:
+            self._recent_set = frozenset(h["file_path"] for h in history[: self._no_repeat_count])
+            self._recent_head = head
+        return self._recent_set
@@ -0,0 +1,66 @@
+"""
+RadioDan HTTP Session
+
+One aiohttp ClientSession shared by the TTS, STT and LLM services, so a
+voice round trip (STT → LLM → TTS) reuses pooled keep-alive connections
+and the DNS cache instead of each service keeping its own.
+"""
+
+import logging
+import socket
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from bridge import jsonutil
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits. The upstreams (LLM, TTS, STT) listen on separate
+# host:port pairs, so the per-host cap bounds each one independently.
+_POOL_LIMIT = 128
+_POOL_LIMIT_PER_HOST = 32
+
+# Seconds to cache DNS lookups / keep idle connections open
+_DNS_CACHE_TTL = 300
+_KEEPALIVE_TIMEOUT = 60.0
+
+_IPV4_LOOPBACK_HOSTS = frozenset({"localhost", "127.0.0.1"})
+
+_session: aiohttp.ClientSession | None = None
+
+
+def is_ipv4_loopback(*endpoints: str) -> bool:
+    """True if every endpoint URL points at localhost / 127.0.0.1."""
+    return all(urlsplit(url).hostname in _IPV4_LOOPBACK_HOSTS for url in endpoints)
+
+
+def get_shared_session(ipv4_only: bool = False) -> aiohttp.ClientSession:
+    """Return the process-wide session, creating it on first use.
+
+    With ipv4_only, "localhost" resolves straight to 127.0.0.1 instead of
+    trying ::1 first (the local model servers bind IPv4). Must be called
+    from within the running event loop.
+    """
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=_POOL_LIMIT,
+            limit_per_host=_POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=_DNS_CACHE_TTL,
+            use_dns_cache=True,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT,
+            family=socket.AF_INET if ipv4_only else socket.AF_UNSPEC,
+        )
+        _session = aiohttp.ClientSession(connector=connector, json_serialize=jsonutil.dumps)
+        logger.info(f"Shared HTTP session created (ipv4_only={ipv4_only})")
+    return _session
+
+
+async def close_shared_session() -> None:
+    """Close the process-wide session (if one was created)."""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+        logger.info("Shared HTTP session closed")
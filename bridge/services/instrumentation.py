@@ -0,0 +1,61 @@
+"""
+RadioDan Service Instrumentation
+
+Timeline events for the TTS/LLM services, written in the background so the
+SQLite insert never sits between a caller and the upstream HTTP request.
+"""
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bridge.event_store import EventStore
+
+logger = logging.getLogger(__name__)
+
+# Strong references; the event loop only keeps weak ones to running tasks
+_pending: set[asyncio.Task] = set()
+
+
+def _track(task: asyncio.Task) -> asyncio.Task:
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+    return task
+
+
+def start_event(store: "EventStore | None", **fields) -> "asyncio.Task[int] | None":
+    """Schedule store.start_event(**fields); returns the task yielding its id.
+
+    started_at is stamped now, so the event's start time is exact even
+    though the insert runs later.
+    """
+    if store is None:
+        return None
+    fields.setdefault("started_at", time.time())
+    return _track(asyncio.create_task(store.start_event(**fields)))
+
+
+def end_event(store: "EventStore | None", start: "asyncio.Task[int] | None", **fields) -> None:
+    """Schedule store.end_event(id, **fields) once the start has been written."""
+    if store is None or start is None:
+        return
+
+    async def _end() -> None:
+        try:
+            await store.end_event(await start, **fields)
+        except Exception:
+            logger.exception("Failed to record timeline event")
+
+    _track(asyncio.create_task(_end()))
+
+
+async def drain() -> None:
+    """Wait for every scheduled timeline write to finish.
+
+    Call before closing the event store, so writes still in flight at
+    shutdown are not run against a closed connection.
+    """
+    while _pending:
+        await asyncio.gather(*_pending, return_exceptions=True)
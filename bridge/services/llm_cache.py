@@ -0,0 +1,56 @@
+"""
+RadioDan LLM Response Cache
+
+Exact-match cache for chat replies. A request with the same model, system
+prompt and user message as one answered within the TTL gets the stored
+reply back without another round trip to the LLM.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+
+class LLMCache:
+    """In-memory LRU of chat replies with a per-entry time-to-live."""
+
+    def __init__(self, max_entries: int = 512, ttl: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Replies kept before the least recently used is dropped
+            ttl: Seconds a reply stays valid after it is stored
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (expires_at, reply), oldest first
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def key(model: str, system_prompt: str, user_message: str) -> str:
+        """Cache key for one chat request."""
+        raw = "\0".join((model, system_prompt, user_message)).encode()
+        return hashlib.sha256(raw).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached reply for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, reply = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return reply
+
+    def put(self, key: str, reply: str) -> None:
+        """Store a reply, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, reply)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -5,18 +5,29 @@ Provider-neutral LLM chat service using OpenAI-compatible API.
 Works with Ollama, OpenAI, Anthropic, or any compatible endpoint.
 """
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
 import aiohttp
 
+from bridge import jsonutil
 from bridge.booth import booth
+from bridge.services import instrumentation
+from bridge.services.llm_cache import LLMCache
+from bridge.textutil import clip
 
 if TYPE_CHECKING:
     from bridge.event_store import EventStore
 
 logger = logging.getLogger(__name__)
 
+# Request timeouts, built once
+_CHAT_TIMEOUT = aiohttp.ClientTimeout(total=120)  # LLM responses can be slow
+_HEALTH_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class LLMService:
     """LLM chat service (provider-neutral, OpenAI-compatible API)."""
@@ -26,6 +37,8 @@ class LLMService:
         endpoint: str,
         model: str,
         system_prompt: str = "You are a friendly AI radio assistant. Keep responses concise (1-2 sentences) since they'll be spoken aloud.",
+        session: aiohttp.ClientSession | None = None,
+        cache: LLMCache | None = None,
     ):
         """
         Initialize LLM service.
@@ -35,11 +48,19 @@ class LLMService:
                       e.g., http://localhost:11434/v1/chat/completions
             model: Model to use (e.g., "mistral", "llama3", "gpt-4o")
             system_prompt: System prompt for the assistant
+            session: Shared HTTP session; if omitted, start() creates one
+                     owned (and closed) by this service
+            cache: Optional exact-match reply cache; None disables caching
         """
         self.endpoint = endpoint
+        self._health_url = f"{endpoint.rsplit('/v1', 1)[0]}/api/tags"
         self.model = model
         self.system_prompt = system_prompt
-        self._session: aiohttp.ClientSession | None = None
+        # Reused as the first message of every chat using the default prompt
+        self._default_system_msg = {"role": "system", "content": system_prompt}
+        self._session: aiohttp.ClientSession | None = session
+        self._owns_session = False
+        self._cache = cache
         self._event_store: "EventStore | None" = None
 
     def set_event_store(self, event_store: "EventStore") -> None:
@@ -50,13 +71,15 @@ class LLMService:
         """Initialize the HTTP session."""
         if self._session is None:
             self._session = aiohttp.ClientSession()
+            self._owns_session = True
             logger.info(f"LLM service started (endpoint: {self.endpoint}, model: {self.model})")
 
     async def stop(self) -> None:
-        """Close the HTTP session."""
-        if self._session:
+        """Close the HTTP session, unless it is the shared one."""
+        if self._session and self._owns_session:
             await self._session.close()
             self._session = None
+            self._owns_session = False
             logger.info("LLM service stopped")
 
     async def chat(self, user_message: str, system_prompt: str | None = None) -> str:
@@ -76,21 +99,38 @@ class LLMService:
         if self._session is None:
             await self.start()
 
-        booth.llm_request(user_message[:50] + "..." if len(user_message) > 50 else user_message)
+        booth.llm_request(clip(user_message, 50))
         logger.info(f"LLM chat: '{user_message[:50]}...'")
 
-        eid = None
-        if self._event_store:
-            eid = await self._event_store.start_event(
-                event_type="llm_request", lane="system",
-                title=f"LLM: {user_message[:30]}..." if len(user_message) > 30 else f"LLM: {user_message}",
-                details={"message": user_message},
-            )
+        event = instrumentation.start_event(
+            self._event_store,
+            event_type="llm_request", lane="system",
+            title=f"LLM: {clip(user_message, 30)}",
+            details={"message": user_message},
+        )
+
+        effective_prompt = system_prompt or self.system_prompt
+        cache_key = None
+        if self._cache is not None:
+            cache_key = LLMCache.key(self.model, effective_prompt, user_message)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                booth.llm_response(clip(cached, 50))
+                logger.info(f"LLM response (cached): '{cached[:50]}...'")
+                instrumentation.end_event(
+                    self._event_store, event,
+                    extra_details={"response": cached[:200], "cache_hit": True},
+                )
+                return cached
+
+        system_msg = self._default_system_msg
+        if system_msg["content"] is not effective_prompt:
+            system_msg = {"role": "system", "content": effective_prompt}
 
         payload = {
             "model": self.model,
             "messages": [
-                {"role": "system", "content": system_prompt or self.system_prompt},
+                system_msg,
                 {"role": "user", "content": user_message},
             ],
         }
@@ -98,15 +138,16 @@ class LLMService:
         try:
             async with self._session.post(
                 self.endpoint,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=120),
+                data=jsonutil.dumps_bytes(payload),
+                headers=_JSON_HEADERS,
+                timeout=_CHAT_TIMEOUT,
             ) as response:
                 if response.status != 200:
                     error_text = await response.text()
                     booth.llm_error(f"API error ({response.status})")
                     raise RuntimeError(f"LLM API error ({response.status}): {error_text}")
 
-                result = await response.json()
+                result = await response.json(loads=jsonutil.loads)
 
                 choices = result.get("choices", [])
                 if not choices:
@@ -115,20 +156,29 @@ class LLMService:
                 assistant_message = choices[0].get("message", {}).get("content", "")
                 assistant_message = assistant_message.strip()
 
-                booth.llm_response(assistant_message[:50] + "..." if len(assistant_message) > 50 else assistant_message)
+                booth.llm_response(clip(assistant_message, 50))
                 logger.info(f"LLM response: '{assistant_message[:50]}...'")
+                if cache_key is not None and assistant_message:
+                    self._cache.put(cache_key, assistant_message)
 
-                if self._event_store and eid is not None:
-                    await self._event_store.end_event(
-                        eid, extra_details={"response": assistant_message[:200]},
-                    )
+                instrumentation.end_event(
+                    self._event_store, event,
+                    extra_details={"response": assistant_message[:200]},
+                )
                 return assistant_message
 
         except aiohttp.ClientError as e:
             booth.llm_error(str(e))
-            if self._event_store and eid is not None:
-                await self._event_store.end_event(eid, status="failed")
+            instrumentation.end_event(self._event_store, event, status="failed")
             raise RuntimeError(f"LLM API connection error: {e}") from e
+        except Exception:
+            # API errors, empty replies and timeouts end the event too
+            instrumentation.end_event(self._event_store, event, status="failed")
+            raise
+        except asyncio.CancelledError:
+            # Caller dropped the request (e.g. presenter on a track change)
+            instrumentation.end_event(self._event_store, event, status="cancelled")
+            raise
 
     async def health_check(self) -> bool:
         """Check if the LLM API is available."""
@@ -136,10 +186,9 @@ class LLMService:
             await self.start()
 
         try:
-            base_url = self.endpoint.rsplit("/v1", 1)[0]
             async with self._session.get(
-                f"{base_url}/api/tags",
-                timeout=aiohttp.ClientTimeout(total=5),
+                self._health_url,
+                timeout=_HEALTH_TIMEOUT,
             ) as response:
                 return response.status == 200
         except Exception:
@@ -5,6 +5,7 @@ Speech-to-Text service using Whisper API (OpenAI-compatible endpoint).
 Transcribes audio files (voice messages) to text.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 
@@ -14,32 +15,41 @@ from bridge.booth import booth
 
 logger = logging.getLogger(__name__)
 
+# Request timeouts, built once
+_TRANSCRIBE_TIMEOUT = aiohttp.ClientTimeout(total=60)  # Transcription can take time
+_HEALTH_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
 
 class STTService:
     """Speech-to-Text service using Whisper API."""
 
-    def __init__(self, endpoint: str):
+    def __init__(self, endpoint: str, session: aiohttp.ClientSession | None = None):
         """
         Initialize STT service.
 
         Args:
             endpoint: Whisper API endpoint (OpenAI-compatible)
                       e.g., http://localhost:5000/v1/audio/transcriptions
+            session: Shared HTTP session; if omitted, start() creates one
+                     owned (and closed) by this service
         """
         self.endpoint = endpoint
-        self._session: aiohttp.ClientSession | None = None
+        self._session: aiohttp.ClientSession | None = session
+        self._owns_session = False
 
     async def start(self) -> None:
         """Initialize the HTTP session."""
         if self._session is None:
             self._session = aiohttp.ClientSession()
+            self._owns_session = True
             logger.info(f"STT service started (endpoint: {self.endpoint})")
 
     async def stop(self) -> None:
-        """Close the HTTP session."""
-        if self._session:
+        """Close the HTTP session, unless it is the shared one."""
+        if self._session and self._owns_session:
             await self._session.close()
             self._session = None
+            self._owns_session = False
             logger.info("STT service stopped")
 
     async def transcribe(self, audio_path: Path) -> str:
@@ -61,12 +71,14 @@ class STTService:
         booth.whisper_start()
         logger.info(f"Transcribing: {audio_path}")
 
+        # aiohttp streams an open file in chunks, reading it off the loop
+        audio_file = await asyncio.to_thread(audio_path.open, "rb")
         try:
             # Prepare multipart form with the audio file
             form_data = aiohttp.FormData()
             form_data.add_field(
                 "file",
-                audio_path.read_bytes(),
+                audio_file,
                 filename=audio_path.name,
                 content_type="audio/ogg",
             )
@@ -75,7 +87,7 @@ class STTService:
             async with self._session.post(
                 self.endpoint,
                 data=form_data,
-                timeout=aiohttp.ClientTimeout(total=60),  # Transcription can take time
+                timeout=_TRANSCRIBE_TIMEOUT,
             ) as response:
                 if response.status != 200:
                     error_text = await response.text()
@@ -92,6 +104,8 @@ class STTService:
         except aiohttp.ClientError as e:
             booth.whisper_error(str(e))
             raise RuntimeError(f"STT API connection error: {e}") from e
+        finally:
+            audio_file.close()
 
     async def health_check(self) -> bool:
         """Check if the STT API is available."""
@@ -103,7 +117,7 @@ class STTService:
             # Most Whisper APIs don't have a dedicated health endpoint
             async with self._session.options(
                 self.endpoint,
-                timeout=aiohttp.ClientTimeout(total=5),
+                timeout=_HEALTH_TIMEOUT,
             ) as response:
                 # Accept various success codes
                 return response.status < 500
@@ -5,6 +5,7 @@ Async wrapper around the Qwen3-TTS API.
 Generates WAV audio files from text for streaming through Liquidsoap.
 """
 
+import asyncio
 import logging
 import time
 from pathlib import Path
@@ -13,12 +14,20 @@ from typing import TYPE_CHECKING
 import aiohttp
 
 from bridge.booth import booth
+from bridge.services import instrumentation
+from bridge.textutil import clip
 
 if TYPE_CHECKING:
     from bridge.event_store import EventStore
 
 logger = logging.getLogger(__name__)
 
+# Request timeouts, built once
+_HEALTH_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Bytes per read when streaming generated audio to disk
+_CHUNK_SIZE = 64 * 1024
+
 
 class TTSService:
     """Text-to-Speech service using Qwen3-TTS API."""
@@ -30,6 +39,7 @@ class TTSService:
         speaker: str = "Aiden",
         language: str = "English",
         instruct: str = "Speak calmly and clearly",
+        session: aiohttp.ClientSession | None = None,
     ):
         """
         Initialize TTS service.
@@ -40,13 +50,17 @@ class TTSService:
             speaker: Voice to use (Aiden, Ryan, etc.)
             language: Language for TTS
             instruct: Voice style instruction
+            session: Shared HTTP session; if omitted, start() creates one
+                     owned (and closed) by this service
         """
         self.endpoint = endpoint
+        self._health_url = f"{endpoint.rsplit('/', 1)[0]}/speakers"
         self.cache_dir = Path(cache_dir)
         self.speaker = speaker
         self.language = language
         self.instruct = instruct
-        self._session: aiohttp.ClientSession | None = None
+        self._session: aiohttp.ClientSession | None = session
+        self._owns_session = False
         self._event_store: "EventStore | None" = None
 
     def set_event_store(self, event_store: "EventStore") -> None:
@@ -57,13 +71,15 @@ class TTSService:
         """Initialize the HTTP session."""
         if self._session is None:
             self._session = aiohttp.ClientSession()
+            self._owns_session = True
             logger.info(f"TTS service started (endpoint: {self.endpoint})")
 
     async def stop(self) -> None:
-        """Close the HTTP session."""
-        if self._session:
+        """Close the HTTP session, unless it is the shared one."""
+        if self._session and self._owns_session:
             await self._session.close()
             self._session = None
+            self._owns_session = False
             logger.info("TTS service stopped")
 
     async def speak(
@@ -103,41 +119,64 @@ class TTSService:
         booth.tts_request(text, speaker or self.speaker)
         logger.info(f"Generating TTS: '{text[:50]}...' with speaker={speaker or self.speaker}")
 
-        eid = None
-        if self._event_store:
-            eid = await self._event_store.start_event(
-                event_type="tts_generate", lane="system",
-                title=f"TTS: {text[:30]}..." if len(text) > 30 else f"TTS: {text}",
-                details={"text": text, "speaker": speaker or self.speaker},
-            )
+        event = instrumentation.start_event(
+            self._event_store,
+            event_type="tts_generate", lane="system",
+            title=f"TTS: {clip(text, 30)}",
+            details={"text": text, "speaker": speaker or self.speaker},
+        )
 
         try:
             async with self._session.post(self.endpoint, json=payload) as response:
                 if response.status != 200:
                     error_text = await response.text()
                     booth.tts_error(f"API error ({response.status})")
-                    if self._event_store and eid is not None:
-                        await self._event_store.end_event(eid, status="failed")
                     raise RuntimeError(f"TTS API error ({response.status}): {error_text}")
 
-                # Save the WAV file
-                audio_data = await response.read()
-                output_path.write_bytes(audio_data)
+                size_bytes = await self._save_stream(response, output_path)
 
                 booth.tts_generated(str(output_path))
-                logger.info(f"TTS generated: {output_path} ({len(audio_data)} bytes)")
+                logger.info(f"TTS generated: {output_path} ({size_bytes} bytes)")
 
-                if self._event_store and eid is not None:
-                    await self._event_store.end_event(
-                        eid, extra_details={"size_bytes": len(audio_data), "path": str(output_path)},
-                    )
+                instrumentation.end_event(
+                    self._event_store, event,
+                    extra_details={"size_bytes": size_bytes, "path": str(output_path)},
+                )
                 return output_path
 
         except aiohttp.ClientError as e:
             booth.tts_error(str(e))
-            if self._event_store and eid is not None:
-                await self._event_store.end_event(eid, status="failed")
+            instrumentation.end_event(self._event_store, event, status="failed")
             raise RuntimeError(f"TTS API connection error: {e}") from e
+        except Exception:
+            # API errors, timeouts and failed writes end the event too
+            instrumentation.end_event(self._event_store, event, status="failed")
+            raise
+        except asyncio.CancelledError:
+            # Caller dropped the request (e.g. presenter on a track change)
+            instrumentation.end_event(self._event_store, event, status="cancelled")
+            raise
+
+    @staticmethod
+    async def _save_stream(response: aiohttp.ClientResponse, output_path: Path) -> int:
+        """Stream the response body into output_path; return bytes written.
+
+        Memory stays at one chunk regardless of clip length, and file writes
+        run in a worker thread so the event loop keeps serving while audio
+        arrives. A partial file is removed if the download fails.
+        """
+        f = await asyncio.to_thread(output_path.open, "wb")
+        total = 0
+        try:
+            async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                await asyncio.to_thread(f.write, chunk)
+                total += len(chunk)
+        except BaseException:
+            await asyncio.to_thread(f.close)
+            output_path.unlink(missing_ok=True)
+            raise
+        await asyncio.to_thread(f.close)
+        return total
 
     async def health_check(self) -> bool:
         """Check if the TTS API is available."""
@@ -146,8 +185,7 @@ class TTSService:
 
         try:
             # Try to reach the speakers endpoint as a health check
-            base_url = self.endpoint.rsplit("/", 1)[0]
-            async with self._session.get(f"{base_url}/speakers", timeout=aiohttp.ClientTimeout(total=5)) as response:
+            async with self._session.get(self._health_url, timeout=_HEALTH_TIMEOUT) as response:
                 return response.status == 200
         except Exception:
             return False
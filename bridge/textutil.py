@@ -0,0 +1,10 @@
+"""
+RadioDan text helpers
+
+    clip(text, n)  -> text, or its first n characters plus "..." if longer
+"""
+
+
+def clip(text: str, n: int) -> str:
+    """Shorten text to n characters (plus an ellipsis) for logs and titles."""
+    return text if len(text) <= n else text[:n] + "..."
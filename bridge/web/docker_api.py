@@ -0,0 +1,171 @@
+"""
+RadioDan Docker API Client
+
+Talks to dockerd over its UNIX socket for the system status page, so a
+poll costs an HTTP round trip rather than a docker CLI process. Each
+container gets one long-lived /containers/{name}/stats stream; the latest
+frame is kept in memory so a status poll reads a dict instead of waiting
+on `docker stats`, which samples twice before it answers.
+"""
+
+import asyncio
+import logging
+import os
+import time
+
+import aiohttp
+
+from bridge import jsonutil
+
+logger = logging.getLogger(__name__)
+
+# Base URL for requests over the UNIX socket (the host part is ignored)
+_BASE_URL = "http://docker"
+
+# Stats older than this are treated as missing (container stopped)
+_STATS_MAX_AGE = 10.0
+
+# Per-request limit for one-off API calls
+_INSPECT_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Wait between reconnects when a stream ends or dockerd is unreachable
+_RETRY_DELAY = 5.0
+
+
+def docker_socket_path() -> str:
+    """Path to the docker socket, honouring a unix:// DOCKER_HOST."""
+    host = os.environ.get("DOCKER_HOST", "")
+    if host.startswith("unix://"):
+        return host[len("unix://"):]
+    return "/var/run/docker.sock"
+
+
+def compose_container(service: str) -> str:
+    """Container name docker compose gives a service of this project."""
+    project = os.environ.get("COMPOSE_PROJECT_NAME", "radiodan")
+    return f"{project}-{service}-1"
+
+
+def _memory_bytes(frame: dict) -> int | None:
+    """Container memory in use, computed the way `docker stats` does."""
+    mem = frame.get("memory_stats") or {}
+    usage = mem.get("usage")
+    if usage is None:
+        return None
+    stats = mem.get("stats") or {}
+    # cgroup v2 reports inactive_file, v1 total_inactive_file
+    cache = stats.get("inactive_file", stats.get("total_inactive_file", 0))
+    return max(usage - cache, 0)
+
+
+def _cpu_percent(frame: dict) -> float | None:
+    """CPU usage since the previous frame, as a percentage of one core."""
+    cpu = frame.get("cpu_stats") or {}
+    pre = frame.get("precpu_stats") or {}
+    try:
+        cpu_delta = cpu["cpu_usage"]["total_usage"] - pre["cpu_usage"]["total_usage"]
+        system_delta = cpu["system_cpu_usage"] - pre["system_cpu_usage"]
+    except (KeyError, TypeError):
+        return None
+    if system_delta <= 0:
+        return None
+    cpus = cpu.get("online_cpus") or 1
+    return round(cpu_delta / system_delta * cpus * 100.0, 1)
+
+
+class DockerAPI:
+    """Docker engine API client with a cache of streamed container stats."""
+
+    def __init__(self, containers: dict[str, str], socket_path: str | None = None):
+        """
+        Initialize the client.
+
+        Args:
+            containers: Compose service -> container name, for the containers
+                to follow stats for
+            socket_path: Docker socket (default: from DOCKER_HOST or /var/run/docker.sock)
+        """
+        self.containers = containers
+        self.socket_path = socket_path or docker_socket_path()
+        self._session: aiohttp.ClientSession | None = None
+        self._tasks: list[asyncio.Task] = []
+        # container -> {"mem_bytes", "cpu_pct", "ts"}
+        self._stats: dict[str, dict] = {}
+        # Set (and replaced) whenever a stats frame arrives
+        self._updated = asyncio.Event()
+
+    async def start(self) -> None:
+        """Open the socket session and start following container stats."""
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.UnixConnector(path=self.socket_path),
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=5),
+        )
+        self._tasks = [
+            asyncio.create_task(self._follow_stats(name), name=f"docker-stats-{name}")
+            for name in self.containers.values()
+        ]
+
+    async def close(self) -> None:
+        """Stop the stats streams and close the session."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def inspect(self, container: str) -> dict | None:
+        """GET /containers/{name}/json; None if missing or dockerd unreachable."""
+        if self._session is None:
+            return None
+        url = f"{_BASE_URL}/containers/{container}/json"
+        try:
+            async with self._session.get(url, timeout=_INSPECT_TIMEOUT) as resp:
+                if resp.status != 200:
+                    logger.debug(f"docker inspect {container}: HTTP {resp.status}")
+                    return None
+                return await resp.json(loads=jsonutil.loads)
+        except Exception as e:
+            logger.debug(f"docker inspect {container}: {e}")
+            return None
+
+    async def wait_updated(self) -> None:
+        """Wait until the next stats frame arrives for any container."""
+        await self._updated.wait()
+
+    def memory(self, container: str) -> str | None:
+        """Latest memory usage for a container, formatted like `docker stats`."""
+        entry = self._stats.get(container)
+        if entry is None or time.monotonic() - entry["ts"] > _STATS_MAX_AGE:
+            return None
+        if entry["mem_bytes"] is None:
+            return None
+        return f"{entry['mem_bytes'] / (1024 * 1024):.2f}MiB"
+
+    async def _follow_stats(self, container: str) -> None:
+        """Keep one stats stream open for a container, reconnecting as needed."""
+        url = f"{_BASE_URL}/containers/{container}/stats"
+        while True:
+            try:
+                async with self._session.get(url, params={"stream": "true"}) as resp:
+                    if resp.status == 200:
+                        async for line in resp.content:
+                            if not line.strip():
+                                continue
+                            frame = jsonutil.loads(line)
+                            self._stats[container] = {
+                                "mem_bytes": _memory_bytes(frame),
+                                "cpu_pct": _cpu_percent(frame),
+                                "ts": time.monotonic(),
+                            }
+                            updated, self._updated = self._updated, asyncio.Event()
+                            updated.set()
+                    else:
+                        logger.debug(f"docker stats {container}: HTTP {resp.status}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"docker stats {container}: {e}")
+            self._stats.pop(container, None)
+            await asyncio.sleep(_RETRY_DELAY)
@@ -7,119 +7,122 @@ from aiohttp import web
 
 routes = web.RouteTableDef()
 
+# Used when the mixer can't report its levels (read-only; spread into contexts)
+_DEFAULT_VOLUMES = {
+    "music_vol": 1.0, "tts_vol": 1.0, "earcon_vol": 0.5,
+    "duck_amount": 0.15, "crossfade_duration": 5.0,
+    "duck_in_duration": 0.8, "duck_out_duration": 0.6,
+    "duck_in_curve": 0.7, "duck_out_curve": 0.3,
+}
+
+# Slider responses for whole percentages, preformatted
+_PERCENT_LABELS = tuple(f"{p}%" for p in range(101))
+
+# Star toggle swapped into #star-btn, keyed by the new starred state
+_STAR_BUTTONS = {
+    True: (
+        '<button class="star-btn starred" hx-post="/audio/unstar"'
+        ' hx-target="#star-btn" hx-swap="innerHTML">\u2605 Starred</button>'
+    ),
+    False: (
+        '<button class="star-btn" hx-post="/audio/star"'
+        ' hx-target="#star-btn" hx-swap="innerHTML">\u2606 Star</button>'
+    ),
+}
+
+# Star/unstar reply when nothing is playing
+_NO_TRACK_HTML = '<span class="flash error">No track playing</span>'
+
+
+def _form_float(data, default: float) -> float:
+    """Parse the "value" form field as a float, or return default."""
+    raw = data.get("value")
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except (ValueError, TypeError):
+        return default
+
+
+def _percent(value: float) -> str:
+    """Format a 0..1 level as a percentage label."""
+    pct = int(value * 100)
+    return _PERCENT_LABELS[pct] if 0 <= pct <= 100 else f"{pct}%"
+
 
 @routes.get("/audio")
 @aiohttp_jinja2.template("audio.html")
 async def audio_page(request: web.Request) -> dict:
     """Render the audio controls page."""
-    mixer = request.app["mixer"]
+    return await _build_audio_context(request.app["mixer"])
+
 
-    volumes = await _get_volumes(mixer)
-
-    return {
-        "page": "audio",
-        **{k: volumes[k] for k in volumes},
-        "music_muted": mixer.music_muted,
-        "tts_muted": mixer.tts_muted,
-        "random_mode": mixer.random_mode,
-    }
-
-
-async def _get_volumes(mixer):
-    """Get volumes with fallback defaults."""
-    defaults = {
-        "music_vol": 1.0, "tts_vol": 1.0, "earcon_vol": 0.5,
-        "duck_amount": 0.15, "crossfade_duration": 5.0,
-        "duck_in_duration": 0.8, "duck_out_duration": 0.6,
-        "duck_in_curve": 0.7, "duck_out_curve": 0.3,
-    }
+async def _build_audio_context(mixer) -> dict:
+    """Template context shared by the full page and the state fragment."""
     try:
-        return await mixer.get_volumes()
+        state = await mixer.get_state()
     except Exception:
-        return defaults
+        state = {
+            **_DEFAULT_VOLUMES,
+            "music_muted": mixer.music_muted,
+            "tts_muted": mixer.tts_muted,
+            "random_mode": mixer.random_mode,
+        }
+    return {"page": "audio", **state}
 
 
 @routes.get("/audio/state")
 async def audio_state(request: web.Request) -> web.Response:
-    """Return current audio state as HTMX partial."""
-    mixer = request.app["mixer"]
-    volumes = await _get_volumes(mixer)
-
-    response = aiohttp_jinja2.render_template(
-        "audio.html",
+    """Return current audio state as HTMX partial (control cards only)."""
+    return aiohttp_jinja2.render_template(
+        "_audio_controls.html",
         request,
-        {
-            "page": "audio",
-            **{k: volumes[k] for k in volumes},
-            "music_muted": mixer.music_muted,
-            "tts_muted": mixer.tts_muted,
-            "random_mode": mixer.random_mode,
-        },
+        await _build_audio_context(request.app["mixer"]),
     )
-    return response
 
 
 @routes.post("/audio/volume")
 async def set_volume(request: web.Request) -> web.Response:
     """Set music volume via HTMX."""
     mixer = request.app["mixer"]
-    data = await request.post()
-    try:
-        value = float(data.get("value", 1.0))
-    except (ValueError, TypeError):
-        value = 1.0
+    value = _form_float(await request.post(), 1.0)
     await mixer.set_music_volume(value)
-    return web.Response(text=f"{int(value * 100)}%", content_type="text/html")
+    return web.Response(text=_percent(value), content_type="text/html")
 
 
 @routes.post("/audio/tts-volume")
 async def set_tts_volume(request: web.Request) -> web.Response:
     """Set TTS volume via HTMX."""
     mixer = request.app["mixer"]
-    data = await request.post()
-    try:
-        value = float(data.get("value", 0.85))
-    except (ValueError, TypeError):
-        value = 0.85
+    value = _form_float(await request.post(), 0.85)
     await mixer.set_tts_volume(value)
-    return web.Response(text=f"{int(value * 100)}%", content_type="text/html")
+    return web.Response(text=_percent(value), content_type="text/html")
 
 
 @routes.post("/audio/earcon-volume")
 async def set_earcon_volume(request: web.Request) -> web.Response:
     """Set earcon volume via HTMX."""
     mixer = request.app["mixer"]
-    data = await request.post()
-    try:
-        value = float(data.get("value", 0.5))
-    except (ValueError, TypeError):
-        value = 0.5
+    value = _form_float(await request.post(), 0.5)
     await mixer.set_earcon_volume(value)
-    return web.Response(text=f"{int(value * 100)}%", content_type="text/html")
+    return web.Response(text=_percent(value), content_type="text/html")
 
 
 @routes.post("/audio/duck")
 async def set_duck(request: web.Request) -> web.Response:
     """Set duck amount via HTMX."""
     mixer = request.app["mixer"]
-    data = await request.post()
-    try:
-        value = float(data.get("value", 0.15))
-    except (ValueError, TypeError):
-        value = 0.15
+    value = _form_float(await request.post(), 0.15)
     await mixer.set_duck_amount(value)
-    return web.Response(text=f"{int(value * 100)}%", content_type="text/html")
+    return web.Response(text=_percent(value), content_type="text/html")
 
 
 @routes.post("/audio/crossfade")
 async def set_crossfade(request: web.Request) -> web.Response:
     """Set crossfade duration via HTMX."""
     mixer = request.app["mixer"]
-    data = await request.post()
-    try:
-        value = float(data.get("value", 5.0))
-    except (ValueError, TypeError):
-        value = 5.0
+    value = _form_float(await request.post(), 5.0)
     await mixer.set_crossfade_duration(value)
     return web.Response(text=f"{value:.1f}s", content_type="text/html")
 
@@ -128,11 +131,7 @@ async def set_crossfade(request: web.Request) -> web.Response:
 async def set_duck_in_duration(request: web.Request) -> web.Response:
     """Set duck-in duration via HTMX."""
     mixer = request.app["mixer"]
-    data = await request.post()
-    try:
-        value = float(data.get("value", 0.8))
-    except (ValueError, TypeError):
-        value = 0.8
+    value = _form_float(await request.post(), 0.8)
     await mixer.set_duck_in_duration(value)
     return web.Response(text=f"{value:.2f}s", content_type="text/html")
 
@@ -141,11 +140,7 @@ async def set_duck_in_duration(request: web.Request) -> web.Response:
 async def set_duck_out_duration(request: web.Request) -> web.Response:
     """Set duck-out duration via HTMX."""
     mixer = request.app["mixer"]
-    data = await request.post()
-    try:
-        value = float(data.get("value", 0.6))
-    except (ValueError, TypeError):
-        value = 0.6
+    value = _form_float(await request.post(), 0.6)
     await mixer.set_duck_out_duration(value)
     return web.Response(text=f"{value:.2f}s", content_type="text/html")
 
@@ -154,11 +149,7 @@ async def set_duck_out_duration(request: web.Request) -> web.Response:
 async def set_duck_in_curve(request: web.Request) -> web.Response:
     """Set duck-in bezier curve via HTMX."""
     mixer = request.app["mixer"]
-    data = await request.post()
-    try:
-        value = float(data.get("value", 0.7))
-    except (ValueError, TypeError):
-        value = 0.7
+    value = _form_float(await request.post(), 0.7)
     await mixer.set_duck_in_curve(value)
     return web.Response(text=f"{value:.2f}", content_type="text/html")
 
@@ -167,11 +158,7 @@ async def set_duck_in_curve(request: web.Request) -> web.Response:
 async def set_duck_out_curve(request: web.Request) -> web.Response:
     """Set duck-out bezier curve via HTMX."""
     mixer = request.app["mixer"]
-    data = await request.post()
-    try:
-        value = float(data.get("value", 0.3))
-    except (ValueError, TypeError):
-        value = 0.3
+    value = _form_float(await request.post(), 0.3)
     await mixer.set_duck_out_curve(value)
     return web.Response(text=f"{value:.2f}", content_type="text/html")
 
@@ -218,52 +205,32 @@ async def star_track(request: web.Request) -> web.Response:
     from bridge.booth import booth
 
     stream_context = request.app["stream_context"]
-    planner = request.app["ctx_kwargs"]["playlist_planner"]
+    planner = request.app["plugin_services"].playlist_planner
 
     track = stream_context.current_track or {}
     filename = track.get("filename", "")
     if not filename:
-        return web.Response(
-            text='<span class="flash error">No track playing</span>',
-            content_type="text/html",
-        )
+        return web.Response(text=_NO_TRACK_HTML, content_type="text/html")
 
     file_path = planner.resolve_file_path(filename)
     await planner.star_track(file_path)
     booth.track_star(track.get("artist", "Unknown"), track.get("title", "Unknown"))
 
-    html = (
-        '<button class="star-btn starred"'
-        ' hx-post="/audio/unstar"'
-        ' hx-target="#star-btn"'
-        ' hx-swap="innerHTML">'
-        '\u2605 Starred</button>'
-    )
-    return web.Response(text=html, content_type="text/html")
+    return web.Response(text=_STAR_BUTTONS[True], content_type="text/html")
 
 
 @routes.post("/audio/unstar")
 async def unstar_track(request: web.Request) -> web.Response:
     """Remove star/like from the current track via HTMX."""
     stream_context = request.app["stream_context"]
-    planner = request.app["ctx_kwargs"]["playlist_planner"]
+    planner = request.app["plugin_services"].playlist_planner
 
     track = stream_context.current_track or {}
     filename = track.get("filename", "")
     if not filename:
-        return web.Response(
-            text='<span class="flash error">No track playing</span>',
-            content_type="text/html",
-        )
+        return web.Response(text=_NO_TRACK_HTML, content_type="text/html")
 
     file_path = planner.resolve_file_path(filename)
     await planner.unstar_track(file_path)
 
-    html = (
-        '<button class="star-btn"'
-        ' hx-post="/audio/star"'
-        ' hx-target="#star-btn"'
-        ' hx-swap="innerHTML">'
-        '\u2606 Star</button>'
-    )
-    return web.Response(text=html, content_type="text/html")
+    return web.Response(text=_STAR_BUTTONS[False], content_type="text/html")
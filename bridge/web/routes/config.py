@@ -41,12 +41,22 @@ EDITABLE_SECTIONS = {
 @aiohttp_jinja2.template("config.html")
 async def config_page(request: web.Request) -> dict:
     """Render the settings page."""
-    config_store = request.app["config_store"]
+    cache = request.app["config_view_cache"]
+    if "sections" not in cache:
+        cache["sections"] = await _build_sections(request.app["config_store"])
+
+    return {
+        "page": "config",
+        "sections": cache["sections"],
+    }
+
 
-    # Load current overrides from SQLite
+async def _build_sections(config_store) -> dict:
+    """Merge stored overrides into the editable field descriptors."""
+    overrides = await config_store.get_all()
     sections = {}
     for section_key, section_meta in EDITABLE_SECTIONS.items():
-        stored = await config_store.get_section(section_key)
+        stored = overrides.get(section_key, {})
         fields = {}
         for field_key, field_meta in section_meta["fields"].items():
             fields[field_key] = {
@@ -57,11 +67,7 @@ async def config_page(request: web.Request) -> dict:
             "label": section_meta["label"],
             "fields": fields,
         }
-
-    return {
-        "page": "config",
-        "sections": sections,
-    }
+    return sections
 
 
 @routes.put("/config")
@@ -69,8 +75,11 @@ async def save_config(request: web.Request) -> web.Response:
     """Save config changes from the settings form."""
     config_store = request.app["config_store"]
     data = await request.post()
+    current = await config_store.get_all()
 
     # Parse form fields: "section.key" → (section, key, value)
+    to_set = []
+    to_delete = []
     for field_name, value in data.items():
         if "." not in field_name:
             continue
@@ -81,10 +90,17 @@ async def save_config(request: web.Request) -> web.Response:
             continue
 
         value = value.strip()
+        stored = current.get(section, {})
         if value:
-            await config_store.set(section, key, value)
-        else:
-            await config_store.delete(section, key)
+            if stored.get(key) != value:
+                to_set.append((section, key, value))
+        elif key in stored:
+            to_delete.append((section, key))
+
+    # Only touch the DB (and the cached page view) when something changed
+    if to_set or to_delete:
+        await config_store.apply(to_set, to_delete)
+        request.app["config_view_cache"].clear()
 
     if request.headers.get("HX-Request"):
         return web.Response(
@@ -9,13 +9,20 @@ Track info is lazy-loaded via HTMX to keep the initial page instant.
 
 import time as _time
 from datetime import datetime, timezone
-from pathlib import Path
+from functools import lru_cache
+from itertools import accumulate
 
-import aiohttp_jinja2
 from aiohttp import web
 
 routes = web.RouteTableDef()
 
+# Rendered now-playing fragments kept; several browsers polling within the
+# same second get the same bytes
+_NOW_PLAYING_CACHE_SIZE = 8
+
+# Shown in the hero while nothing is playing
+_NOW_PLAYING_EMPTY = b'<div class="hero-empty">No track information available</div>'
+
 
 @routes.get("/")
 async def dashboard(request: web.Request) -> web.Response:
@@ -32,11 +39,8 @@ async def dashboard(request: web.Request) -> web.Response:
         for p in plugins
     ]
 
-    env = aiohttp_jinja2.get_env(request.app)
-    template = env.get_template("dashboard.html")
-    station_name = env.globals.get("station_name", "Radio Dan")
-    html = template.render(
-        station_name=station_name,
+    html = request.app["dashboard_template"].render(
+        station_name=request.app["station_name"],
         plugins=active_plugins,
         page="dashboard",
     )
@@ -46,7 +50,8 @@ async def dashboard(request: web.Request) -> web.Response:
 @routes.get("/api/dashboard/now-playing")
 async def now_playing_partial(request: web.Request) -> web.Response:
     """Return the now-playing hero content as an HTMX partial."""
-    stream_context = request.app["stream_context"]
+    app = request.app
+    stream_context = app["stream_context"]
 
     track = stream_context.current_track or {}
     remaining = stream_context.remaining_seconds
@@ -56,75 +61,61 @@ async def now_playing_partial(request: web.Request) -> web.Response:
     is_starred = False
     file_path = track.get("filename", "")
     if file_path:
-        planner = request.app["ctx_kwargs"]["playlist_planner"]
+        planner = app["plugin_services"].playlist_planner
         is_starred = await planner.is_starred(planner.resolve_file_path(file_path))
 
     artist = track.get("artist", "")
     title = track.get("title", "")
 
     if not artist:
-        return web.Response(
-            text='<div class="hero-empty">No track information available</div>',
-            content_type="text/html",
-        )
+        return web.Response(body=_NOW_PLAYING_EMPTY, content_type="text/html", charset="utf-8")
 
-    # Build meta line
     album = track.get("album", "")
     genre = track.get("genre", "")
     year = track.get("year", "")
+
+    cache = app["now_playing_cache"]
+    key = (file_path, artist, title, album, genre, year, int(elapsed), int(remaining), is_starred)
+    body = cache.get(key)
+    if body is None:
+        body = app["now_playing_template"].render(_now_playing_context(
+            artist, title, album, genre, year, elapsed, remaining, is_starred,
+        )).encode()
+        cache[key] = body
+        if len(cache) > _NOW_PLAYING_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return web.Response(body=body, content_type="text/html", charset="utf-8")
+
+
+def _now_playing_context(
+    artist: str,
+    title: str,
+    album: str,
+    genre: str,
+    year: str,
+    elapsed: float,
+    remaining: float,
+    is_starred: bool,
+) -> dict:
+    """Build the _now_playing.html context."""
+    # Meta line: album / genre · year
     meta_parts = []
     if album:
         meta_parts.append(album)
-    genre_year = ""
-    if genre and year:
-        genre_year = f"{genre} &middot; {year}"
-    elif genre:
-        genre_year = genre
-    elif year:
-        genre_year = year
+    genre_year = " \u00b7 ".join(str(p) for p in (genre, year) if p)
     if genre_year:
         meta_parts.append(genre_year)
-    meta_line = " / ".join(meta_parts)
-
-    # Timing
-    e_min, e_sec = int(elapsed // 60), int(elapsed % 60)
-    r_min, r_sec = int(remaining // 60), int(remaining % 60)
-
-    # Star button
-    if is_starred:
-        star_html = (
-            '<button class="star-btn starred"'
-            ' hx-post="/audio/unstar"'
-            ' hx-target="#star-btn"'
-            ' hx-swap="innerHTML">'
-            '&#x2605; Starred</button>'
-        )
-    else:
-        star_html = (
-            '<button class="star-btn"'
-            ' hx-post="/audio/star"'
-            ' hx-target="#star-btn"'
-            ' hx-swap="innerHTML">'
-            '&#x2606; Star</button>'
-        )
-
-    html = f"""
-<div class="hero-artist">{artist}</div>
-<div class="hero-title">{title}</div>
-{"<div class='hero-meta'>" + meta_line + "</div>" if meta_line else ""}
-<div class="hero-timing" data-elapsed="{int(elapsed)}" data-remaining="{int(remaining)}">{e_min}:{e_sec:02d} / -{r_min}:{r_sec:02d}</div>
-<div class="hero-actions">
-  <button class="btn btn-skip"
-          hx-post="/audio/skip"
-          hx-target="#skip-status"
-          hx-swap="innerHTML">
-    &#x23ED; Skip
-  </button>
-  <span id="star-btn">{star_html}</span>
-  <span id="skip-status"></span>
-</div>
-"""
-    return web.Response(text=html, content_type="text/html")
+
+    return {
+        "artist": artist,
+        "title": title,
+        "meta_parts": meta_parts,
+        "elapsed": int(elapsed),
+        "remaining": int(remaining),
+        "is_starred": is_starred,
+    }
 
 
 def _fmt_duration(seconds: float) -> str:
@@ -139,122 +130,105 @@ def _fmt_time(ts: float) -> str:
     return t.strftime("%H:%M:%S")
 
 
-def _render_playlist_html(
+def _playlist_context(
     upcoming: list[dict],
     history: list[dict],
     current_artist: str,
     current_title: str,
     current_started_at: float,
     upcoming_start_times: list[float],
-) -> str:
-    """Build the playlist body HTML as a continuous chronological timeline.
+) -> dict:
+    """Build the _playlist_body.html context as a continuous chronological timeline.
 
     Order: oldest history → newest history → NOW → upcoming 1 → upcoming N
     """
-    parts: list[str] = []
-
     # History (reversed so oldest is on top → chronological order)
-    for t in reversed(history):
-        artist = t.get("artist", "") or "Unknown"
-        title = t.get("title", "") or "Unknown"
-        dur = _fmt_duration(t.get("duration_seconds", 0) or 0)
-        time_str = t.get("time_str", "")
-        parts.append(
-            f'<div class="pl-row pl-row-history">'
-            f'<span class="pl-time">{time_str}</span>'
-            f'<span class="pl-pos">&middot;</span>'
-            f'<span class="pl-info"><span class="pl-title">{title}</span>'
-            f'<span class="pl-artist">{artist}</span></span>'
-            f'<span class="pl-dur">{dur}</span>'
-            f'</div>'
-        )
+    history_rows = [
+        {
+            "artist": t.get("artist", "") or "Unknown",
+            "title": t.get("title", "") or "Unknown",
+            "dur": _fmt_duration(t.get("duration_seconds", 0) or 0),
+            "time_str": t.get("time_str", ""),
+        }
+        for t in reversed(history)
+    ]
 
     # Current track
+    current = None
     if current_artist or current_title:
-        now_time = _fmt_time(current_started_at) if current_started_at else ""
-        parts.append(
-            f'<div class="pl-row pl-row-current">'
-            f'<span class="pl-time">{now_time}</span>'
-            f'<span class="pl-pos pl-now-badge">NOW</span>'
-            f'<span class="pl-info"><span class="pl-title">{current_title or "Unknown"}</span>'
-            f'<span class="pl-artist">{current_artist or "Unknown"}</span></span>'
-            f'<span class="pl-dur"></span>'
-            f'</div>'
-        )
+        current = {
+            "artist": current_artist or "Unknown",
+            "title": current_title or "Unknown",
+            "time_str": _fmt_time(current_started_at) if current_started_at else "",
+        }
 
     # Upcoming
-    for i, t in enumerate(upcoming):
-        dur = _fmt_duration(t.get("duration_seconds", 0) or 0)
-        artist = t.get("artist", "") or "Unknown"
-        title = t.get("title", "") or "Unknown"
-        time_str = _fmt_time(upcoming_start_times[i]) if i < len(upcoming_start_times) else ""
-        parts.append(
-            f'<div class="pl-row">'
-            f'<span class="pl-time">{time_str}</span>'
-            f'<span class="pl-pos">{i + 1}</span>'
-            f'<span class="pl-info"><span class="pl-title">{title}</span>'
-            f'<span class="pl-artist">{artist}</span></span>'
-            f'<span class="pl-dur">{dur}</span>'
-            f'</div>'
-        )
-
-    if not parts:
-        parts.append('<div class="pl-empty">No playlist data yet</div>')
-
-    return "\n".join(parts)
+    upcoming_rows = [
+        {
+            "artist": t.get("artist", "") or "Unknown",
+            "title": t.get("title", "") or "Unknown",
+            "dur": _fmt_duration(t.get("duration_seconds", 0) or 0),
+            "time_str": _fmt_time(upcoming_start_times[i]) if i < len(upcoming_start_times) else "",
+        }
+        for i, t in enumerate(upcoming)
+    ]
+
+    return {"history": history_rows, "current": current, "upcoming": upcoming_rows}
+
+
+@lru_cache(maxsize=256)
+def _played_at_str(played_at: str) -> str:
+    """Format a played_at ISO timestamp as local HH:MM:SS.
+
+    History rows never change, so each timestamp is parsed once rather than
+    on every playlist poll.
+    """
+    if not played_at:
+        return ""
+    try:
+        dt = datetime.fromisoformat(played_at)
+    except (ValueError, TypeError):
+        return ""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone()
+    return dt.strftime("%H:%M:%S")
 
 
 @routes.get("/api/dashboard/playlist")
 async def playlist_partial(request: web.Request) -> web.Response:
     """Return playlist body as an HTMX partial."""
-    planner = request.app["ctx_kwargs"]["playlist_planner"]
-    stream_context = request.app["stream_context"]
+    app = request.app
+    planner = app["plugin_services"].playlist_planner
+    stream_context = app["stream_context"]
 
     upcoming = planner.upcoming  # list[dict] with artist, title, duration_seconds
     raw_history = await planner.get_history(limit=5)
+    track = stream_context.current_track or {}
 
     # Deduplicate: history records the now-playing track immediately on
     # advance(), so the most-recent history entry often matches the current
     # track.  Remove only the first (most recent) match so an earlier play
     # of the same track still appears in the history.
-    current_filename = (stream_context.current_track or {}).get("filename", "")
+    current_filename = track.get("filename", "")
     if current_filename:
-        current_base = Path(current_filename).name
+        current_base = current_filename.rpartition("/")[2]
         for i, h in enumerate(raw_history):
-            if Path(h.get("file_path", "")).name == current_base:
+            if h.get("file_path", "").rpartition("/")[2] == current_base:
                 raw_history = raw_history[:i] + raw_history[i + 1:]
                 break
 
     # Join history (file_path + played_at) with library to get artist/title/duration
-    library_map: dict[str, dict] = {}
-    for t in planner.library:
-        library_map[t["file_path"]] = t
-        library_map[Path(t["file_path"]).name] = t
-
     history: list[dict] = []
     for h in raw_history:
-        fp = h["file_path"]
-        lib_track = library_map.get(fp) or library_map.get(Path(fp).name, {})
-        # Parse played_at ISO timestamp to local HH:MM:SS
-        time_str = ""
-        played_at = h.get("played_at", "")
-        if played_at:
-            try:
-                dt = datetime.fromisoformat(played_at)
-                if dt.tzinfo is not None:
-                    dt = dt.astimezone()
-                time_str = dt.strftime("%H:%M:%S")
-            except (ValueError, TypeError):
-                pass
+        lib_track = planner.find_track(h["file_path"]) or {}
         history.append({
             "artist": lib_track.get("artist", ""),
             "title": lib_track.get("title", ""),
             "duration_seconds": lib_track.get("duration_seconds", 0),
-            "time_str": time_str,
+            "time_str": _played_at_str(h.get("played_at", "")),
         })
 
     # Current track
-    track = stream_context.current_track or {}
     current_artist = track.get("artist", "")
     current_title = track.get("title", "")
 
@@ -268,14 +242,13 @@ async def playlist_partial(request: web.Request) -> web.Response:
     # First upcoming starts at now + remaining (minus crossfade)
     crossfade = planner.crossfade_duration
     cursor = now + remaining - crossfade if remaining > 0 else now
-    upcoming_start_times: list[float] = []
-    for t in upcoming:
-        upcoming_start_times.append(cursor)
-        dur = t.get("duration_seconds", 180) or 180
-        cursor += dur - crossfade
+    # Each start is the previous start plus the previous track's length;
+    # accumulate() yields one extra value (the end of the last track)
+    steps = ((t.get("duration_seconds", 180) or 180) - crossfade for t in upcoming)
+    upcoming_start_times = list(accumulate(steps, initial=cursor))[:-1]
 
-    html = _render_playlist_html(
+    html = app["playlist_template"].render(_playlist_context(
         upcoming, history, current_artist, current_title,
         current_started_at, upcoming_start_times,
-    )
+    ))
     return web.Response(text=html, content_type="text/html")
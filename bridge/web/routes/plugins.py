@@ -2,30 +2,43 @@
 Plugin management routes — CRUD for plugin instances.
 """
 
+import asyncio
 import json
 import logging
 import re
+from functools import lru_cache
 
 import aiohttp_jinja2
 from aiohttp import web
 
+from bridge import jsonutil
 from bridge.plugins import get_registry, discover_plugins
 from bridge.plugins.base import PluginContext
 
 routes = web.RouteTableDef()
 
+# Characters dropped from slugs, and runs collapsed to a single hyphen
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_JOIN = re.compile(r'[\s_]+')
+
 
 def _slugify(text: str) -> str:
     """Convert text to a URL-friendly slug."""
-    text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[\s_]+', '-', text)
-    return text.strip('-')
+    return _SLUG_JOIN.sub('-', _SLUG_STRIP.sub('', text.lower().strip())).strip('-')
+
+
+@lru_cache(maxsize=None)
+def _config_fields(plugin_cls) -> tuple[dict, ...]:
+    """A plugin class's field descriptors, built once per class.
+
+    Callers must not mutate the returned dicts; copy before merging values.
+    """
+    return tuple(plugin_cls.config_fields())
 
 
 def _prepare_config_fields(plugin_cls, instance_config: dict) -> list[dict]:
     """Merge current instance config values into the plugin's field descriptors."""
-    fields = plugin_cls.config_fields()
+    fields = _config_fields(plugin_cls)
     if not fields:
         return []
 
@@ -54,63 +67,72 @@ def _prepare_config_fields(plugin_cls, instance_config: dict) -> list[dict]:
     return result
 
 
-def _parse_form_fields(plugin_cls, data) -> dict:
-    """Parse form data back into a config dict using the plugin's field descriptors."""
-    fields = plugin_cls.config_fields()
-    config = {}
+def _parse_text(field: dict, data, config: dict) -> None:
+    key = field["key"]
+    config[key] = data.get(f"field__{key}", field.get("default", ""))
 
-    for field in fields:
-        key = field["key"]
-        ftype = field["type"]
 
-        if ftype == "text":
-            config[key] = data.get(f"field__{key}", field.get("default", ""))
+def _parse_textarea(field: dict, data, config: dict) -> None:
+    key = field["key"]
+    if key.startswith("style_prompts."):
+        # Nested key: prompt__intro → config["style_prompts"]["intro"]
+        style_name = key.split(".", 1)[1]
+        val = data.get(f"prompt__{style_name}", "")
+        if val:
+            config.setdefault("style_prompts", {})[style_name] = val
+    else:
+        config[key] = data.get(f"field__{key}", field.get("default", ""))
 
-        elif ftype == "textarea":
-            if key.startswith("style_prompts."):
-                # Handled separately below
-                continue
-            config[key] = data.get(f"field__{key}", field.get("default", ""))
 
-        elif ftype == "number":
-            raw = data.get(f"field__{key}", "")
-            try:
-                config[key] = int(raw)
-            except (ValueError, TypeError):
-                config[key] = field.get("default", 0)
-
-        elif ftype == "bool":
-            config[key] = f"field__{key}" in data
-
-        elif ftype in ("select", "datetime"):
-            config[key] = data.get(f"field__{key}", field.get("default", ""))
-
-        elif ftype == "style_picker":
-            # Collect active styles and weights
-            styles = []
-            weights = {}
-            for opt in field["options"]:
-                val = opt["value"]
-                if f"style__{val}" in data:
-                    styles.append(val)
-                try:
-                    weights[val] = int(data.get(f"weight__{val}", opt["default_weight"]))
-                except (ValueError, TypeError):
-                    weights[val] = opt["default_weight"]
-            config["styles"] = styles
-            config["style_weights"] = weights
-
-    # Collect style_prompts from prompt__ fields
-    style_prompts = {}
-    for field in fields:
-        if field["type"] == "textarea" and field["key"].startswith("style_prompts."):
-            style_name = field["key"].split(".", 1)[1]
-            val = data.get(f"prompt__{style_name}", "")
-            if val:
-                style_prompts[style_name] = val
-    if style_prompts:
-        config["style_prompts"] = style_prompts
+def _parse_number(field: dict, data, config: dict) -> None:
+    key = field["key"]
+    raw = data.get(f"field__{key}", "")
+    try:
+        config[key] = int(raw)
+    except (ValueError, TypeError):
+        config[key] = field.get("default", 0)
+
+
+def _parse_bool(field: dict, data, config: dict) -> None:
+    key = field["key"]
+    config[key] = f"field__{key}" in data
+
 
+def _parse_style_picker(field: dict, data, config: dict) -> None:
+    # Collect active styles and weights
+    styles = []
+    weights = {}
+    for opt in field["options"]:
+        val = opt["value"]
+        if f"style__{val}" in data:
+            styles.append(val)
+        try:
+            weights[val] = int(data.get(f"weight__{val}", opt["default_weight"]))
+        except (ValueError, TypeError):
+            weights[val] = opt["default_weight"]
+    config["styles"] = styles
+    config["style_weights"] = weights
+
+
+# Field type → parser that writes the submitted value(s) into the config
+_FIELD_PARSERS = {
+    "text": _parse_text,
+    "textarea": _parse_textarea,
+    "number": _parse_number,
+    "bool": _parse_bool,
+    "select": _parse_text,
+    "datetime": _parse_text,
+    "style_picker": _parse_style_picker,
+}
+
+
+def _parse_form_fields(plugin_cls, data) -> dict:
+    """Parse form data back into a config dict using the plugin's field descriptors."""
+    config = {}
+    for field in _config_fields(plugin_cls):
+        parser = _FIELD_PARSERS.get(field["type"])
+        if parser is not None:
+            parser(field, data, config)
     return config
 
 
@@ -119,9 +141,8 @@ def _parse_form_fields(plugin_cls, data) -> dict:
 async def list_plugins(request: web.Request) -> dict:
     """List all plugin types and their instances."""
     config_store = request.app["config_store"]
-    plugins = request.app["plugins"]
+    plugin_by_id = request.app["plugin_by_id"]
 
-    discover_plugins()
     registry = get_registry()
 
     # Get all instances from DB
@@ -145,10 +166,17 @@ async def list_plugins(request: web.Request) -> dict:
     return {
         "page": "plugins",
         "plugin_types": plugin_types,
-        "running_ids": {p.instance_id for p in plugins},
+        "running_ids": plugin_by_id.keys(),
     }
 
 
+@routes.post("/plugins/rediscover")
+async def rediscover_plugins(request: web.Request) -> web.Response:
+    """Rescan the plugins package for newly added plugin types."""
+    await asyncio.to_thread(discover_plugins, force=True)
+    raise web.HTTPSeeOther("/plugins")
+
+
 @routes.post("/plugins/instances")
 async def create_instance(request: web.Request) -> web.Response:
     """Create a new plugin instance."""
@@ -161,7 +189,6 @@ async def create_instance(request: web.Request) -> web.Response:
     if not plugin_type or not display_name:
         raise web.HTTPBadRequest(text="plugin_type and display_name are required")
 
-    discover_plugins()
     registry = get_registry()
     if plugin_type not in registry:
         raise web.HTTPBadRequest(text=f"Unknown plugin type: {plugin_type}")
@@ -183,8 +210,8 @@ async def create_instance(request: web.Request) -> web.Response:
     config = {}
     try:
         raw_config = data.get("config", "{}")
-        config = json.loads(raw_config)
-    except json.JSONDecodeError:
+        config = jsonutil.loads(raw_config)
+    except jsonutil.JSONDecodeError:
         pass
 
     await config_store.create_instance(
@@ -211,7 +238,6 @@ async def edit_instance(request: web.Request) -> dict:
     if not instance:
         raise web.HTTPNotFound(text=f"Instance not found: {instance_id}")
 
-    discover_plugins()
     registry = get_registry()
     plugin_cls = registry.get(instance["plugin_type"])
 
@@ -246,37 +272,30 @@ async def update_instance(request: web.Request) -> web.Response:
         updates["display_name"] = data["display_name"].strip()
 
     # Check if this plugin type has config_fields
-    discover_plugins()
     registry = get_registry()
     plugin_cls = registry.get(instance["plugin_type"])
 
-    if plugin_cls and plugin_cls.config_fields():
+    if plugin_cls and _config_fields(plugin_cls):
         # Parse structured form data
         updates["config"] = _parse_form_fields(plugin_cls, data)
     elif "config" in data:
         # Fallback: parse raw JSON
         try:
-            updates["config"] = json.loads(data["config"])
-        except json.JSONDecodeError:
+            updates["config"] = jsonutil.loads(data["config"])
+        except jsonutil.JSONDecodeError:
             raise web.HTTPBadRequest(text="Invalid JSON in config")
 
     await config_store.update_instance(instance_id, **updates)
 
     # Hot-reload: restart the running plugin with new config
     plugins = request.app["plugins"]
-    ctx_kwargs = request.app["ctx_kwargs"]
+    plugin_by_id = request.app["plugin_by_id"]
+    plugin_services = request.app["plugin_services"]
     reload_msg = ""
 
-    if plugin_cls and ctx_kwargs:
+    if plugin_cls and plugin_services:
         # Find and stop the old instance
-        old_plugin = None
-        old_index = None
-        for i, p in enumerate(plugins):
-            if p.instance_id == instance_id:
-                old_plugin = p
-                old_index = i
-                break
-
+        old_plugin = plugin_by_id.get(instance_id)
         if old_plugin is not None:
             try:
                 await old_plugin.stop()
@@ -287,12 +306,13 @@ async def update_instance(request: web.Request) -> web.Response:
                 display_name = saved["display_name"] if saved else instance["display_name"]
 
                 # Create and start fresh instance
-                ctx = PluginContext(config=new_config, **ctx_kwargs)
+                ctx = PluginContext(services=plugin_services, config=new_config)
                 new_plugin = plugin_cls(ctx, instance_id=instance_id, display_name=display_name)
                 await new_plugin.start()
 
                 # Swap in the plugins list
-                plugins[old_index] = new_plugin
+                plugins[plugins.index(old_plugin)] = new_plugin
+                plugin_by_id[instance_id] = new_plugin
 
                 reload_msg = " Plugin reloaded."
             except Exception:
@@ -334,11 +354,7 @@ async def toggle_instance(request: web.Request) -> web.Response:
 
     # Return updated row partial
     instance["enabled"] = new_state
-    running_ids = {p.instance_id for p in request.app["plugins"]}
+    running_ids = request.app["plugin_by_id"].keys()
 
-    response = aiohttp_jinja2.render_template(
-        "plugins/_instance_row.html",
-        request,
-        {"instance": instance, "running_ids": running_ids},
-    )
-    return response
+    html = request.app["instance_row_template"].render(inst=instance, running_ids=running_ids)
+    return web.Response(text=html, content_type="text/html")
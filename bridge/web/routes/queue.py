@@ -5,11 +5,12 @@ Allows multiple actors (web UI, Telegram, plugins, agents) to view
 and manipulate the upcoming music queue.
 """
 
-import json
 import logging
 
 from aiohttp import web
 
+from bridge import jsonutil
+
 logger = logging.getLogger(__name__)
 
 routes = web.RouteTableDef()
@@ -28,17 +29,19 @@ def _get_planner(request: web.Request):
 async def get_queue(request: web.Request) -> web.Response:
     """Return the current upcoming queue as JSON."""
     planner = _get_planner(request)
-    upcoming = [
-        {
+    upcoming = []
+    # Feeder plugins may queue partial dicts, so keep .get() with defaults,
+    # but bind it once per row
+    for i, t in enumerate(planner.upcoming):
+        get = t.get
+        upcoming.append({
             "position": i,
-            "artist": t.get("artist", ""),
-            "title": t.get("title", ""),
-            "duration_seconds": t.get("duration_seconds", 0),
-            "file_path": t.get("file_path", ""),
-        }
-        for i, t in enumerate(planner.upcoming)
-    ]
-    return web.json_response({"queue": upcoming, "count": len(upcoming)})
+            "artist": get("artist", ""),
+            "title": get("title", ""),
+            "duration_seconds": get("duration_seconds", 0),
+            "file_path": get("file_path", ""),
+        })
+    return web.json_response({"queue": upcoming, "count": len(upcoming)}, dumps=jsonutil.dumps)
 
 
 @routes.post("/api/queue")
@@ -49,8 +52,8 @@ async def insert_track(request: web.Request) -> web.Response:
     position is optional (defaults to append).
     """
     try:
-        body = await request.json()
-    except json.JSONDecodeError:
+        body = await request.json(loads=jsonutil.loads)
+    except jsonutil.JSONDecodeError:
         raise web.HTTPBadRequest(text="Invalid JSON")
 
     file_path = body.get("file_path")
@@ -70,7 +73,7 @@ async def insert_track(request: web.Request) -> web.Response:
     if not success:
         raise web.HTTPNotFound(text="Track not found in music library")
 
-    return web.json_response({"ok": True, "queue_length": len(planner.upcoming)})
+    return web.json_response({"ok": True, "queue_length": len(planner.upcoming)}, dumps=jsonutil.dumps)
 
 
 @routes.delete("/api/queue/{position}")
@@ -95,7 +98,7 @@ async def remove_track(request: web.Request) -> web.Response:
             "file_path": removed.get("file_path", ""),
         },
         "queue_length": len(planner.upcoming),
-    })
+    }, dumps=jsonutil.dumps)
 
 
 @routes.post("/api/queue/reorder")
@@ -105,8 +108,8 @@ async def reorder_track(request: web.Request) -> web.Response:
     Body: {"from": N, "to": M}
     """
     try:
-        body = await request.json()
-    except json.JSONDecodeError:
+        body = await request.json(loads=jsonutil.loads)
+    except jsonutil.JSONDecodeError:
         raise web.HTTPBadRequest(text="Invalid JSON")
 
     try:
@@ -121,4 +124,4 @@ async def reorder_track(request: web.Request) -> web.Response:
     if not success:
         raise web.HTTPBadRequest(text="Invalid positions")
 
-    return web.json_response({"ok": True, "queue_length": len(planner.upcoming)})
+    return web.json_response({"ok": True, "queue_length": len(planner.upcoming)}, dumps=jsonutil.dumps)
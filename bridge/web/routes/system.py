@@ -1,7 +1,8 @@
 """
 System status & restart routes.
 
-GET  /api/system/status   — JSON process info (HTMX polling target)
+GET  /api/system/status   — Status table rows (HTML partial)
+GET  /api/system/status/stream — Status table rows pushed over SSE
 POST /system/restart       — Restart all services (detached)
 POST /system/restart-docker — Restart Docker containers only
 POST /system/restart-python — Restart Python bridge only (detached)
@@ -11,14 +12,37 @@ import asyncio
 import logging
 import os
 import time
+from datetime import datetime, timezone
+from functools import lru_cache
 
 import aiohttp_jinja2
 from aiohttp import web
+from markupsafe import escape
+
+from bridge.web.docker_api import DockerAPI
 
 logger = logging.getLogger(__name__)
 
 routes = web.RouteTableDef()
 
+# Seconds a gathered process snapshot is reused across status polls
+_PROCESS_INFO_TTL = 1.0
+
+# One <tr> of the system status table: name, badge class, status, pid,
+# uptime, memory
+_STATUS_ROW = (
+    '<tr><td>%s</td><td><span class="badge %s">%s</span></td>'
+    '<td class="mono">%s</td><td class="mono">%s</td><td class="mono">%s</td></tr>'
+)
+
+# Status stream: minimum gap between pushes, and the longest wait for a
+# docker stats frame before re-checking anyway
+_STATUS_STREAM_INTERVAL = 2.0
+_STATUS_STREAM_IDLE = 10.0
+
+# /proc/self/statm counts pages
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
 
 def _format_uptime(seconds: float) -> str:
     """Format seconds into a human-readable uptime string."""
@@ -34,63 +58,71 @@ def _format_uptime(seconds: float) -> str:
 
 
 def _read_self_rss_mb() -> float | None:
-    """Read RSS memory of current process from /proc/self/status (Linux)."""
+    """Read RSS memory of current process from /proc/self/statm (Linux)."""
     try:
-        with open("/proc/self/status") as f:
-            for line in f:
-                if line.startswith("VmRSS:"):
-                    # VmRSS:    12345 kB
-                    kb = int(line.split()[1])
-                    return round(kb / 1024, 1)
+        fd = os.open("/proc/self/statm", os.O_RDONLY)
+        try:
+            # "size resident shared text lib data dt", in pages
+            buf = os.read(fd, 256)
+        finally:
+            os.close(fd)
+        resident_pages = int(buf.split(None, 2)[1])
     except (OSError, ValueError, IndexError):
-        pass
-    return None
+        return None
+    return round(resident_pages * _PAGE_SIZE / (1024 * 1024), 1)
 
 
-async def _docker_info(container: str) -> dict:
-    """Get PID, status, and started-at for a Docker container."""
-    info = {"name": container, "status": "stopped", "pid": None, "uptime": None, "memory": None}
-    try:
-        proc = await asyncio.create_subprocess_exec(
-            "docker", "inspect",
-            "--format", "{{.State.Pid}} {{.State.Status}} {{.State.StartedAt}}",
-            container,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
-        if proc.returncode == 0:
-            parts = stdout.decode().strip().split(None, 2)
-            if len(parts) >= 2:
-                info["pid"] = int(parts[0]) if parts[0] != "0" else None
-                info["status"] = parts[1]  # "running", "exited", etc.
-            if len(parts) >= 3:
-                # Parse ISO timestamp for uptime
-                from datetime import datetime, timezone
-                started_str = parts[2].split(".")[0]  # Trim fractional seconds
-                started = datetime.fromisoformat(started_str).replace(tzinfo=timezone.utc)
-                info["uptime"] = _format_uptime(time.time() - started.timestamp())
-    except (asyncio.TimeoutError, Exception) as e:
-        logger.debug(f"docker inspect {container}: {e}")
-
-    # Memory via docker stats (separate call — inspect doesn't include it)
+@lru_cache(maxsize=16)
+def _started_epoch(started_at: str) -> float | None:
+    """Parse a container's State.StartedAt into a unix timestamp.
+
+    The string only changes when the container restarts, so each value is
+    parsed once.
+    """
+    # Never-started containers report the zero time, 0001-01-01T00:00:00Z
+    if not started_at or started_at.startswith("0001-"):
+        return None
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "docker", "stats", "--no-stream", "--format", "{{.MemUsage}}", container,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
-        if proc.returncode == 0:
-            # Output like "12.34MiB / 1.94GiB"
-            info["memory"] = stdout.decode().strip().split("/")[0].strip()
-    except (asyncio.TimeoutError, Exception) as e:
-        logger.debug(f"docker stats {container}: {e}")
+        # Trim fractional seconds (nanoseconds) and the trailing Z
+        started = datetime.fromisoformat(started_at.split(".")[0].rstrip("Z"))
+    except ValueError:
+        return None
+    return started.replace(tzinfo=timezone.utc).timestamp()
+
+
+async def _docker_info(container: str, docker: DockerAPI) -> dict:
+    """Get PID, status, uptime and memory for a Docker container."""
+    info = {"name": container, "status": "stopped", "pid": None, "uptime": None, "memory": None}
+    data = await docker.inspect(container)
+    if data:
+        state = data.get("State") or {}
+        info["pid"] = state.get("Pid") or None
+        info["status"] = state.get("Status", "stopped")  # "running", "exited", etc.
+        started = _started_epoch(state.get("StartedAt", ""))
+        if started is not None:
+            info["uptime"] = _format_uptime(time.time() - started)
+
+    # Memory from the streamed stats (inspect doesn't include it)
+    info["memory"] = docker.memory(container)
 
     return info
 
 
 async def get_process_info(app: web.Application) -> dict:
+    """Process information, gathered at most once per _PROCESS_INFO_TTL.
+
+    Callers that arrive while a gather is running wait for that one
+    instead of starting their own.
+    """
+    cache = app["process_info_cache"]
+    task = cache.get("task")
+    if task is None or (task.done() and time.monotonic() - cache["at"] >= _PROCESS_INFO_TTL):
+        cache["at"] = time.monotonic()
+        task = cache["task"] = asyncio.create_task(_gather_process_info(app))
+    return await asyncio.shield(task)
+
+
+async def _gather_process_info(app: web.Application) -> dict:
     """Gather system process information for Python bridge + Docker containers."""
     # Python bridge info
     start_time = app.get("start_time", time.time())
@@ -102,12 +134,13 @@ async def get_process_info(app: web.Application) -> dict:
         "memory": _read_self_rss_mb(),
     }
 
-    # Docker containers in parallel — use COMPOSE_PROJECT_NAME to find containers
-    project = os.environ.get("COMPOSE_PROJECT_NAME", "radiodan")
-    icecast_info, liquidsoap_info = await asyncio.gather(
-        _docker_info(f"{project}-icecast-1"),
-        _docker_info(f"{project}-liquidsoap-1"),
-    )
+    # Docker containers in parallel
+    docker = app["docker"]
+    async with asyncio.TaskGroup() as tg:
+        icecast_task = tg.create_task(_docker_info(docker.containers["icecast"], docker))
+        liquidsoap_task = tg.create_task(_docker_info(docker.containers["liquidsoap"], docker))
+    icecast_info = icecast_task.result()
+    liquidsoap_info = liquidsoap_task.result()
     icecast_info["name"] = "Icecast"
     liquidsoap_info["name"] = "Liquidsoap"
 
@@ -129,15 +162,70 @@ async def system_page(request: web.Request) -> dict:
 @routes.get("/api/system/status")
 async def system_status_api(request: web.Request) -> web.Response:
     """Return system status as an HTMX partial (HTML table rows)."""
-    procs = await get_process_info(request.app)
+    rows = await _status_rows(request.app)
+    return web.Response(body=rows, content_type="text/html", charset="utf-8")
+
+
+@routes.get("/api/system/status/stream")
+async def system_status_stream(request: web.Request) -> web.StreamResponse:
+    """SSE endpoint: pushes the status table rows whenever they change.
+
+    Wakes on each docker stats frame (at most every _STATUS_STREAM_INTERVAL
+    seconds), or after _STATUS_STREAM_IDLE seconds if dockerd is silent.
+    """
+    app = request.app
+    docker = app["docker"]
+
+    response = web.StreamResponse(
+        headers={
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+    await response.prepare(request)
+
+    last_rows = None
+    try:
+        while True:
+            rows = await _status_rows(app)
+            if rows != last_rows:
+                last_rows = rows
+                # Multi-line data needs a "data: " prefix on every line
+                await response.write(
+                    b"event: status\ndata: " + rows.replace(b"\n", b"\ndata: ") + b"\n\n"
+                )
+            await asyncio.sleep(_STATUS_STREAM_INTERVAL)
+            try:
+                async with asyncio.timeout(_STATUS_STREAM_IDLE):
+                    await docker.wait_updated()
+            except TimeoutError:
+                pass
+    except (ConnectionResetError, ConnectionError, asyncio.CancelledError):
+        pass
 
+    return response
+
+
+async def _status_rows(app: web.Application) -> bytes:
+    """Rendered status rows for the current process snapshot."""
+    procs = await get_process_info(app)
+
+    # Requests sharing a snapshot share its rendered rows too
+    cache = app["process_info_cache"]
+    if cache.get("rows_for") is not procs:
+        cache["rows"] = _render_status_rows(procs)
+        cache["rows_for"] = procs
+    return cache["rows"]
+
+
+def _render_status_rows(procs: dict) -> bytes:
+    """Render the system status table rows for a process snapshot."""
     rows = []
     for key in ("python", "liquidsoap", "icecast"):
         p = procs[key]
         status_class = "badge-ok" if p["status"] == "running" else "badge-err"
-        status_label = p["status"].capitalize()
-        pid = p["pid"] or "—"
-        uptime = p["uptime"] or "—"
         mem = p["memory"]
         if isinstance(mem, float):
             mem_str = f"{mem} MB"
@@ -145,19 +233,15 @@ async def system_status_api(request: web.Request) -> web.Response:
             mem_str = mem
         else:
             mem_str = "—"
-
-        rows.append(
-            f'<tr>'
-            f'<td>{p["name"]}</td>'
-            f'<td><span class="badge {status_class}">{status_label}</span></td>'
-            f'<td class="mono">{pid}</td>'
-            f'<td class="mono">{uptime}</td>'
-            f'<td class="mono">{mem_str}</td>'
-            f'</tr>'
-        )
-
-    html = "\n".join(rows)
-    return web.Response(text=html, content_type="text/html")
+        rows.append(_STATUS_ROW % (
+            escape(p["name"]),
+            status_class,
+            escape(p["status"].capitalize()),
+            p["pid"] or "—",
+            p["uptime"] or "—",
+            escape(mem_str),
+        ))
+    return "\n".join(rows).encode()
 
 
 @routes.post("/system/restart-docker")
@@ -211,8 +295,12 @@ _RECONNECT_HTML = """
 """
 
 
-def _open_log() -> int:
-    """Open the station log file for appending, return the file descriptor."""
+def open_station_log() -> int:
+    """Open the station log file for appending, return the file descriptor.
+
+    The web app opens it once at startup (app["log_fd"]) so the restart
+    handlers don't do blocking file I/O on the event loop.
+    """
     station = os.environ.get("STATION", "unknown")
     return os.open(f"/tmp/radiodan-{station}.log", os.O_WRONLY | os.O_CREAT | os.O_APPEND)
 
@@ -227,7 +315,7 @@ async def restart_python(request: web.Request) -> web.Response:
             content_type="text/html",
         )
 
-    log_fd = _open_log()
+    log_fd = request.app["log_fd"]
     await asyncio.create_subprocess_exec(
         "bash", str(project_root / "run_radiodan.sh"), "restart-pyhost",
         cwd=str(project_root),
@@ -235,7 +323,6 @@ async def restart_python(request: web.Request) -> web.Response:
         stderr=log_fd,
         start_new_session=True,
     )
-    os.close(log_fd)
     logger.info("Python bridge restart triggered from web UI")
 
     return web.Response(text=_RECONNECT_HTML, content_type="text/html")
@@ -251,7 +338,7 @@ async def restart_all(request: web.Request) -> web.Response:
             content_type="text/html",
         )
 
-    log_fd = _open_log()
+    log_fd = request.app["log_fd"]
     await asyncio.create_subprocess_exec(
         "bash", str(project_root / "run_radiodan.sh"), "restart",
         cwd=str(project_root),
@@ -259,7 +346,6 @@ async def restart_all(request: web.Request) -> web.Response:
         stderr=log_fd,
         start_new_session=True,
     )
-    os.close(log_fd)
     logger.info("Full restart triggered from web UI")
 
     return web.Response(text=_RECONNECT_HTML, content_type="text/html")
@@ -5,24 +5,93 @@ DAW-like 3D timeline visualization with Server-Sent Events for live updates.
 """
 
 import asyncio
-import json
 import time
 
+import aiohttp_jinja2
 from aiohttp import web
 
+from bridge import jsonutil
+
 routes = web.RouteTableDef()
 
+# Seconds between playback_state refreshes, so upcoming tracks stay positioned
+_PLAYBACK_STATE_INTERVAL = 3.0
+
+# playback_state frame; the payload is four numbers, so it is formatted
+# directly rather than built as a dict and serialized
+_PLAYBACK_STATE_FRAME = (
+    b'event: playback_state\ndata: {"server_time": %r, "elapsed": %r, '
+    b'"remaining": %r, "crossfade_duration": %r}\n\n'
+)
+
+# SSE framing around the JSON payloads
+_SNAPSHOT_PREFIX = b"event: snapshot\ndata: "
+_EVENT_UPDATE_PREFIX = b"event: event_update\ndata: "
+_FRAME_END = b"\n\n"
+
+
+def _playback_state_frame(stream_context, now: float) -> bytes:
+    """Encode the current playback timing as an SSE frame."""
+    return _PLAYBACK_STATE_FRAME % (
+        float(now),
+        float(stream_context.elapsed_seconds),
+        float(stream_context.remaining_seconds),
+        float(stream_context.crossfade_duration),
+    )
+
+
+class _PlaybackTicker:
+    """Builds the playback_state frame once per interval for all SSE clients.
+
+    One ticker runs per StreamContext while at least one client is
+    connected; clients wait on a shared wakeup event, the same way
+    EventSubscription waits on the EventStore.
+    """
+
+    _active: dict[object, "_PlaybackTicker"] = {}
+
+    def __init__(self, stream_context):
+        self._stream_context = stream_context
+        self._clients = 0
+        self._frame = b""
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    @classmethod
+    def acquire(cls, stream_context) -> "_PlaybackTicker":
+        """Return the running ticker for stream_context, starting one if needed."""
+        ticker = cls._active.get(stream_context)
+        if ticker is None:
+            ticker = cls._active[stream_context] = cls(stream_context)
+        ticker._clients += 1
+        return ticker
+
+    def release(self) -> None:
+        """Drop one client; the last one out stops the ticker."""
+        self._clients -= 1
+        if self._clients <= 0:
+            self._task.cancel()
+            if self._active.get(self._stream_context) is self:
+                del self._active[self._stream_context]
+
+    async def next_frame(self) -> bytes:
+        """Wait for the next tick and return its frame."""
+        await self._wakeup.wait()
+        return self._frame
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(_PLAYBACK_STATE_INTERVAL)
+            self._frame = _playback_state_frame(self._stream_context, time.time())
+            wakeup, self._wakeup = self._wakeup, asyncio.Event()
+            wakeup.set()
+
 
 @routes.get("/timeline")
-async def timeline_page(request: web.Request) -> web.Response:
+@aiohttp_jinja2.template("timeline.html")
+async def timeline_page(request: web.Request) -> dict:
     """Render the timeline page (extends base.html)."""
-    import aiohttp_jinja2
-
-    env = aiohttp_jinja2.get_env(request.app)
-    template = env.get_template("timeline.html")
-    station_name = env.globals.get("station_name", "Radio Dan")
-    html = template.render(station_name=station_name, page="timeline")
-    return web.Response(text=html, content_type="text/html")
+    return {"page": "timeline"}
 
 
 @routes.get("/api/timeline/events")
@@ -41,53 +110,44 @@ async def timeline_sse(request: web.Request) -> web.StreamResponse:
     )
     await response.prepare(request)
 
-    # 1. Send snapshot: last 30 minutes + all scheduled future events
+    # 1. Snapshot: last 30 minutes + all scheduled future events
     now = time.time()
     window = await event_store.get_window(now - 1800, now + 86400)
-    await response.write(f"event: snapshot\ndata: {json.dumps(window)}\n\n".encode())
-
-    # 2. Send current playback state for time synchronization
-    planner = stream_context._planner
-    crossfade = planner.crossfade_duration if planner else 5.0
-    state = {
-        "server_time": now,
-        "elapsed": stream_context.elapsed_seconds,
-        "remaining": stream_context.remaining_seconds,
-        "crossfade_duration": crossfade,
-    }
-    await response.write(f"event: playback_state\ndata: {json.dumps(state)}\n\n".encode())
-
-    # 3. Stream live events with periodic playback state refresh
-    queue = event_store.subscribe()
-    last_playback_push = time.time()
+
+    # 2. Current playback state for time synchronization; both frames go
+    # out in a single write
+    await response.write(b"".join((
+        _SNAPSHOT_PREFIX, jsonutil.dumps_bytes(window), _FRAME_END,
+        _playback_state_frame(stream_context, now),
+    )))
+
+    # 3. Stream live events, plus the shared playback state refresh
+    subscription = event_store.subscribe()
+    ticker = _PlaybackTicker.acquire(stream_context)
+    batch_task = asyncio.ensure_future(subscription.get_batch())
+    tick_task = asyncio.ensure_future(ticker.next_frame())
     try:
         while True:
-            try:
-                msg = await asyncio.wait_for(queue.get(), timeout=3)
-                await response.write(
-                    f"event: event_update\ndata: {json.dumps(msg)}\n\n".encode()
-                )
-            except asyncio.TimeoutError:
-                pass
-
-            # Refresh playback state every ~3 seconds so upcoming tracks stay positioned
-            now = time.time()
-            if now - last_playback_push >= 3:
-                last_playback_push = now
-                planner = stream_context._planner
-                crossfade = planner.crossfade_duration if planner else 5.0
-                pb_state = {
-                    "server_time": now,
-                    "elapsed": stream_context.elapsed_seconds,
-                    "remaining": stream_context.remaining_seconds,
-                    "crossfade_duration": crossfade,
-                }
-                await response.write(
-                    f"event: playback_state\ndata: {json.dumps(pb_state)}\n\n".encode()
-                )
+            await asyncio.wait((batch_task, tick_task), return_when=asyncio.FIRST_COMPLETED)
+
+            frames: list[bytes] = []
+            if batch_task.done():
+                # One wakeup drains every message published since the last one
+                for payload in batch_task.result():
+                    frames += (_EVENT_UPDATE_PREFIX, payload, _FRAME_END)
+                batch_task = asyncio.ensure_future(subscription.get_batch())
+            if tick_task.done():
+                frames.append(tick_task.result())
+                tick_task = asyncio.ensure_future(ticker.next_frame())
+
+            # Everything due this wakeup goes out in one write
+            await response.write(b"".join(frames))
     except (ConnectionResetError, ConnectionError, asyncio.CancelledError):
         pass
     finally:
-        event_store.unsubscribe(queue)
+        batch_task.cancel()
+        tick_task.cancel()
+        ticker.release()
+        event_store.unsubscribe(subscription)
 
     return response
@@ -5,8 +5,11 @@ aiohttp-based web admin GUI with HTMX for interactivity.
 Runs on port 49995 alongside the Telegram bot.
 """
 
+import asyncio
 import logging
+import os
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,12 +17,14 @@ import aiohttp_jinja2
 import jinja2
 from aiohttp import web
 
+from bridge.web.docker_api import DockerAPI, compose_container
+
 if TYPE_CHECKING:
     from bridge.config_store import ConfigStore
     from bridge.event_store import EventStore
     from bridge.audio.mixer import LiquidsoapMixer
     from bridge.audio.stream_context import StreamContext
-    from bridge.plugins.base import DJPlugin
+    from bridge.plugins.base import DJPlugin, SharedPluginServices
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +42,7 @@ class WebServer:
         stream_context: "StreamContext",
         plugins: list["DJPlugin"],
         event_store: "EventStore | None" = None,
-        ctx_kwargs: dict | None = None,
+        plugin_services: "SharedPluginServices | None" = None,
         station_name: str = "Radio Dan",
         stream_url: str = "",
         host: str = "0.0.0.0",
@@ -58,7 +63,11 @@ class WebServer:
         self.app["mixer"] = mixer
         self.app["stream_context"] = stream_context
         self.app["plugins"] = plugins
-        self.app["ctx_kwargs"] = ctx_kwargs or {}
+        # Running plugins by instance_id; kept in step with the list
+        self.app["plugin_by_id"] = {p.instance_id: p for p in plugins}
+        self.app["plugin_services"] = plugin_services
+        # Settings page view, built on first GET and dropped on save
+        self.app["config_view_cache"] = {}
         if event_store is not None:
             self.app["event_store"] = event_store
 
@@ -72,9 +81,59 @@ class WebServer:
         env.globals["stream_url"] = stream_url
         env.globals["cache_v"] = str(int(time.time()))
 
+        # Dashboard page and its polled partials; compiled once up front
+        self.app["station_name"] = station_name
+        self.app["dashboard_template"] = env.get_template("dashboard.html")
+        self.app["playlist_template"] = env.get_template("_playlist_body.html")
+        self.app["now_playing_template"] = env.get_template("_now_playing.html")
+        self.app["now_playing_cache"] = OrderedDict()
+        # Plugin list row, re-rendered on every enable/disable toggle
+        self.app["instance_row_template"] = env.get_template("plugins/_instance_row.html")
+
+        # Plugin types are scanned once at startup, not per request
+        self.app.on_startup.append(self._discover_plugins)
+
+        # Container status for the system page, streamed from dockerd.
+        # Names are resolved here, once, after the station .env is loaded
+        self.app["docker"] = DockerAPI({
+            service: compose_container(service) for service in ("icecast", "liquidsoap")
+        })
+        self.app.on_startup.append(self._start_docker)
+        self.app.on_cleanup.append(self._close_docker)
+        # Restart handlers hand this to their detached subprocesses
+        self.app.on_startup.append(self._open_log)
+        self.app.on_cleanup.append(self._close_log)
+        # Latest process snapshot for the system page (see get_process_info)
+        self.app["process_info_cache"] = {}
+
         # Set up routes
         self._setup_routes()
 
+    @staticmethod
+    async def _discover_plugins(app: web.Application) -> None:
+        """Import every plugin module so the plugin pages see all types."""
+        from bridge.plugins import discover_plugins
+
+        await asyncio.to_thread(discover_plugins)
+
+    @staticmethod
+    async def _start_docker(app: web.Application) -> None:
+        await app["docker"].start()
+
+    @staticmethod
+    async def _close_docker(app: web.Application) -> None:
+        await app["docker"].close()
+
+    @staticmethod
+    async def _open_log(app: web.Application) -> None:
+        from bridge.web.routes.system import open_station_log
+
+        app["log_fd"] = await asyncio.to_thread(open_station_log)
+
+    @staticmethod
+    async def _close_log(app: web.Application) -> None:
+        os.close(app["log_fd"])
+
     def _setup_routes(self) -> None:
         """Register all route handlers."""
         from bridge.web.routes.dashboard import routes as dashboard_routes
@@ -102,10 +161,15 @@ class WebServer:
         """Update the plugin list (called after hot-reload)."""
         self.plugins = plugins
         self.app["plugins"] = plugins
+        plugin_by_id = self.app["plugin_by_id"]
+        plugin_by_id.clear()
+        plugin_by_id.update((p.instance_id, p) for p in plugins)
 
     async def start(self) -> None:
         """Start the web server."""
-        self._runner = web.AppRunner(self.app)
+        # No per-request access log; the UI's HTMX requests would add a
+        # formatted line each
+        self._runner = web.AppRunner(self.app, access_log=None)
         await self._runner.setup()
         site = web.TCPSite(self._runner, self.host, self.port)
         await site.start()
@@ -1,4 +1,4 @@
-"""Shared fixtures for RadioDan timeline tests."""
+"""Shared fixtures for RadioDan store and timeline tests."""
 
 import asyncio
 from pathlib import Path
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock
 import pytest
 from aiohttp import web
 
+from bridge.config_store import ConfigStore
 from bridge.event_store import EventStore
 from bridge.web.routes.timeline import routes as timeline_routes
 
@@ -20,6 +21,15 @@ async def event_store():
     await store.close()
 
 
+@pytest.fixture
+async def config_store():
+    """In-memory ConfigStore, opened and closed per test."""
+    store = ConfigStore()
+    await store.open(Path(":memory:"))
+    yield store
+    await store.close()
+
+
 @pytest.fixture
 def mock_stream_context():
     """Mock StreamContext with fixed timing values."""
@@ -27,6 +37,7 @@ def mock_stream_context():
     ctx.elapsed_seconds = 42.5
     ctx.remaining_seconds = 197.3
     ctx._planner = None
+    ctx.crossfade_duration = 5.0
     ctx.upcoming_tracks = []
     return ctx
 
@@ -47,18 +58,18 @@ async def read_sse_frames(response, count=1, timeout=2.0):
     Each frame is returned as a dict with 'event' and 'data' keys.
     """
     frames = []
-    buffer = b""
+    buffer = bytearray()
 
     async def _read():
-        nonlocal buffer
         while len(frames) < count:
             chunk = await response.content.read(4096)
             if not chunk:
                 break
-            buffer += chunk
+            buffer.extend(chunk)
             # Split on double-newline (SSE frame separator)
-            while b"\n\n" in buffer:
-                raw_frame, buffer = buffer.split(b"\n\n", 1)
+            while (idx := buffer.find(b"\n\n")) != -1:
+                raw_frame = buffer[:idx]
+                del buffer[:idx + 2]
                 frame = _parse_sse_frame(raw_frame.decode())
                 if frame:
                     frames.append(frame)
@@ -0,0 +1,177 @@
+"""Tests for ConfigStore — general config and plugin instance CRUD."""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from bridge.config_store import ConfigStore
+
+
+# =========================================================================
+# PLUGIN INSTANCES — toggle_instance
+# =========================================================================
+
+
+async def test_toggle_instance_flips_state(config_store):
+    await config_store.create_instance("chill-dj", "presenter", "Chill DJ")
+
+    assert await config_store.toggle_instance("chill-dj") is False
+    assert (await config_store.get_instance("chill-dj"))["enabled"] is False
+
+    assert await config_store.toggle_instance("chill-dj") is True
+    assert (await config_store.get_instance("chill-dj"))["enabled"] is True
+
+
+async def test_toggle_instance_unknown_raises(config_store):
+    with pytest.raises(ValueError):
+        await config_store.toggle_instance("nope")
+
+
+# =========================================================================
+# GENERAL CONFIG
+# =========================================================================
+
+
+async def test_get_returns_default_when_missing(config_store):
+    assert await config_store.get("audio", "music_vol", default=0.7) == 0.7
+    # A cached miss still honours the caller's default
+    assert await config_store.get("audio", "music_vol", default=0.5) == 0.5
+
+
+async def test_set_then_get_and_delete(config_store):
+    assert await config_store.get("audio", "music_vol") is None
+
+    await config_store.set("audio", "music_vol", 0.8)
+    assert await config_store.get("audio", "music_vol") == 0.8
+
+    await config_store.set("audio", "music_vol", 0.6)
+    assert await config_store.get("audio", "music_vol") == 0.6
+
+    await config_store.delete("audio", "music_vol")
+    assert await config_store.get("audio", "music_vol", default=1.0) == 1.0
+
+
+async def test_get_section_reflects_writes(config_store):
+    await config_store.set("tts", "speaker", "Aiden")
+    assert await config_store.get_section("tts") == {"speaker": "Aiden"}
+
+    await config_store.set("tts", "language", "English")
+    assert await config_store.get_section("tts") == {"speaker": "Aiden", "language": "English"}
+
+    await config_store.delete("tts", "speaker")
+    assert await config_store.get_section("tts") == {"language": "English"}
+
+
+async def test_get_section_returns_copy(config_store):
+    await config_store.set("tts", "speaker", "Aiden")
+    section = await config_store.get_section("tts")
+    section["speaker"] = "Ryan"
+    assert await config_store.get_section("tts") == {"speaker": "Aiden"}
+
+
+async def test_get_all_groups_by_section(config_store):
+    await config_store.set("tts", "speaker", "Aiden")
+    await config_store.set("llm", "model", "mistral")
+
+    assert await config_store.get_all() == {
+        "tts": {"speaker": "Aiden"},
+        "llm": {"model": "mistral"},
+    }
+
+
+async def test_get_returns_json_round_trip(config_store):
+    await config_store.set("plugin", "pair", (1, 2))
+    assert await config_store.get("plugin", "pair") == [1, 2]
+
+    await config_store.set_many([("plugin", "pair", (3, 4))])
+    assert await config_store.get("plugin", "pair") == [3, 4]
+    assert await config_store.get_section("plugin") == {"pair": [3, 4]}
+
+
+async def test_cached_values_are_not_shared(config_store):
+    value = {"a": [1]}
+    await config_store.set("plugin", "cfg", value)
+    value["a"].append(2)
+    assert await config_store.get("plugin", "cfg") == {"a": [1]}
+
+    (await config_store.get("plugin", "cfg"))["a"].append(99)
+    assert await config_store.get("plugin", "cfg") == {"a": [1]}
+
+    (await config_store.get_section("plugin"))["cfg"]["a"].append(99)
+    assert await config_store.get_section("plugin") == {"cfg": {"a": [1]}}
+
+
+async def test_stored_null_is_cached(config_store):
+    await config_store.set("plugin", "nothing", None)
+    config_store._cache.clear()
+    assert await config_store.get("plugin", "nothing", default=5) is None
+    assert config_store._cache[("plugin", "nothing")] == "null"
+
+
+async def test_set_many_and_delete_many(config_store):
+    await config_store.set_many([("tts", "speaker", "Aiden"), ("tts", "language", "English")])
+    assert await config_store.get_section("tts") == {"speaker": "Aiden", "language": "English"}
+
+    await config_store.delete_many([("tts", "speaker")])
+    assert await config_store.get("tts", "speaker") is None
+    assert await config_store.get_section("tts") == {"language": "English"}
+
+
+async def test_apply_sets_and_deletes_in_one_commit(config_store):
+    await config_store.set("tts", "speaker", "Aiden")
+
+    await config_store.apply([("tts", "language", "English")], [("tts", "speaker")])
+    assert await config_store.get_section("tts") == {"language": "English"}
+
+
+async def test_apply_rolls_back_on_failure(config_store):
+    await config_store.set("tts", "speaker", "Aiden")
+
+    with pytest.raises(sqlite3.Error):
+        # A bad delete after a good set leaves neither applied
+        await config_store.apply([("tts", "language", "English")], [("tts",)])
+
+    config_store._cache.clear()
+    config_store._section_cache.clear()
+    assert await config_store.get_section("tts") == {"speaker": "Aiden"}
+
+
+# =========================================================================
+# CONNECTIONS
+# =========================================================================
+
+
+async def test_file_db_reads_through_read_only_pool(tmp_path):
+    store = ConfigStore()
+    await store.open(tmp_path / "radiodan.db")
+    assert len(store._reader_conns) > 0
+
+    await store.create_instance("chill-dj", "presenter", "Chill DJ", {"style": "calm"})
+    assert (await store.get_instance("chill-dj"))["config"] == {"style": "calm"}
+    assert [i["id"] for i in await store.list_instances()] == ["chill-dj"]
+
+    with pytest.raises(sqlite3.OperationalError):
+        async with store._reader() as db:
+            await db.execute("DELETE FROM plugin_instances")
+    await store.close()
+
+
+async def test_concurrent_read_does_not_overwrite_newer_write(tmp_path):
+    store = ConfigStore()
+    await store.open(tmp_path / "radiodan.db")
+    try:
+        await store.set("audio", "music_vol", -1)
+        for i in range(50):
+            # Cold caches, so the reads below go to a reader connection
+            store._cache.clear()
+            store._section_cache.clear()
+            await asyncio.gather(
+                store.get("audio", "music_vol"),
+                store.get_section("audio"),
+                store.set("audio", "music_vol", i),
+            )
+            assert await store.get("audio", "music_vol") == i
+            assert await store.get_section("audio") == {"music_vol": i}
+    finally:
+        await store.close()
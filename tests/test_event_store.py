@@ -1,13 +1,16 @@
 """Tests for EventStore — CRUD, window queries, pub/sub, edge cases."""
 
 import asyncio
+import gc
 import json
+import sqlite3
 import time
 from pathlib import Path
 
+import aiosqlite
 import pytest
 
-from bridge.event_store import EventStore
+from bridge.event_store import _WINDOW_SQL, EventStore, EventSubscription, _decode_detail
 
 
 # =========================================================================
@@ -45,9 +48,12 @@ async def test_start_event_with_details(event_store):
     )
 
     async with event_store._db.execute(
-        "SELECT key, value FROM event_detail WHERE event_id = ?", (eid,)
+        "SELECT key, value, value_type FROM event_detail WHERE event_id = ?", (eid,)
     ) as cursor:
-        rows = {row["key"]: json.loads(row["value"]) async for row in cursor}
+        rows = {
+            row["key"]: _decode_detail(row["value"], row["value_type"])
+            async for row in cursor
+        }
 
     assert rows["filename"] == "/music/song.mp3"
     assert rows["artist"] == "DJ Test"
@@ -96,9 +102,12 @@ async def test_end_event_with_extra_details(event_store):
     await event_store.end_event(eid, extra_details={"size_bytes": 44100})
 
     async with event_store._db.execute(
-        "SELECT key, value FROM event_detail WHERE event_id = ?", (eid,)
+        "SELECT key, value, value_type FROM event_detail WHERE event_id = ?", (eid,)
     ) as cursor:
-        rows = {row["key"]: json.loads(row["value"]) async for row in cursor}
+        rows = {
+            row["key"]: _decode_detail(row["value"], row["value_type"])
+            async for row in cursor
+        }
 
     assert rows["text"] == "hello"
     assert rows["size_bytes"] == 44100
@@ -113,12 +122,57 @@ async def test_end_event_upserts_existing_detail_key(event_store):
     await event_store.end_event(eid, extra_details={"status_note": "done"})
 
     async with event_store._db.execute(
-        "SELECT value FROM event_detail WHERE event_id = ? AND key = ?",
+        "SELECT value, value_type FROM event_detail WHERE event_id = ? AND key = ?",
         (eid, "status_note"),
     ) as cursor:
         row = await cursor.fetchone()
 
-    assert json.loads(row["value"]) == "done"
+    assert _decode_detail(row["value"], row["value_type"]) == "done"
+
+
+async def test_detail_values_round_trip_types(event_store):
+    details = {
+        "filename": "/music/song.mp3",
+        "z_stagger": 1,
+        "duration": 183.5,
+        "starred": True,
+        "tags": ["ambient", "chill"],
+        "meta": {"bpm": 90},
+        "empty": None,
+    }
+    await event_store.start_event(
+        "track_play", "music", "Song", details=details, started_at=100.0,
+    )
+
+    result = await event_store.get_window(50.0, 150.0)
+    assert result[0]["details"] == details
+    assert type(result[0]["details"]["z_stagger"]) is int
+    assert type(result[0]["details"]["starred"]) is bool
+
+
+async def test_open_migrates_legacy_detail_table(tmp_path):
+    """Databases without value_type get the column; old rows decode as JSON."""
+    db_path = tmp_path / "legacy.db"
+    async with aiosqlite.connect(db_path) as db:
+        await db.executescript(
+            "CREATE TABLE event_log (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "event_type TEXT NOT NULL, lane TEXT NOT NULL, title TEXT NOT NULL, "
+            "started_at REAL NOT NULL, ended_at REAL, status TEXT DEFAULT 'active', "
+            "created_at REAL NOT NULL);"
+            "CREATE TABLE event_detail (event_id INTEGER NOT NULL, key TEXT NOT NULL, "
+            "value TEXT, PRIMARY KEY (event_id, key));"
+            "INSERT INTO event_log VALUES (1, 'track_play', 'music', 'Old', 100.0, 200.0, "
+            "'completed', 100.0);"
+            "INSERT INTO event_detail VALUES (1, 'filename', '\"/music/old.mp3\"');"
+        )
+        await db.commit()
+
+    store = EventStore(db_path=db_path)
+    await store.open()
+    assert await store.get_last_music_filename() == "/music/old.mp3"
+    result = await store.get_window(0.0, 300.0)
+    assert result[0]["details"] == {"filename": "/music/old.mp3"}
+    await store.close()
 
 
 # =========================================================================
@@ -189,6 +243,45 @@ async def test_update_event_no_valid_fields_is_noop(event_store):
     assert queue.empty()
 
 
+# =========================================================================
+# LAST MUSIC EVENT
+# =========================================================================
+
+
+async def test_last_music_tracks_latest_music_event(event_store):
+    assert await event_store.get_last_music_filename() is None
+    assert await event_store.get_last_music_event_id() is None
+
+    await event_store.start_event(
+        "track_play", "music", "One", details={"filename": "/music/one.mp3"},
+    )
+    eid = await event_store.start_event(
+        "track_play", "music", "Two", details={"filename": "/music/two.mp3"},
+    )
+    # Non-music events don't affect the cache
+    await event_store.start_event("tts_generate", "system", "TTS")
+
+    assert await event_store.get_last_music_filename() == "/music/two.mp3"
+    assert await event_store.get_last_music_event_id() == eid
+
+
+async def test_last_music_recovered_on_open(tmp_path):
+    store = EventStore(db_path=tmp_path / "events.db")
+    await store.open()
+    eid = await store.start_event(
+        "track_play", "music", "Song",
+        details={"filename": "/music/song.mp3", "z_stagger": 1},
+    )
+    await store.close()
+
+    reopened = EventStore(db_path=tmp_path / "events.db")
+    await reopened.open()
+    assert await reopened.get_last_music_filename() == "/music/song.mp3"
+    assert await reopened.get_last_music_event_id() == eid
+    assert reopened.last_music_z_stagger == 1
+    await reopened.close()
+
+
 # =========================================================================
 # WINDOW QUERIES
 # =========================================================================
@@ -201,6 +294,7 @@ async def _seed_events(store, events):
     optionally ended_at, status, details.
     """
     ids = []
+    ends = []
     for e in events:
         eid = await store.start_event(
             e["event_type"], e["lane"], e["title"],
@@ -209,14 +303,16 @@ async def _seed_events(store, events):
             details=e.get("details"),
         )
         if "ended_at" in e:
-            # Use raw SQL to set ended_at precisely (end_event uses time.time())
-            async with store._lock:
-                await store._db.execute(
-                    "UPDATE event_log SET ended_at = ?, status = ? WHERE id = ?",
-                    (e["ended_at"], e.get("final_status", "completed"), eid),
-                )
-                await store._db.commit()
+            ends.append((e["ended_at"], e.get("final_status", "completed"), eid))
         ids.append(eid)
+    if ends:
+        # Use raw SQL to set ended_at precisely (end_event uses time.time()),
+        # all rows in one statement batch and commit
+        async with store._lock:
+            await store._db.executemany(
+                "UPDATE event_log SET ended_at = ?, status = ? WHERE id = ?", ends,
+            )
+            await store._db.commit()
     return ids
 
 
@@ -327,6 +423,15 @@ async def test_window_includes_batch_loaded_details(event_store):
     assert result[0]["details"]["filename"] == "song.mp3"
 
 
+async def test_window_query_uses_window_index(event_store):
+    async with event_store._db.execute(
+        "EXPLAIN QUERY PLAN " + _WINDOW_SQL + " ORDER BY started_at", (250.0, 50.0),
+    ) as cur:
+        plan = " ".join(row[3] for row in await cur.fetchall())
+    assert "idx_event_log_window" in plan
+    assert "TEMP B-TREE" not in plan
+
+
 async def test_window_ordered_by_started_at(event_store):
     await _seed_events(event_store, [
         {"event_type": "a", "lane": "music", "title": "Third",
@@ -341,6 +446,26 @@ async def test_window_ordered_by_started_at(event_store):
     assert titles == ["First", "Second", "Third"]
 
 
+async def test_window_reads_committed_writes_on_file_db(tmp_path):
+    """File-backed stores query through reader connections that see writes."""
+    store = EventStore(db_path=tmp_path / "events.db")
+    await store.open()
+    assert len(store._reader_conns) > 0
+
+    await store.start_event(
+        "track_play", "music", "Song", started_at=100.0, details={"artist": "A"},
+    )
+    result = await store.get_window(50.0, 150.0)
+    assert [e["title"] for e in result] == ["Song"]
+    assert result[0]["details"] == {"artist": "A"}
+
+    # Readers are query_only
+    with pytest.raises(sqlite3.OperationalError):
+        async with store._reader() as db:
+            await db.execute("DELETE FROM event_log")
+    await store.close()
+
+
 async def test_window_empty_result(event_store):
     result = await event_store.get_window(100.0, 200.0)
     assert result == []
@@ -351,16 +476,17 @@ async def test_window_empty_result(event_store):
 # =========================================================================
 
 
-async def test_subscribe_returns_queue(event_store):
+async def test_subscribe_returns_subscription(event_store):
     queue = event_store.subscribe()
-    assert isinstance(queue, asyncio.Queue)
+    assert isinstance(queue, EventSubscription)
+    assert queue.empty()
 
 
 async def test_start_event_publishes(event_store):
     queue = event_store.subscribe()
     eid = await event_store.start_event("track_play", "music", "Song")
 
-    msg = await asyncio.wait_for(queue.get(), timeout=1.0)
+    msg = json.loads(await asyncio.wait_for(queue.get(), timeout=1.0))
     assert msg["action"] == "start"
     assert msg["event"]["id"] == eid
     assert msg["event"]["event_type"] == "track_play"
@@ -371,7 +497,7 @@ async def test_end_event_publishes(event_store):
     queue = event_store.subscribe()
 
     await event_store.end_event(eid)
-    msg = await asyncio.wait_for(queue.get(), timeout=1.0)
+    msg = json.loads(await asyncio.wait_for(queue.get(), timeout=1.0))
     assert msg["action"] == "end"
     assert msg["event"]["id"] == eid
     assert msg["event"]["status"] == "completed"
@@ -382,7 +508,7 @@ async def test_update_event_publishes(event_store):
     queue = event_store.subscribe()
 
     await event_store.update_event(eid, title="New")
-    msg = await asyncio.wait_for(queue.get(), timeout=1.0)
+    msg = json.loads(await asyncio.wait_for(queue.get(), timeout=1.0))
     assert msg["action"] == "update"
     assert msg["event"]["id"] == eid
     assert msg["event"]["title"] == "New"
@@ -396,8 +522,9 @@ async def test_multiple_subscribers_all_receive(event_store):
 
     msg1 = await asyncio.wait_for(q1.get(), timeout=1.0)
     msg2 = await asyncio.wait_for(q2.get(), timeout=1.0)
-    assert msg1["action"] == "start"
-    assert msg2["action"] == "start"
+    assert json.loads(msg1)["action"] == "start"
+    # Subscribers share the same encoded payload
+    assert msg1 is msg2
 
 
 async def test_unsubscribe_stops_delivery(event_store):
@@ -409,9 +536,49 @@ async def test_unsubscribe_stops_delivery(event_store):
 
 
 async def test_unsubscribe_nonexistent_is_safe(event_store):
-    """Unsubscribing a queue that was never subscribed should not error."""
-    rogue_queue = asyncio.Queue()
-    event_store.unsubscribe(rogue_queue)  # Should not raise
+    """Unsubscribing a subscription that was never registered should not error."""
+    rogue = EventSubscription(event_store)
+    event_store.unsubscribe(rogue)  # Should not raise
+
+
+async def test_get_batch_drains_burst(event_store):
+    """A burst of publishes is delivered to a subscriber in one batch."""
+    queue = event_store.subscribe()
+    for i in range(3):
+        await event_store.start_event("burst", "test", f"Event {i}")
+
+    batch = await asyncio.wait_for(queue.get_batch(), timeout=1.0)
+    assert [json.loads(m)["event"]["title"] for m in batch] == [
+        "Event 0", "Event 1", "Event 2",
+    ]
+    assert queue.empty()
+
+
+async def test_get_batch_waits_for_publish(event_store):
+    queue = event_store.subscribe()
+    waiter = asyncio.create_task(queue.get_batch())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await event_store.start_event("track_play", "music", "Song")
+    batch = await asyncio.wait_for(waiter, timeout=1.0)
+    assert len(batch) == 1
+
+
+async def test_late_subscriber_skips_earlier_messages(event_store):
+    await event_store.start_event("track_play", "music", "Before")
+    queue = event_store.subscribe()
+    assert queue.empty()
+
+
+async def test_abandoned_subscriber_is_released(event_store):
+    """A queue dropped without unsubscribe() should not linger."""
+    queue = event_store.subscribe()
+    assert len(event_store._subscribers) == 1
+
+    del queue
+    gc.collect()
+    assert len(event_store._subscribers) == 0
 
 
 async def test_backpressure_drops_oldest(event_store):
@@ -431,7 +598,7 @@ async def test_backpressure_drops_oldest(event_store):
     assert queue.qsize() == 256
 
     # The first message should have been dropped — first available should be Event 1
-    msg = await queue.get()
+    msg = json.loads(await queue.get())
     assert msg["event"]["title"] == "Event 1"
 
 
@@ -104,3 +104,127 @@ async def test_stream_context_poll_creates_track_play_event(event_store):
 
 # Need time for the e2e test
 import time
+
+
+async def test_llm_api_error_ends_event_failed(event_store, aiohttp_client):
+    """A non-200 reply marks the llm_request event failed, not left active."""
+    from aiohttp import web
+
+    from bridge.services import instrumentation
+    from bridge.services.llm_service import LLMService
+
+    async def _error(request):
+        return web.Response(status=500, text="boom")
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", _error)
+    client = await aiohttp_client(app)
+
+    llm = LLMService(endpoint=str(client.make_url("/v1/chat/completions")), model="m")
+    llm.set_event_store(event_store)
+    with patch("bridge.services.llm_service.booth"), pytest.raises(RuntimeError):
+        await llm.chat("hello")
+    await llm.stop()
+    await instrumentation.drain()
+
+    events = await event_store.get_window(0.0, time.time() + 100)
+    assert [(e["event_type"], e["status"]) for e in events] == [("llm_request", "failed")]
+
+
+async def test_drain_waits_for_pending_writes(event_store):
+    from bridge.services import instrumentation
+
+    start = instrumentation.start_event(event_store, event_type="tts_generate", lane="system", title="TTS")
+    instrumentation.end_event(event_store, start, status="completed")
+    await instrumentation.drain()
+
+    assert not instrumentation._pending
+    events = await event_store.get_window(0.0, time.time() + 100)
+    assert events[0]["status"] == "completed"
+
+
+@pytest.mark.parametrize("service", ["llm", "tts"])
+async def test_cancelled_request_ends_event_cancelled(event_store, aiohttp_client, tmp_path, service):
+    """Cancelling chat()/speak() mid-request does not leave the event active."""
+    from aiohttp import web
+
+    from bridge.services import instrumentation
+    from bridge.services.llm_service import LLMService
+    from bridge.services.tts_service import TTSService
+
+    received = asyncio.Event()
+
+    async def _hang(request):
+        received.set()
+        await asyncio.sleep(30)
+        return web.Response(status=200)
+
+    app = web.Application()
+    app.router.add_post("/api", _hang)
+    client = await aiohttp_client(app)
+    url = str(client.make_url("/api"))
+
+    if service == "llm":
+        svc = LLMService(endpoint=url, model="m")
+        call = svc.chat("hello")
+    else:
+        svc = TTSService(endpoint=url, cache_dir=tmp_path)
+        call = svc.speak("hello")
+    svc.set_event_store(event_store)
+
+    with patch(f"bridge.services.{service}_service.booth"):
+        task = asyncio.create_task(call)
+        await asyncio.wait_for(received.wait(), 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    await svc.stop()
+    await instrumentation.drain()
+
+    events = await event_store.get_window(0.0, time.time() + 100)
+    assert [e["status"] for e in events] == ["cancelled"]
+
+
+async def test_presenter_track_change_leaves_no_active_llm_event(event_store, aiohttp_client):
+    """A track change that drops the pending outro ends its llm_request event."""
+    from aiohttp import web
+
+    from bridge.plugins.base import PluginContext, SharedPluginServices
+    from bridge.plugins.presenter import PresenterPlugin
+    from bridge.services import instrumentation
+    from bridge.services.llm_service import LLMService
+
+    received = asyncio.Event()
+
+    async def _hang(request):
+        received.set()
+        await asyncio.sleep(30)
+        return web.Response(status=200)
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", _hang)
+    client = await aiohttp_client(app)
+
+    llm = LLMService(endpoint=str(client.make_url("/v1/chat/completions")), model="m")
+    llm.set_event_store(event_store)
+    services = SharedPluginServices(
+        tts_service=MagicMock(), mixer=MagicMock(), llm_service=llm,
+        stream_context=MagicMock(), voice_scheduler=MagicMock(),
+    )
+    presenter = PresenterPlugin(PluginContext(services=services, config={"styles": ["outro"]}))
+
+    with patch("bridge.services.llm_service.booth"), patch("bridge.plugins.base.booth"):
+        await presenter.start()
+        await presenter._on_track_changed({"artist": "A", "title": "One"})
+        outro = presenter._pending_outro_task
+        await asyncio.wait_for(received.wait(), 5)
+
+        await presenter._on_track_changed({"artist": "B", "title": "Two"})
+        with pytest.raises(asyncio.CancelledError):
+            await outro
+        await presenter.stop()
+    await llm.stop()
+    await instrumentation.drain()
+
+    events = await event_store.get_window(0.0, time.time() + 100)
+    assert events and all(e["status"] != "active" for e in events)
@@ -0,0 +1,37 @@
+"""Tests for LLMCache — exact-match reply cache."""
+
+from bridge.services.llm_cache import LLMCache
+
+
+def test_key_depends_on_every_part():
+    base = LLMCache.key("m", "sys", "hello")
+    assert base == LLMCache.key("m", "sys", "hello")
+    assert base != LLMCache.key("m2", "sys", "hello")
+    assert base != LLMCache.key("m", "sys2", "hello")
+    assert base != LLMCache.key("m", "sys", "hello!")
+
+
+def test_get_returns_stored_reply():
+    cache = LLMCache()
+    cache.put("k", "reply")
+    assert cache.get("k") == "reply"
+    assert cache.get("missing") is None
+
+
+def test_expired_entries_are_dropped():
+    cache = LLMCache(ttl=0)
+    cache.put("k", "reply")
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_is_evicted():
+    cache = LLMCache(max_entries=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")  # a is now most recent
+    cache.put("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
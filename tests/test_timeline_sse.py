@@ -76,6 +76,26 @@ async def test_live_event_update_streamed(client, event_store):
     resp.close()
 
 
+async def test_playback_state_refresh_shared_by_clients(client, monkeypatch):
+    """All connected clients get the periodic playback_state from one ticker."""
+    from bridge.web.routes import timeline
+
+    monkeypatch.setattr(timeline, "_PLAYBACK_STATE_INTERVAL", 0.1)
+    c = await client
+    first = await c.get("/api/timeline/events")
+    second = await c.get("/api/timeline/events")
+
+    for resp in (first, second):
+        frames = await read_sse_frames(resp, count=3)
+        assert frames[2]["event"] == "playback_state"
+    assert len(timeline._PlaybackTicker._active) == 1
+
+    first.close()
+    second.close()
+    await asyncio.sleep(0.1)
+    assert timeline._PlaybackTicker._active == {}
+
+
 async def test_correct_sse_headers(client):
     """SSE response should have correct Content-Type and Cache-Control."""
     c = await client